@@ -0,0 +1,18 @@
+"""
+Asset build: every derived asset (compressed videos and photos, srcset
+variants, pre-compressed text, the cold-start cache) for each target
+
+    python -m asset_build web              # before serving main_web.py
+    python -m asset_build apk              # build/apk/assets for buildozer
+    python -m asset_build kiosk --dry-run  # what would run, nothing written
+    python -m asset_build web --jobs 4 --report build/web.json
+
+Profiles (profiles.py) declare the steps and their settings; every step is
+a set of encoder jobs run in parallel with a content-addressed cache
+(pipeline.py), so only stale outputs are rebuilt. Each build writes a JSON
+report with sizes, video bitrates, timings and tool versions
+(build/asset_build_<profile>.json).
+"""
+from .build import build, plan, profile_jobs, variant_name
+from .pipeline import BuildCache, Job, job_status, run
+from .profiles import PROFILES, VARIANT_WIDTHS
@@ -0,0 +1,23 @@
+import argparse
+import sys
+
+from . import PROFILES, build, plan
+from .build import print_plan
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m asset_build', description='Build the derived assets for a target')
+    parser.add_argument('profile', choices=list(PROFILES))
+    parser.add_argument('--dry-run', action='store_true', help='list the stale steps, write nothing')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: ASSET_JOBS or one per CPU)')
+    parser.add_argument('--report', help='JSON report path (default: build/asset_build_<profile>.json)')
+    args = parser.parse_args()
+    if args.dry_run:
+        print_plan(args.profile, plan(args.profile))
+        return 0
+    report = build(args.profile, workers=args.jobs, report_path=args.report)
+    return 1 if any(step.get('failed') for step in report['steps'].values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
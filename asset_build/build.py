@@ -0,0 +1,233 @@
+"""
+Profile -> jobs -> pipeline: the dry-run planner and the build with its
+JSON report (sizes, video bitrates, timings, tool versions)
+"""
+import json
+import platform
+import time
+from pathlib import Path
+
+from PIL import Image
+
+import compression
+from asset_manifest import LISTEN_FOLDER
+from . import spectrogram
+from .encoders import (encode_audio, encode_image, encode_playhead, encode_rendition, encode_spectrogram_video,
+                       encode_still, encode_text, encode_video, ffmpeg_version)
+from .pipeline import BuildCache, Job, default_workers, job_status, run, summary
+from .probe import bitrate_kbps
+from .profiles import PROFILES
+from .streams import stream_dir, write_playlists
+
+ROOT = Path(__file__).resolve().parent.parent
+ASSETS_DIR = ROOT / 'assets'
+RECORDINGS_DIR = ROOT / 'recordings'   # raw frog calls, recordings/XYZ.wav -> XYZ_resized.mp4
+VIDEO_PATTERN = '*_resized.mp4'
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg')
+STEPS = ('spectrograms', 'videos', 'images', 'renditions', 'listen', 'variants', 'text')   # in build order, then the manifest
+FFMPEG_STEPS = ('spectrograms', 'videos', 'renditions', 'listen')
+
+
+def variant_name(image_name, width, image_format):
+    """Variant file name, e.g. GGF.png at 250px as WebP -> GGF.w250.webp"""
+    return f"{Path(image_name).stem}.w{width}.{image_format}"
+
+
+def output_dir(profile, assets_dir=ASSETS_DIR) -> Path:
+    return assets_dir if profile['output'] is None else ROOT / profile['output']
+
+
+def spectrogram_jobs(assets_dir, output, settings, recordings_dir=RECORDINGS_DIR):
+    """A spectrogram video for every recording, named like the catalog expects (frog_catalog._frog)"""
+    return [Job(encode_spectrogram_video, path, output / f'{path.stem}_resized.mp4', **settings)
+            for path in sorted(recordings_dir.glob('*')) if path.suffix.lower() in spectrogram.AUDIO_SUFFIXES]
+
+
+def video_jobs(assets_dir, output, settings):
+    return [Job(encode_video, path, output / path.name, **settings)
+            for path in sorted(assets_dir.glob(VIDEO_PATTERN))]
+
+
+def image_jobs(assets_dir, output, settings):
+    return [Job(encode_image, path, output / path.name, **settings)
+            for path in sorted(assets_dir.iterdir()) if path.suffix.lower() in IMAGE_SUFFIXES]
+
+
+def rendition_jobs(assets_dir, output, settings):
+    """One fragmented MP4 per video and rung: streams/<video stem>/<height>p.mp4"""
+    return [Job(encode_rendition, path, stream_dir(output, path.name) / f'{height}p.mp4', height=height,
+                video_bitrate=video_bitrate, audio_bitrate=audio_bitrate,
+                segment_seconds=settings['segment_seconds'], buffer_seconds=settings['buffer_seconds'],
+                preset=settings['preset'])
+            for path in sorted(assets_dir.glob(VIDEO_PATTERN))
+            for height, video_bitrate, audio_bitrate in settings['ladder']]
+
+
+def listen_jobs(assets_dir, output, settings):
+    """listen/<video stem>: the audio in each format, the still spectrogram and its playhead timing"""
+    jobs = []
+    for path in sorted(assets_dir.glob(VIDEO_PATTERN)):
+        folder = output / LISTEN_FOLDER
+        jobs += [Job(encode_audio, path, folder / f'{path.stem}.{audio_format}', bitrate=bitrate)
+                 for audio_format, bitrate in settings['audio'].items()]
+        jobs.append(Job(encode_still, path, folder / f'{path.stem}.webp', **settings['image']))
+        jobs.append(Job(encode_playhead, path, folder / f'{path.stem}.json'))
+    return jobs
+
+
+def variant_jobs(assets_dir, output, settings):
+    """srcset variants of every PNG, never upscaled past the original"""
+    jobs = []
+    for path in sorted(assets_dir.glob('*.png')):
+        with Image.open(path) as img:
+            original_width = img.width
+        for image_format, widths in settings['widths'].items():
+            for width in widths:
+                if width <= original_width:
+                    jobs.append(Job(encode_image, path, output / 'variants' / variant_name(path.name, width, image_format),
+                                    quality=settings['quality'], max_dimension=width))
+    return jobs
+
+
+def text_jobs(assets_dir, output, settings):
+    """.br / .gz siblings of the text assets (.br only with the brotli package)"""
+    jobs = []
+    for path in sorted(assets_dir.rglob('*')):
+        if (not path.is_file() or path.suffix not in compression.TEXT_SUFFIXES or path.name.startswith('.')
+                or path.stat().st_size < compression.MINIMUM_SIZE):
+            continue
+        for encoding, level in settings['encodings'].items():
+            if encoding == 'br' and compression.brotli is None:
+                continue
+            sibling = output / path.relative_to(assets_dir)
+            sibling = sibling.with_name(sibling.name + compression.SIBLING_SUFFIXES[encoding])
+            jobs.append(Job(encode_text, path, sibling, encoding=encoding, level=level))
+    return jobs
+
+
+STEP_JOBS = {'spectrograms': spectrogram_jobs, 'videos': video_jobs, 'images': image_jobs, 'renditions': rendition_jobs, 'listen': listen_jobs,
+             'variants': variant_jobs, 'text': text_jobs}
+
+
+def step_jobs(name, step, assets_dir=ASSETS_DIR):
+    profile = PROFILES[name]
+    return STEP_JOBS[step](assets_dir, output_dir(profile, assets_dir), profile[step])
+
+
+def profile_jobs(name, assets_dir=ASSETS_DIR):
+    """{step: [Job]} for the steps a profile runs, from the files there are now"""
+    return {step: step_jobs(name, step, assets_dir) for step in STEPS if PROFILES[name][step] is not None}
+
+
+def manifest_is_current():
+    """build/asset_manifest.json and build/coldstart.json match the assets"""
+    from coldstart import load_cache
+    return load_cache() is not None
+
+
+def plan(name, assets_dir=ASSETS_DIR, cache=None):
+    """{step: [(job, status)]} without running anything, plus 'manifest': status"""
+    cache = BuildCache() if cache is None else cache
+    steps = {step: [(job, job_status(job, cache)[0]) for job in jobs]
+             for step, jobs in profile_jobs(name, assets_dir).items()}
+    if PROFILES[name]['manifest']:
+        changes = any(status != 'up to date' for jobs in steps.values() for _, status in jobs)
+        steps['manifest'] = 'stale' if changes or not manifest_is_current() else 'up to date'
+    return steps
+
+
+def print_plan(name, steps):
+    print(f"📋 {name}: dry run")
+    for step, jobs in steps.items():
+        if step == 'manifest':
+            print(f"  manifest: {jobs}")
+            continue
+        counts = {}
+        for _, status in jobs:
+            counts[status] = counts.get(status, 0) + 1
+        print(f"  {step}: " + (', '.join(f'{count} {status}' for status, count in counts.items()) or 'nothing to do'))
+        for job, status in jobs:
+            if status != 'up to date':
+                print(f"    {status:<7} {job.source.name} -> {relative(job.output)}")
+
+
+def relative(path):
+    path = Path(path)
+    return str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+
+
+def build(name, assets_dir=ASSETS_DIR, workers=None, report_path=None):
+    """Run a profile's stale steps; returns the report (also written to report_path)"""
+    profile = PROFILES[name]
+    workers = workers or default_workers()
+    cache = BuildCache()
+    ffmpeg = ffmpeg_version()
+    report = {
+        'profile': name,
+        'settings': profile,
+        'workers': workers,
+        'versions': {'python': platform.python_version(), 'pillow': Image.__version__, 'ffmpeg': ffmpeg,
+                     'numpy': spectrogram.np.__version__ if spectrogram.np is not None else None,
+                     'brotli': compression.brotli is not None},
+        'steps': {},
+    }
+    start = time.perf_counter()
+    for step in STEPS:
+        if profile[step] is None:
+            continue
+        # listed when the step starts: earlier steps may have added sources (spectrogram videos)
+        jobs = step_jobs(name, step, assets_dir)
+        missing = 'ffmpeg' if step in FFMPEG_STEPS and ffmpeg is None else None
+        if step == 'spectrograms' and spectrogram.np is None:
+            missing = 'numpy'
+        if missing and jobs:
+            print(f"⚠️  {missing} not found: skipping {step}")
+            report['steps'][step] = {'skipped': f'{missing} not found', 'jobs': len(jobs)}
+            continue
+        if not jobs:
+            print(f"\n🔧 {step}: nothing to do")
+            report['steps'][step] = {'seconds': 0.0, 'before': 0, 'after': 0, 'failed': 0, 'jobs': []}
+            continue
+        print(f"\n🔧 {step}: {len(jobs)} job(s)")
+        step_start = time.perf_counter()
+        results = run(jobs, cache=cache, workers=workers)
+        seconds = time.perf_counter() - step_start
+        summary(results, seconds, workers)
+        for result in results:
+            if result['output'].endswith('.mp4'):
+                result['before_kbps'] = bitrate_kbps(result['source']) if result['source'].endswith('.mp4') else None
+                result['after_kbps'] = bitrate_kbps(result['output']) if result['status'] != 'failed' else None
+            result['source'] = relative(result['source'])
+            result['output'] = relative(result['output'])
+        report['steps'][step] = {
+            'seconds': round(seconds, 3),
+            'before': sum(result['before'] for result in results),
+            'after': sum(result['after'] or 0 for result in results),
+            'failed': sum(1 for result in results if result['status'] == 'failed'),
+            'jobs': results,
+        }
+        if step == 'renditions':
+            folders = sorted({Path(job.output).parent for job in jobs})
+            playlists = [path for folder in folders if folder.is_dir() for path in write_playlists(folder)]
+            report['steps'][step]['playlists'] = [relative(path) for path in playlists]
+            for path in playlists:
+                print(f"✓ {relative(path)}")
+
+    if profile['manifest']:
+        step_start = time.perf_counter()
+        if manifest_is_current():
+            report['steps']['manifest'] = {'status': 'up to date', 'seconds': 0.0}
+        else:
+            from coldstart import build as build_coldstart
+            print("\n🔧 manifest")
+            build_coldstart()
+            report['steps']['manifest'] = {'status': 'built', 'seconds': round(time.perf_counter() - step_start, 3)}
+
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    report_path = Path(report_path) if report_path else ROOT / 'build' / f'asset_build_{name}.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2, default=list))
+    failed = sum(step.get('failed', 0) for step in report['steps'].values())
+    print(f"\n{'✓' if not failed else '✗'} {name} built in {report['seconds']:.2f}s"
+          f"{f', {failed} job(s) failed' if failed else ''}: report in {relative(report_path)}")
+    return report
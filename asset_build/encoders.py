@@ -0,0 +1,274 @@
+"""
+Encoders: encoder(source, output, **settings) -> bool
+Each writes one output file (its format from the output suffix) and prints
+what went wrong; the pipeline captures the output of its worker processes.
+"""
+import io
+import json
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageChops
+
+from compression import compress
+from .probe import mp4_duration
+from . import spectrogram
+
+VIDEO_TIMEOUT = 600
+
+
+def ffmpeg_version():
+    """First line of ffmpeg -version, or None when ffmpeg is not installed"""
+    if shutil.which('ffmpeg') is None:
+        return None
+    try:
+        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.split('\n')[0] if result.returncode == 0 else None
+
+
+def encode_video(input_path, output_path, crf=28, preset='medium', audio='copy', max_height=None):
+    """
+    H.264 with the moov atom up front (+faststart)
+
+    Args:
+        crf: Constant Rate Factor (18-28 recommended, lower = better quality)
+        preset: x264 preset (ultrafast ... veryslow)
+        audio: 'copy' keeps the original track, else an AAC bitrate such as '64k'
+        max_height: scale down to this height (never up), None keeps the size
+    """
+    cmd = ['ffmpeg', '-v', 'error', '-i', str(input_path),
+           '-c:v', 'libx264', '-crf', str(crf), '-preset', preset, '-pix_fmt', 'yuv420p']
+    if max_height:
+        cmd += ['-vf', f'scale=-2:min({max_height}\\,ih)']
+    cmd += ['-c:a', 'copy'] if audio == 'copy' else ['-c:a', 'aac', '-b:a', audio]
+    cmd += ['-movflags', '+faststart', '-y', str(output_path)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=VIDEO_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        print(f"✗ Timeout after {VIDEO_TIMEOUT}s")
+        return False
+    if result.returncode != 0:
+        print(result.stderr[-500:])
+        return False
+    return True
+
+
+def encode_rendition(input_path, output_path, height=480, video_bitrate='400k', audio_bitrate='96k',
+                     segment_seconds=2, preset='slow', buffer_seconds=1):
+    """
+    One rung of an adaptive bitrate ladder: fragmented MP4 (one fragment
+    per keyframe) with a keyframe every segment_seconds exactly, so the
+    segments of every rung start at the same times and a player can switch
+    rungs between any two of them (see streams.py). A remainder shorter
+    than half a segment joins the last segment instead of starting with a
+    keyframe of its own.
+
+    Args:
+        video_bitrate: peak video bitrate (CRF 23, capped with maxrate over
+            a buffer of buffer_seconds, so every segment stays under it)
+        audio_bitrate: AAC bitrate for the frog call
+    """
+    peak = int(video_bitrate.rstrip('k')) * 1000
+    keyframes = f'gte(t,n_forced*{segment_seconds})'
+    duration = mp4_duration(input_path)
+    if duration:
+        keyframes += f'*lt(t,{duration - segment_seconds / 2:.3f})'
+    cmd = ['ffmpeg', '-v', 'error', '-i', str(input_path), '-map', '0:v:0', '-map', '0:a:0?',
+           '-vf', f'scale=-2:{height}', '-c:v', 'libx264', '-profile:v', 'main', '-preset', preset,
+           '-pix_fmt', 'yuv420p', '-crf', '23', '-maxrate', str(peak), '-bufsize', str(int(peak * buffer_seconds)),
+           '-force_key_frames', f'expr:{keyframes}', '-sc_threshold', '0',
+           '-c:a', 'aac', '-b:a', audio_bitrate, '-ac', '2',
+           '-movflags', '+frag_keyframe+empty_moov+default_base_moof', '-y', str(output_path)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=VIDEO_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        print(f"✗ Timeout after {VIDEO_TIMEOUT}s")
+        return False
+    if result.returncode != 0:
+        print(result.stderr[-500:])
+        return False
+    return True
+
+
+def encode_spectrogram_video(input_path, output_path, width=1920, height=720, fps=30, n_fft=2048,
+                             fmin=100, fmax=16000, dynamic_range=80, crf=23, audio_bitrate='128k'):
+    """
+    A frog call video from its recording, like the PASE ones: the
+    spectrogram (spectrogram.py) with a red playhead, and the call as AAC
+
+    Args:
+        width, height: frame size in pixels (even, for yuv420p)
+        n_fft: FFT size (frequency resolution: sample rate / n_fft Hz per bin)
+        fmin, fmax: log frequency axis in Hz
+        dynamic_range: dB from the loudest point to the bottom of the colormap
+    """
+    samples, sample_rate = spectrogram.load_audio(input_path)
+    rgb = spectrogram.render(samples, sample_rate, width, height, n_fft, fmin, fmax, dynamic_range)
+    cmd = ['ffmpeg', '-v', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+           '-r', str(fps), '-i', '-', '-i', str(input_path), '-map', '0:v', '-map', '1:a:0',
+           '-c:v', 'libx264', '-crf', str(crf), '-preset', 'medium', '-pix_fmt', 'yuv420p',
+           '-c:a', 'aac', '-b:a', audio_bitrate, '-shortest', '-movflags', '+faststart', '-y', str(output_path)]
+    # stderr goes to a file: an unread pipe fills up while we write frames and both sides block
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=stderr)
+        try:
+            for frame in spectrogram.frames(rgb, len(samples) / sample_rate, fps):
+                process.stdin.write(frame.data)
+            process.stdin.close()
+            returncode = process.wait(timeout=VIDEO_TIMEOUT)
+        except (BrokenPipeError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+            returncode = -1
+        if returncode != 0:
+            stderr.seek(0)
+            print(stderr.read().decode(errors='replace')[-500:] or "✗ ffmpeg failed")
+            return False
+    return True
+
+
+# --- Listen mode: audio, a still spectrogram and where its playhead runs ---
+AUDIO_CODECS = {'.ogg': 'libopus', '.m4a': 'aac'}
+
+
+def encode_audio(input_path, output_path, bitrate='32k'):
+    """The frog call alone, mono: Opus (.ogg) or AAC (.m4a) from the output suffix"""
+    suffix = Path(output_path).suffix.lower()
+    cmd = ['ffmpeg', '-v', 'error', '-i', str(input_path), '-vn', '-ac', '1',
+           '-c:a', AUDIO_CODECS[suffix], '-b:a', bitrate]
+    if suffix == '.m4a':
+        cmd += ['-movflags', '+faststart']
+    cmd += ['-y', str(output_path)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=VIDEO_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        print(f"✗ Timeout after {VIDEO_TIMEOUT}s")
+        return False
+    if result.returncode != 0:
+        print(result.stderr[-500:])
+        return False
+    return True
+
+
+def video_frames(input_path, fractions):
+    """RGB frames at these fractions of the duration, None when ffmpeg fails"""
+    duration = mp4_duration(input_path)
+    if not duration:
+        print(f"✗ {Path(input_path).name}: unknown duration")
+        return None
+    frames = []
+    for fraction in fractions:
+        cmd = ['ffmpeg', '-v', 'error', '-ss', f'{duration * fraction:.3f}', '-i', str(input_path),
+               '-frames:v', '1', '-f', 'image2pipe', '-c:v', 'png', '-']
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=VIDEO_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            print(f"✗ Timeout after {VIDEO_TIMEOUT}s")
+            return None
+        if result.returncode != 0 or not result.stdout:
+            print(result.stderr.decode(errors='replace')[-500:])
+            return None
+        frames.append(Image.open(io.BytesIO(result.stdout)).convert('RGB'))
+    return frames
+
+
+def playhead(frame):
+    """(x, top, bottom) of the red playhead line as fractions of the frame, None if there is none"""
+    red, green, blue = frame.split()
+    mask = ImageChops.multiply(ImageChops.multiply(red.point(lambda v: 255 if v > 170 else 0),
+                                                   green.point(lambda v: 255 if v < 90 else 0)),
+                               blue.point(lambda v: 255 if v < 90 else 0))
+    columns = mask.resize((mask.width, 1), Image.Resampling.BOX).tobytes()
+    x = max(range(len(columns)), key=columns.__getitem__)
+    rows = [y for y, value in enumerate(mask.crop((x, 0, x + 1, mask.height)).tobytes()) if value]
+    if columns[x] < 64 or not rows:
+        return None
+    return x / mask.width, rows[0] / mask.height, rows[-1] / mask.height
+
+
+def encode_playhead(input_path, output_path):
+    """
+    JSON with where the playhead of the video runs over the spectrogram:
+    start / end (x at 0s and at the end), top / bottom, all fractions of
+    the frame, so the page can draw it over the still image
+    """
+    fractions = (0.1, 0.9)
+    frames = video_frames(input_path, fractions)
+    if frames is None:
+        return False
+    found = [playhead(frame) for frame in frames]
+    if None in found:
+        print(f"✗ {Path(input_path).name}: no playhead found")
+        return False
+    (x1, top, bottom), (x2, _, _) = found
+    slope = (x2 - x1) / (fractions[1] - fractions[0])   # per duration
+    timing = {'duration': round(mp4_duration(input_path), 3),
+              'start': round(x1 - slope * fractions[0], 4), 'end': round(x1 + slope * (1 - fractions[0]), 4),
+              'top': round(top, 4), 'bottom': round(bottom, 4)}
+    Path(output_path).write_text(json.dumps(timing))
+    return True
+
+
+def encode_still(input_path, output_path, quality=75, max_dimension=1600):
+    """
+    The spectrogram without its playhead: per-pixel median of three frames
+    (the line is somewhere else in each), resized (never up) like encode_image
+    """
+    frames = video_frames(input_path, (0.1, 0.5, 0.9))
+    if frames is None:
+        return False
+    a, b, c = frames
+    img = ImageChops.lighter(ImageChops.darker(a, b), ImageChops.darker(ImageChops.lighter(a, b), c))
+    if img.width > max_dimension:
+        img = img.resize((max_dimension, round(img.height * max_dimension / img.width)), Image.Resampling.LANCZOS)
+    img.save(output_path, 'WEBP', quality=quality, method=6)
+    return True
+
+
+def encode_image(input_path, output_path, quality=85, max_dimension=1920):
+    """
+    Resize (never up) and re-encode one image
+
+    Args:
+        output_path: format from suffix: .png, .webp, .avif, otherwise JPEG
+        quality: JPEG/WebP/AVIF quality (1-100)
+        max_dimension: maximum width or height in pixels
+    """
+    with Image.open(input_path) as img:
+        img.load()
+    if img.width > max_dimension or img.height > max_dimension:
+        if img.width > img.height:
+            size = (max_dimension, int(img.height * (max_dimension / img.width)))
+        else:
+            size = (int(img.width * (max_dimension / img.height)), max_dimension)
+        img = img.resize(size, Image.Resampling.LANCZOS)
+
+    # Flatten transparency onto white
+    if img.mode in ('RGBA', 'LA', 'P'):
+        bg = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        bg.paste(img, mask=img.split()[-1])
+        img = bg
+
+    suffix = Path(output_path).suffix.lower()
+    if suffix == '.png':
+        img.save(output_path, 'PNG', optimize=True, compress_level=9)
+    elif suffix == '.webp':
+        # method=6 is the slowest, smallest WebP encoding
+        img.save(output_path, 'WEBP', quality=quality, method=6)
+    elif suffix == '.avif':
+        img.save(output_path, 'AVIF', quality=quality)
+    else:
+        img.save(output_path, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return True
+
+
+def encode_text(input_path, output_path, encoding='gzip', level=9):
+    """Pre-compressed sibling of a text asset (see compression.py)"""
+    Path(output_path).write_bytes(compress(Path(input_path).read_bytes(), encoding, level))
+    return True
@@ -0,0 +1,224 @@
+"""
+Parallel, incremental job runner
+Runs encoder jobs in a process pool (one worker per CPU) and keeps a
+content-addressed cache in build/asset_cache:
+
+- a job's key is a hash of the encoder, its settings and the input file's
+  bytes; the encoded file is stored under that key, so a rebuild only runs
+  jobs whose input or settings changed
+- input and output hashes are remembered by (size, mtime), so an unchanged
+  tree is not even re-read
+
+    job = Job(compress_image, src, out, quality=70, max_dimension=500)
+    job_status(job, BuildCache())   # 'up to date', 'cached' or 'stale'
+    results = run([job])
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / 'build' / 'asset_cache'
+HASH_CHUNK = 1024 * 1024
+
+
+class Job:
+    """encoder(source, output, **settings) -> bool, see encoders.py"""
+
+    def __init__(self, encoder, source, output, **settings):
+        self.encoder = encoder
+        self.source = Path(source)
+        self.output = Path(output)
+        self.settings = settings
+
+    @property
+    def recipe(self) -> str:
+        """Hash of what is done to the input (encoder, settings, output format)"""
+        spec = [self.encoder.__module__, self.encoder.__qualname__, sorted(self.settings.items()),
+                self.output.suffix.lower()]
+        return hashlib.sha256(json.dumps(spec, default=str).encode()).hexdigest()[:16]
+
+    def __repr__(self):
+        return f'Job({self.source.name} -> {self.output.name})'
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Encoded files by (recipe, input hash), with an index in index.json"""
+
+    def __init__(self, directory: Path = CACHE_DIR):
+        self.directory = Path(directory)
+        self.index_path = self.directory / 'index.json'
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            index = {}
+        self.hashes = index.get('hashes', {})     # path -> [size, mtime_ns, sha256]
+        self.objects = index.get('objects', {})   # key -> sha256 of the encoded file
+
+    def hash(self, path: Path) -> str:
+        """sha256 of a file, re-read only when its size or mtime changed"""
+        stat = path.stat()
+        name = str(path.resolve())
+        known = self.hashes.get(name)
+        if known and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return known[2]
+        digest = file_hash(path)
+        self.hashes[name] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def key(self, job: Job, source_hash: str) -> str:
+        return f'{job.recipe}-{source_hash[:32]}'
+
+    def path(self, key: str, suffix: str) -> Path:
+        return self.directory / 'objects' / key[:2] / f'{key}{suffix}'
+
+    def temp_path(self, key: str, suffix: str) -> Path:
+        return self.directory / 'tmp' / f'{key}{suffix}'
+
+    def store(self, key: str, temp: Path) -> Path:
+        path = self.path(key, temp.suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp, path)
+        self.objects[key] = self.hash(path)
+        return path
+
+    def install(self, key: str, path: Path, output: Path):
+        """Copy a cached file to output, unless output already is that file"""
+        if output.exists() and self.hash(output) == self.objects[key]:
+            return False
+        output.parent.mkdir(parents=True, exist_ok=True)
+        temp = output.with_name(f'.{output.name}.tmp')
+        shutil.copyfile(path, temp)
+        os.replace(temp, output)
+        stat = output.stat()
+        self.hashes[str(output.resolve())] = [stat.st_size, stat.st_mtime_ns, self.objects[key]]
+        return True
+
+    def save(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp = self.index_path.with_suffix('.tmp')
+        temp.write_text(json.dumps({'hashes': self.hashes, 'objects': self.objects}))
+        os.replace(temp, self.index_path)
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process and its finished children (ffmpeg)"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _encode(encoder, source, output, settings):
+    """Runs in a worker process: (ok, wall seconds, CPU seconds, captured output)"""
+    log = io.StringIO()
+    start = time.perf_counter()
+    cpu = cpu_seconds()
+    with contextlib.redirect_stdout(log):
+        try:
+            ok = encoder(source, output, **settings)
+        except Exception as e:
+            print(f"✗ Error: {e}")
+            ok = False
+    return ok is not False, time.perf_counter() - start, cpu_seconds() - cpu, log.getvalue()
+
+
+def default_workers() -> int:
+    """ASSET_JOBS, else the CPUs this process may run on"""
+    if os.environ.get('ASSET_JOBS'):
+        return max(1, int(os.environ['ASSET_JOBS']))
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def job_status(job: Job, cache: BuildCache):
+    """
+    (status, key): 'up to date' (output is the cached encoding), 'cached'
+    (encoded before, output missing or different) or 'stale' (needs encoding)
+    """
+    key = cache.key(job, cache.hash(job.source))
+    if key in cache.objects and cache.path(key, job.output.suffix.lower()).exists():
+        if job.output.exists() and cache.hash(job.output) == cache.objects[key]:
+            return 'up to date', key
+        return 'cached', key
+    return 'stale', key
+
+
+def run(jobs, cache=None, workers=None, verbose=False):
+    """
+    Run jobs, skipping those the cache already has. Returns one dict per job:
+    source, output, status (built / cached / up to date / failed), seconds
+    (encoder wall time), cpu (encoder CPU time), before / after (bytes)
+    """
+    cache = BuildCache() if cache is None else cache
+    workers = workers or default_workers()
+    results = []
+    pending = []
+    for job in jobs:
+        result = {'source': str(job.source), 'output': str(job.output), 'seconds': 0.0, 'cpu': 0.0,
+                  'before': job.source.stat().st_size, 'after': None}
+        results.append(result)
+        status, key = job_status(job, cache)
+        if status == 'stale':
+            pending.append((job, key, result))
+            continue
+        if status == 'cached':
+            cache.install(key, cache.path(key, job.output.suffix.lower()), job.output)
+        result.update(status=status, after=job.output.stat().st_size)
+
+    if pending:
+        (cache.directory / 'tmp').mkdir(parents=True, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {}
+            for job, key, result in pending:
+                temp = cache.temp_path(key, job.output.suffix.lower())
+                futures[pool.submit(_encode, job.encoder, job.source, temp, job.settings)] = (job, key, temp, result)
+            for future in as_completed(futures):
+                job, key, temp, result = futures[future]
+                ok, result['seconds'], result['cpu'], log = future.result()
+                if ok and temp.exists():
+                    cache.install(key, cache.store(key, temp), job.output)
+                    result.update(status='built', after=job.output.stat().st_size)
+                    print(f"✓ {job.source.name} -> {job.output.name}: {result['seconds']:.2f}s, "
+                          f"{result['before'] / 1024:.1f} KB -> {result['after'] / 1024:.1f} KB")
+                else:
+                    temp.unlink(missing_ok=True)
+                    result['status'] = 'failed'
+                    print(f"✗ {job.source.name} -> {job.output.name} failed:")
+                    print(log[-500:])
+                    log = ''
+                if verbose and log:
+                    print(log)
+    cache.save()
+    return results
+
+
+def summary(results, wall_seconds, workers=None):
+    """
+    Print counts and the speedup over running the jobs one by one, estimated
+    from the encoders' CPU time (wall time per file grows when workers share
+    a CPU)
+    """
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    print(f"📦 {len(results)} job(s): " + ', '.join(f'{count} {status}' for status, count in counts.items()))
+    serial = sum(result['cpu'] for result in results)
+    if counts.get('built') and serial > 0.1:
+        print(f"⏱  {serial:.2f}s of encoder CPU in {wall_seconds:.2f}s wall with {workers or default_workers()} "
+              f"worker(s): ~{serial / wall_seconds:.1f}x the serial run")
+    else:
+        print(f"⏱  {wall_seconds:.3f}s")
@@ -0,0 +1,169 @@
+"""
+MP4 duration and bitrate for the build report, read from the moov/mvhd box
+(no ffprobe needed)
+"""
+import struct
+from pathlib import Path
+
+
+def _boxes(f, start, end):
+    """(type, payload offset, payload size) of the boxes from start to end"""
+    while start + 8 <= end:
+        f.seek(start)
+        size, kind = struct.unpack('>I4s', f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - start
+        if size < header:
+            return
+        yield kind.decode('latin-1'), start + header, size - header
+        start += size
+
+
+def mp4_duration(path: Path):
+    """Seconds, or None when the file has no readable mvhd box"""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        for kind, offset, size in _boxes(f, 0, path.stat().st_size):
+            if kind != 'moov':
+                continue
+            for inner, inner_offset, _ in _boxes(f, offset, offset + size):
+                if inner != 'mvhd':
+                    continue
+                f.seek(inner_offset)
+                version = f.read(1)[0]
+                f.seek(3, 1)  # flags
+                if version == 1:
+                    _, _, timescale, duration = struct.unpack('>QQIQ', f.read(28))
+                else:
+                    _, _, timescale, duration = struct.unpack('>IIII', f.read(16))
+                return duration / timescale if timescale else None
+    return None
+
+
+def header_size(path: Path):
+    """Bytes before the first sample (the mdat payload): what a player reads before the first frame"""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        for kind, offset, _ in _boxes(f, 0, path.stat().st_size):
+            if kind == 'mdat':
+                return offset
+    return None
+
+
+def bitrate_kbps(path: Path):
+    """Average bitrate of a video file in kbit/s, None when unknown"""
+    duration = mp4_duration(path)
+    if not duration:
+        return None
+    return round(Path(path).stat().st_size * 8 / duration / 1000, 1)
+
+
+# --- Fragmented MP4 (asset_build renditions) ---
+
+def _children(f, offset, size):
+    return {kind: (inner_offset, inner_size) for kind, inner_offset, inner_size in _boxes(f, offset, offset + size)}
+
+
+def _read(f, offset, size):
+    f.seek(offset)
+    return f.read(size)
+
+
+def _video_track(f, moov):
+    """(track id, timescale, width, height, codecs) of the first video track"""
+    for kind, offset, size in _boxes(f, moov[0], moov[0] + moov[1]):
+        if kind != 'trak':
+            continue
+        trak = _children(f, offset, size)
+        mdia = _children(f, *trak['mdia'])
+        handler = _read(f, mdia['hdlr'][0] + 8, 4)
+        if handler != b'vide':
+            continue
+        tkhd = _read(f, *trak['tkhd'])
+        track_id = struct.unpack('>I', tkhd[20:24] if tkhd[0] == 1 else tkhd[12:16])[0]
+        width, height = (value >> 16 for value in struct.unpack('>II', tkhd[-8:]))
+        mdhd = _read(f, *mdia['mdhd'])
+        timescale = struct.unpack('>I', mdhd[20:24] if mdhd[0] == 1 else mdhd[12:16])[0]
+        stbl = _children(f, *_children(f, *mdia['minf'])['stbl'])
+        stsd_offset, stsd_size = stbl['stsd']
+        codecs = 'avc1'
+        # stsd: version/flags and entry count, then the avc1 sample entry (78 bytes before its boxes)
+        for entry, entry_offset, entry_size in _boxes(f, stsd_offset + 8, stsd_offset + stsd_size):
+            inner = _children(f, entry_offset + 78, entry_size - 78)
+            if 'avcC' in inner:
+                config = _read(f, inner['avcC'][0], 4)
+                codecs = f'{entry}.{config[1]:02x}{config[2]:02x}{config[3]:02x}'
+            break
+        return track_id, timescale, width, height, codecs
+    return None
+
+
+def _default_duration(f, moov, track_id):
+    mvex = _children(f, *moov).get('mvex')
+    if mvex is None:
+        return 0
+    for kind, offset, size in _boxes(f, mvex[0], mvex[0] + mvex[1]):
+        if kind == 'trex':
+            trex = _read(f, offset, size)
+            if struct.unpack('>I', trex[4:8])[0] == track_id:
+                return struct.unpack('>I', trex[12:16])[0]
+    return 0
+
+
+def _fragment_duration(f, moof, track_id, default_duration):
+    """Sum of the video sample durations in one moof (tfhd / trun)"""
+    for kind, offset, size in _boxes(f, moof[0], moof[0] + moof[1]):
+        if kind != 'traf':
+            continue
+        traf = _children(f, offset, size)
+        tfhd = _read(f, *traf['tfhd'])
+        flags = int.from_bytes(tfhd[1:4], 'big')
+        if struct.unpack('>I', tfhd[4:8])[0] != track_id:
+            continue
+        position = 8 + (8 if flags & 0x1 else 0) + (4 if flags & 0x2 else 0)
+        duration = struct.unpack('>I', tfhd[position:position + 4])[0] if flags & 0x8 else default_duration
+        trun = _read(f, *traf['trun'])
+        flags = int.from_bytes(trun[1:4], 'big')
+        count = struct.unpack('>I', trun[4:8])[0]
+        position = 8 + (4 if flags & 0x1 else 0) + (4 if flags & 0x4 else 0)
+        if not flags & 0x100:
+            return duration * count
+        step = 4 * bin(flags & 0xF00).count('1')
+        return sum(struct.unpack('>I', trun[position + i * step:position + i * step + 4])[0] for i in range(count))
+    return 0
+
+
+def fragments(path: Path):
+    """
+    Layout of a fragmented MP4: {'init': (offset, length), 'segments':
+    [(offset, length, seconds)], 'width', 'height', 'codecs'} with one
+    segment per moof (+ its mdat), durations from the video track
+    """
+    path = Path(path)
+    end = path.stat().st_size
+    with open(path, 'rb') as f:
+        top = list(_boxes(f, 0, end))
+        moov = next(((offset, size) for kind, offset, size in top if kind == 'moov'), None)
+        if moov is None:
+            raise ValueError(f'{path.name}: no moov box')
+        track = _video_track(f, moov)
+        if track is None:
+            raise ValueError(f'{path.name}: no video track')
+        track_id, timescale, width, height, codecs = track
+        default_duration = _default_duration(f, moov, track_id)
+        init_end = moov[0] + moov[1]
+        segments = []
+        for kind, offset, size in top:
+            if kind == 'moof':
+                start = offset - 8  # ffmpeg writes moof with a 32-bit size
+                seconds = _fragment_duration(f, (offset, size), track_id, default_duration) / timescale
+                segments.append([start, offset + size - start, seconds])
+            elif segments:
+                # mdat (and anything else) up to the next moof belongs to the segment
+                segments[-1][1] = offset + size - segments[-1][0]
+    return {'init': (0, init_end), 'segments': [tuple(segment) for segment in segments],
+            'width': width, 'height': height, 'codecs': codecs}
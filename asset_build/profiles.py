@@ -0,0 +1,84 @@
+"""
+Build profiles: which steps run for a target, with which settings
+    python -m asset_build web
+
+- web:   spectrogram videos of new frogs from recordings/ (SPECTROGRAMS),
+         srcset variants of the photos (AVIF / WebP / PNG), .br / .gz
+         siblings of the text assets and the cold-start cache, written
+         next to the sources in assets/ (where main_web.py serves them).
+         The videos are served as they are, plus an adaptive bitrate
+         ladder (STREAM_LADDER) with HLS / DASH playlists in assets/streams,
+         and the listen mode files in assets/listen (LISTEN).
+- apk:   a copy of assets/ for buildozer in build/apk/assets: H.264 at CRF
+         30 with the original audio, photos at most 1080px
+- kiosk: like web, with larger, higher quality variants for big screens
+         on a LAN. web and kiosk share assets/variants: the last one built
+         wins, and switching back is served from the build cache. kiosk
+         does not build the ladder (on a LAN the originals play at once).
+
+A step is skipped when its settings are None.
+"""
+
+# Responsive image variants (srcset): widths in pixels per format, best format first.
+# PNG stops at 500px because the original PNG already is the large fallback.
+VARIANT_WIDTHS = {
+    'avif': (250, 500, 1000),
+    'webp': (250, 500, 1000),
+    'png': (250, 500),
+}
+
+# Adaptive bitrate ladder: (height, peak video bitrate, audio bitrate) per rung.
+# The originals (0.8-1.1 Mbit/s at 4704x1762) stay the progressive MP4 fallback;
+# the top rung stays well under the smallest of them (GGF, 784 kbit/s).
+STREAM_LADDER = (
+    (240, '150k', '64k'),
+    (480, '350k', '96k'),
+    (720, '500k', '96k'),
+)
+
+# Spectrogram videos for recordings/<code>.wav (new frogs), see encode_spectrogram_video
+SPECTROGRAMS = {'width': 1920, 'height': 720, 'fps': 30, 'n_fft': 2048, 'fmin': 100, 'fmax': 16000,
+                'dynamic_range': 80}
+
+# Listen mode: the call as Opus (AAC for Safari), mono, and one still of the
+# spectrogram (WebP) for the page to draw the playhead on
+LISTEN = {'audio': {'ogg': '32k', 'm4a': '48k'}, 'image': {'quality': 75, 'max_dimension': 1600}}
+
+TEXT_ENCODINGS = {'br': 11, 'gzip': 9}   # see compression.STATIC_LEVELS
+
+PROFILES = {
+    'web': {
+        'output': None,     # next to the sources
+        'spectrograms': SPECTROGRAMS,
+        'videos': None,
+        'images': None,
+        'renditions': {'ladder': STREAM_LADDER, 'segment_seconds': 2, 'buffer_seconds': 1, 'preset': 'slow'},
+        'listen': LISTEN,
+        'variants': {'widths': VARIANT_WIDTHS, 'quality': 70},
+        'text': {'encodings': TEXT_ENCODINGS},
+        'manifest': True,
+    },
+    'apk': {
+        'output': 'build/apk/assets',
+        'spectrograms': None,
+        'videos': {'crf': 30, 'preset': 'medium', 'audio': 'copy', 'max_height': None},
+        'images': {'quality': 75, 'max_dimension': 1080},
+        'renditions': None,
+        'listen': None,
+        'variants': None,
+        'text': None,
+        'manifest': False,
+    },
+    'kiosk': {
+        'output': None,
+        'spectrograms': None,
+        'videos': None,
+        'images': None,
+        'renditions': None,
+        'listen': None,
+        'variants': {'widths': {'avif': (500, 1000, 1500), 'webp': (500, 1000, 1500), 'png': (250, 500)},
+                     'quality': 80},
+        'text': {'encodings': TEXT_ENCODINGS},
+        'manifest': True,
+    },
+}
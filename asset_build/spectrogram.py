@@ -0,0 +1,154 @@
+"""
+Spectrograms from raw audio with NumPy (the original videos were made with
+PASE and baked offline); a new frog needs only its recording:
+    recordings/XYZ.wav -> assets/XYZ_resized.mp4   (python -m asset_build web)
+
+load_audio -> stft_power (windowed frames, batched real FFT) -> decibels
+-> log_frequency / resize_columns -> colorize (256 entry lookup table):
+an RGB array, cut into PNG tiles or played as video frames with a moving
+playhead like the original videos. Every step works on whole arrays.
+NumPy is only needed to build assets: np is None without it and the
+spectrograms step is skipped.
+"""
+import math
+import subprocess
+import wave
+from pathlib import Path
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:  # spectrograms step skipped
+    np = None
+
+SAMPLE_RATE = 44100
+AUDIO_SUFFIXES = ('.wav', '.m4a', '.aac', '.mp3', '.flac', '.ogg')
+PLAYHEAD_COLOR = (224, 32, 32)   # red, like the PASE videos (see encoders.playhead)
+
+# matplotlib's viridis at 10 evenly spaced points, interpolated into the lookup table
+VIRIDIS = ('#440154', '#482878', '#3e4989', '#31688e', '#26828e',
+           '#1f9e89', '#35b779', '#6ece58', '#b5de2b', '#fde725')
+
+
+def load_audio(path: Path, sample_rate=SAMPLE_RATE):
+    """
+    (mono float32 samples, sample rate): PCM WAV directly, anything else
+    through ffmpeg. Levels are only relative (ffmpeg's downmix is 3 dB
+    louder than the channel average): colorize scales to the loudest point.
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.wav':
+        try:
+            with wave.open(str(path), 'rb') as f:
+                channels, width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+                data = f.readframes(f.getnframes())
+        except wave.Error:
+            pass  # not PCM (e.g. float WAV): ffmpeg reads it
+        else:
+            if width == 3:  # 24 bit: pad to 32
+                raw = np.frombuffer(data, np.uint8).reshape(-1, 3)
+                samples = (raw[:, 0].astype(np.int32) << 8 | raw[:, 1].astype(np.int32) << 16
+                           | raw[:, 2].astype(np.int8).astype(np.int32) << 24).astype(np.float32) / 2 ** 31
+            elif width == 1:
+                samples = (np.frombuffer(data, np.uint8).astype(np.float32) - 128) / 128
+            else:
+                dtype = {2: np.int16, 4: np.int32}[width]
+                samples = np.frombuffer(data, dtype).astype(np.float32) / np.iinfo(dtype).max
+            return samples.reshape(-1, channels).mean(axis=1), rate
+    cmd = ['ffmpeg', '-v', 'error', '-i', str(path), '-vn', '-ac', '1', '-ar', str(sample_rate),
+           '-f', 'f32le', '-']
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, np.float32), sample_rate
+
+
+def stft_power(samples, n_fft=2048, hop=512, batch=512):
+    """
+    Power spectrogram, shape (n_fft // 2 + 1 bins, frames)
+
+    Frames are centred on multiples of hop (the signal is reflect-padded),
+    taken as strided views of the samples (no copy) and Hann-windowed and
+    transformed batch frames at a time, which bounds the memory.
+    """
+    samples = np.asarray(samples, np.float32)
+    padded = np.pad(samples, n_fft // 2, mode='reflect' if len(samples) > n_fft // 2 else 'constant')
+    frames = np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop]
+    window = np.hanning(n_fft + 1)[:-1].astype(np.float32)   # periodic Hann
+    power = np.empty((len(frames), n_fft // 2 + 1), np.float32)
+    for start in range(0, len(frames), batch):
+        spectrum = np.fft.rfft(frames[start:start + batch] * window, axis=1)
+        power[start:start + batch] = spectrum.real ** 2 + spectrum.imag ** 2
+    return power.T
+
+
+def decibels(power, floor=1e-12):
+    return 10 * np.log10(np.maximum(power, floor))
+
+
+def _interpolate(values, positions, axis):
+    """values sampled at fractional indices along axis (linear)"""
+    positions = np.clip(positions, 0, values.shape[axis] - 1)
+    low = np.floor(positions).astype(np.intp)
+    high = np.minimum(low + 1, values.shape[axis] - 1)
+    shape = [1, 1]
+    shape[axis] = -1
+    fraction = (positions - low).reshape(shape)
+    return np.take(values, low, axis=axis) * (1 - fraction) + np.take(values, high, axis=axis) * fraction
+
+
+def log_frequency(db, sample_rate, n_fft, height, fmin=100, fmax=16000):
+    """Rows on a log frequency axis, fmax at the top (like the PASE plots)"""
+    frequencies = np.geomspace(fmax, fmin, height)
+    return _interpolate(db, frequencies * n_fft / sample_rate, axis=0)
+
+
+def resize_columns(db, width):
+    return _interpolate(db, np.linspace(0, db.shape[1] - 1, width), axis=1)
+
+
+def colormap_lut(stops=VIRIDIS, size=256):
+    """(size, 3) uint8 table from evenly spaced hex colours"""
+    colors = np.array([[int(stop[i:i + 2], 16) for i in (1, 3, 5)] for stop in stops], np.float32)
+    points = np.linspace(0, 1, len(stops))
+    levels = np.linspace(0, 1, size)
+    return np.stack([np.interp(levels, points, colors[:, channel]) for channel in range(3)], axis=1).round().astype(np.uint8)
+
+
+def colorize(db, lut, dynamic_range=80):
+    """dB -> RGB: the loudest point at the top of the table, dynamic_range dB below it at the bottom"""
+    top = db.max()
+    scaled = (db - (top - dynamic_range)) * ((len(lut) - 1) / dynamic_range)
+    return lut[np.clip(scaled, 0, len(lut) - 1).astype(np.uint8)]
+
+
+def render(samples, sample_rate, width=1920, height=720, n_fft=2048, fmin=100, fmax=16000, dynamic_range=80,
+           lut=None):
+    """(height, width, 3) uint8 spectrogram image of the whole recording"""
+    hop = max(1, len(samples) // width)
+    db = decibels(stft_power(samples, n_fft, hop))
+    db = resize_columns(log_frequency(db, sample_rate, n_fft, height, fmin, fmax), width)
+    return colorize(db, colormap_lut() if lut is None else lut, dynamic_range)
+
+
+def tiles(rgb, tile_width=512):
+    """PIL images of consecutive tile_width wide slices (the last one may be narrower)"""
+    return [Image.fromarray(rgb[:, x:x + tile_width]) for x in range(0, rgb.shape[1], tile_width)]
+
+
+def frames(rgb, duration, fps=30, line_width=3, color=PLAYHEAD_COLOR):
+    """
+    Video frames: the spectrogram with the playhead at each frame's time
+
+    Yields the same array every time, with only the playhead columns
+    redrawn: write each frame out before asking for the next.
+    """
+    frame = rgb.copy()
+    width = rgb.shape[1]
+    previous = None
+    for index in range(math.ceil(duration * fps)):
+        x = min(round(index / fps / duration * (width - 1)), width - line_width)
+        if previous is not None:
+            frame[:, previous:previous + line_width] = rgb[:, previous:previous + line_width]
+        frame[:, x:x + line_width] = color
+        previous = x
+        yield frame
@@ -0,0 +1,119 @@
+"""
+HLS and DASH playlists for the adaptive bitrate renditions
+    assets/streams/CF_resized/240p.mp4, 480p.mp4, 720p.mp4   (encode_rendition)
+ -> 240p.m3u8 ... master.m3u8 (HLS) and manifest.mpd (DASH)
+
+Both describe the same fragmented MP4 files by byte range, so there is one
+copy of each rung on disk. URIs inside the playlists are content-hashed
+names (asset_manifest.hashed_name), relative to the playlist, so the whole
+ladder is served from /assets with immutable caching.
+"""
+import math
+from pathlib import Path
+
+from asset_manifest import STREAMS_FOLDER, content_hash, hashed_name
+from .probe import fragments
+
+AUDIO_CODEC = 'mp4a.40.2'   # AAC-LC, see encode_rendition
+
+
+def stream_dir(assets_dir: Path, video_name: str) -> Path:
+    """assets/streams/<video stem>: the ladder of one video"""
+    return Path(assets_dir) / STREAMS_FOLDER / Path(video_name).stem
+
+
+def hashed(path: Path) -> str:
+    return hashed_name(path.name, content_hash(path))
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Keep the file (and its mtime) when the content is the same"""
+    if path.exists() and path.read_text() == text:
+        return False
+    path.write_text(text)
+    return True
+
+
+def rung_info(path: Path) -> dict:
+    layout = fragments(path)
+    segments = layout['segments']
+    duration = sum(seconds for _, _, seconds in segments)
+    rates = [length * 8 / seconds for _, length, seconds in segments if seconds > 0]
+    return {
+        **layout,
+        'name': path.stem,
+        'uri': hashed(path),
+        'duration': duration,
+        'peak': int(max(rates)),
+        'average': int(sum(length for _, length, _ in segments) * 8 / duration),
+    }
+
+
+def media_playlist(rung) -> str:
+    init_offset, init_length = rung['init']
+    lines = ['#EXTM3U', '#EXT-X-VERSION:7',
+             f"#EXT-X-TARGETDURATION:{math.ceil(max(seconds for _, _, seconds in rung['segments']))}",
+             '#EXT-X-PLAYLIST-TYPE:VOD', '#EXT-X-INDEPENDENT-SEGMENTS',
+             f'#EXT-X-MAP:URI="{rung["uri"]}",BYTERANGE="{init_length}@{init_offset}"']
+    for offset, length, seconds in rung['segments']:
+        lines += [f'#EXTINF:{seconds:.3f},', f'#EXT-X-BYTERANGE:{length}@{offset}', rung['uri']]
+    lines.append('#EXT-X-ENDLIST')
+    return '\n'.join(lines) + '\n'
+
+
+def master_playlist(rungs, playlist_uris) -> str:
+    lines = ['#EXTM3U', '#EXT-X-VERSION:7', '#EXT-X-INDEPENDENT-SEGMENTS']
+    for rung in rungs:
+        lines += [f"#EXT-X-STREAM-INF:BANDWIDTH={rung['peak']},AVERAGE-BANDWIDTH={rung['average']},"
+                  f"RESOLUTION={rung['width']}x{rung['height']},CODECS=\"{rung['codecs']},{AUDIO_CODEC}\"",
+                  playlist_uris[rung['name']]]
+    return '\n'.join(lines) + '\n'
+
+
+def mpd(rungs) -> str:
+    """Static DASH manifest: one muxed AdaptationSet, SegmentList by byte range"""
+    duration = max(rung['duration'] for rung in rungs)
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" type="static" '
+             'profiles="urn:mpeg:dash:profile:isoff-main:2011" '
+             f'mediaPresentationDuration="PT{duration:.3f}S" minBufferTime="PT2S">',
+             '  <Period>',
+             '    <AdaptationSet mimeType="video/mp4" segmentAlignment="true" startWithSAP="1">']
+    for rung in rungs:
+        init_offset, init_length = rung['init']
+        lines += [f"      <Representation id=\"{rung['name']}\" bandwidth=\"{rung['peak']}\" "
+                  f"width=\"{rung['width']}\" height=\"{rung['height']}\" codecs=\"{rung['codecs']},{AUDIO_CODEC}\">",
+                  f"        <BaseURL>{rung['uri']}</BaseURL>",
+                  '        <SegmentList timescale="1000">',
+                  f'          <Initialization range="{init_offset}-{init_offset + init_length - 1}"/>',
+                  '          <SegmentTimeline>']
+        start = 0.0
+        for _, _, seconds in rung['segments']:
+            lines.append(f'            <S t="{round(start * 1000)}" d="{round(seconds * 1000)}"/>')
+            start += seconds
+        lines.append('          </SegmentTimeline>')
+        lines += [f'          <SegmentURL mediaRange="{offset}-{offset + length - 1}"/>'
+                  for offset, length, _ in rung['segments']]
+        lines += ['        </SegmentList>', '      </Representation>']
+    lines += ['    </AdaptationSet>', '  </Period>', '</MPD>']
+    return '\n'.join(lines) + '\n'
+
+
+def write_playlists(directory: Path) -> list:
+    """Write the playlists for the rungs in one stream folder; returns the files that changed"""
+    directory = Path(directory)
+    rungs = sorted((rung_info(path) for path in directory.glob('*p.mp4')), key=lambda rung: rung['peak'])
+    if not rungs:
+        return []
+    changed = []
+    playlist_uris = {}
+    for rung in rungs:
+        path = directory / f"{rung['name']}.m3u8"
+        if write_if_changed(path, media_playlist(rung)):
+            changed.append(path)
+        playlist_uris[rung['name']] = hashed(path)
+    for path, text in ((directory / 'master.m3u8', master_playlist(rungs, playlist_uris)),
+                       (directory / 'manifest.mpd', mpd(rungs))):
+        if write_if_changed(path, text):
+            changed.append(path)
+    return changed
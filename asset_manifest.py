@@ -0,0 +1,265 @@
+"""
+Content-hashed asset URLs
+Builds a manifest at startup that maps each logical asset name (GGF.png)
+to a content-hashed URL (/assets/GGF.3f9a1c2e.png). A hashed URL always
+points at the same bytes, so it can be cached by browsers for a year
+without ever being revalidated.
+"""
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from compression import SIBLING_SUFFIXES, accepted_encoding
+
+HASH_LENGTH = 8
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+VIDEO_SUFFIXES = ('.mp4',)
+
+# Responsive image variants live in assets/variants as <stem>.w<width>.<format>
+# (built by python -m asset_build web)
+VARIANTS_FOLDER = 'variants'
+IMAGE_MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'png': 'image/png'}
+DEFAULT_SRC_WIDTH = 500
+_VARIANT_NAME = re.compile(r'^(?P<stem>.+)\.w(?P<width>\d+)\.(?P<format>avif|webp|png)$')
+
+# Adaptive bitrate ladders live in assets/streams/<video stem>/ (asset_build/streams.py)
+STREAMS_FOLDER = 'streams'
+STREAM_PLAYLISTS = {'hls': 'master.m3u8', 'dash': 'manifest.mpd'}
+
+# Listen mode (audio + still spectrogram) lives in assets/listen/<video stem>.*
+LISTEN_FOLDER = 'listen'
+LISTEN_AUDIO_TYPES = {'ogg': 'audio/ogg; codecs=opus', 'm4a': 'audio/mp4; codecs=mp4a.40.2'}
+
+
+def best_image_format(accept: str) -> str:
+    """Best variant format the browser advertises in its Accept header"""
+    accept = (accept or '').lower()
+    for image_format in ('avif', 'webp'):
+        if IMAGE_MIME_TYPES[image_format] in accept:
+            return image_format
+    return 'png'
+
+
+def content_hash(path: Path) -> str:
+    """Short hex digest of a file's bytes"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(logical: str, digest: str) -> str:
+    """GGF.png + 3f9a1c2e -> GGF.3f9a1c2e.png (keeps any sub folder)"""
+    path = Path(logical)
+    return (path.parent / f'{path.stem}.{digest}{path.suffix}').as_posix()
+
+
+class AssetManifest:
+    """
+    Maps logical asset names to content-hashed URLs and back
+
+    Logical names are paths relative to the assets folder using forward
+    slashes, e.g. 'GGF.png' or 'variants/GGF.w250.webp'.
+    """
+
+    def __init__(self, assets_dir: Path, prefix='/assets', video_prefix='/video'):
+        self.assets_dir = Path(assets_dir)
+        self.prefix = prefix
+        self.video_prefix = video_prefix
+        self.entries = {}   # logical name -> hashed name
+        self.reverse = {}   # hashed name -> logical name
+        self.variants = {}  # (image stem, format) -> [(width, logical name)]
+        self.encodings = {} # logical name -> pre-compressed siblings ('br', 'gzip')
+        self.timings = {}   # listen mode JSON (logical name) -> playhead timing, read once per load
+
+    def build(self):
+        """Hash every file in the assets folder"""
+        entries = {}
+        encodings = {}
+        sibling_suffixes = set(SIBLING_SUFFIXES.values())
+        for path in sorted(self.assets_dir.rglob('*')):
+            if not path.is_file() or path.name.startswith('.'):
+                continue
+            if path.suffix in sibling_suffixes and path.with_suffix('').is_file():
+                continue  # name.js.br: a compressed copy of name.js, not an asset
+            logical = path.relative_to(self.assets_dir).as_posix()
+            entries[logical] = hashed_name(logical, content_hash(path))
+            siblings = tuple(encoding for encoding, suffix in SIBLING_SUFFIXES.items()
+                             if path.with_name(path.name + suffix).is_file())
+            if siblings:
+                encodings[logical] = siblings
+        self.load(entries, encodings)
+        return self
+
+    def load(self, entries, encodings=None):
+        """Replace the manifest with an existing {logical: hashed} mapping"""
+        self.entries = dict(entries)
+        self.encodings = dict(encodings or {})
+        self.reverse = {hashed: logical for logical, hashed in self.entries.items()}
+        self.variants = {}
+        for logical in self.entries:
+            folder, _, filename = logical.rpartition('/')
+            match = _VARIANT_NAME.match(filename)
+            if folder == VARIANTS_FOLDER and match:
+                key = (match['stem'], match['format'])
+                self.variants.setdefault(key, []).append((int(match['width']), logical))
+        for widths in self.variants.values():
+            widths.sort()
+        self.timings = {}
+        for logical in self.entries:
+            if logical.startswith(f'{LISTEN_FOLDER}/') and logical.endswith('.json'):
+                try:
+                    self.timings[logical] = json.loads((self.assets_dir / logical).read_text())
+                except (OSError, ValueError):
+                    pass
+        return self
+
+    def signature(self) -> str:
+        """Hash of every file's name, size and mtime: tells whether a saved manifest is stale"""
+        digest = hashlib.sha1()
+        for path in sorted(self.assets_dir.rglob('*')):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f'{path.relative_to(self.assets_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n'.encode())
+        return digest.hexdigest()
+
+    def save(self, path: Path):
+        """Write the manifest for load_saved() (at image build time)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'signature': self.signature(), 'entries': self.entries,
+                                    'encodings': self.encodings}))
+        return self
+
+    def load_saved(self, path: Path) -> bool:
+        """Load a manifest written by save() unless any asset changed since; False if not loaded"""
+        try:
+            saved = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return False
+        if saved.get('signature') != self.signature():
+            return False
+        self.load(saved['entries'], {name: tuple(value) for name, value in saved['encodings'].items()})
+        return True
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Strip the URL prefix or 'assets/' folder from a name"""
+        name = name.lstrip('/')
+        if name.startswith('assets/'):
+            name = name[len('assets/'):]
+        return name
+
+    def url(self, name: str) -> str:
+        """Public URL for a logical asset name (unhashed if the file is unknown)"""
+        logical = self.normalize(name)
+        target = self.entries.get(logical, logical)
+        if '/' not in logical and logical.lower().endswith(VIDEO_SUFFIXES):
+            return f'{self.video_prefix}/{target}'
+        return f'{self.prefix}/{target}'
+
+    def srcset(self, name: str, image_format: str):
+        """
+        (src, srcset) for an image in the given variant format
+
+        Falls back to PNG variants, then to the original image with an
+        empty srcset when no variants have been built.
+        """
+        stem = Path(self.normalize(name)).stem
+        widths = self.variants.get((stem, image_format)) or self.variants.get((stem, 'png'))
+        if not widths:
+            return self.url(name), ''
+        srcset = ', '.join(f'{self.url(logical)} {width}w' for width, logical in widths)
+        # src is only used by browsers without srcset support: a mid-sized variant
+        src = next((logical for width, logical in widths if width >= DEFAULT_SRC_WIDTH), widths[-1][1])
+        return self.url(src), srcset
+
+    def streams(self, name: str) -> dict:
+        """{'hls': url, 'dash': url} of a video's renditions, empty when none were built"""
+        folder = f'{STREAMS_FOLDER}/{Path(self.normalize(name)).stem}'
+        return {kind: self.url(f'{folder}/{playlist}') for kind, playlist in STREAM_PLAYLISTS.items()
+                if f'{folder}/{playlist}' in self.entries}
+
+    def listen(self, name: str) -> dict:
+        """
+        Listen mode files of a video: {'audio': [{'src', 'type'}], 'image':
+        url, 'duration', 'start', 'end', 'top', 'bottom'} (playhead timing,
+        see asset_build.encoders.encode_playhead), empty when none were built
+        """
+        stem = f'{LISTEN_FOLDER}/{Path(self.normalize(name)).stem}'
+        timing = self.timings.get(f'{stem}.json')
+        if timing is None or f'{stem}.webp' not in self.entries:
+            return {}
+        audio = [{'src': self.url(f'{stem}.{audio_format}'), 'type': media_type}
+                 for audio_format, media_type in LISTEN_AUDIO_TYPES.items() if f'{stem}.{audio_format}' in self.entries]
+        if not audio:
+            return {}
+        return {'audio': audio, 'image': self.url(f'{stem}.webp'), **timing}
+
+    def resolve(self, requested: str):
+        """Logical name for a hashed name, or None if it is not a hashed URL"""
+        return self.reverse.get(requested.replace(os.sep, '/'))
+
+    @property
+    def version(self) -> str:
+        """Short hash of the whole asset set - changes whenever any file does"""
+        return hashlib.sha1(' '.join(sorted(self.reverse)).encode()).hexdigest()[:HASH_LENGTH]
+
+    def __contains__(self, name: str) -> bool:
+        return self.normalize(name) in self.entries
+
+
+class HashedStaticFiles(StaticFiles):
+    """
+    StaticFiles that also answers content-hashed names
+
+    Hashed requests are served from the logical file with immutable caching,
+    plain names keep the default short-lived caching. Text files with .br /
+    .gz siblings (python -m asset_build, text step) are sent pre-compressed when accepted.
+    """
+
+    def __init__(self, *, manifest: AssetManifest, max_cache_age: int = 3600, **kwargs):
+        super().__init__(**kwargs)
+        self.manifest = manifest
+        self.max_cache_age = max_cache_age
+
+    async def get_response(self, path, scope):
+        logical = self.manifest.resolve(path)
+        response = self.precompressed_response(logical or path.replace(os.sep, '/'), scope)
+        if response is None:
+            response = await super().get_response(logical or path, scope)
+        if response.status_code in (200, 206, 304):
+            if logical is not None:
+                response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+            else:
+                response.headers['Cache-Control'] = f'public, max-age={self.max_cache_age}'
+        return response
+
+    def precompressed_response(self, logical, scope):
+        """The .br / .gz sibling of a text file, or None to serve it as it is"""
+        siblings = self.manifest.encodings.get(logical)
+        if not siblings or scope['method'] not in ('GET', 'HEAD'):
+            return None
+        request_headers = Headers(scope=scope)
+        encoding = accepted_encoding(request_headers.get('accept-encoding'))
+        if encoding not in siblings or 'range' in request_headers:
+            return None
+        path = self.manifest.assets_dir / (logical + SIBLING_SUFFIXES[encoding])
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        media_type = mimetypes.guess_type(logical)[0] or 'application/octet-stream'
+        response = FileResponse(path, stat_result=stat_result, media_type=media_type,
+                                headers={'Content-Encoding': encoding, 'Vary': 'Accept-Encoding'})
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
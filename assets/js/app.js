@@ -0,0 +1,43 @@
+/* Shared by every page (pre-rendered and NiceGUI): fullscreen on the first tap
+   and the offline service worker (/sw.js).
+   Served from /assets under a content-hashed, immutable URL. */
+(function () {
+    let fullscreenRequested = false;
+    const events = ['click', 'touchstart', 'mousedown', 'keydown'];
+
+    function triggerFullscreen(e) {
+        if (!fullscreenRequested && e && e.isTrusted) {
+            fullscreenRequested = true;
+
+            const elem = document.documentElement;
+            if (elem.requestFullscreen) {
+                elem.requestFullscreen().catch(function () {
+                    fullscreenRequested = false;
+                });
+            } else if (elem.webkitRequestFullscreen) {
+                elem.webkitRequestFullscreen();
+            }
+
+            // Remove listeners after first attempt
+            events.forEach(function (type) {
+                document.removeEventListener(type, triggerFullscreen);
+            });
+        }
+    }
+
+    // Precache the whole exhibit for offline kiosks
+    if ('serviceWorker' in navigator) {
+        window.addEventListener('load', function () {
+            navigator.serviceWorker.register('/sw.js').catch(function (err) {
+                console.log('Service worker:', err.message);
+            });
+        });
+    }
+
+    window.addEventListener('load', function () {
+        if (document.fullscreenElement || document.webkitFullscreenElement) return;
+        events.forEach(function (type) {
+            document.addEventListener(type, triggerFullscreen);
+        });
+    });
+})();
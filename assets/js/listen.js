@@ -0,0 +1,113 @@
+/* Listen mode: the frog call as audio over a still of its spectrogram.
+   The videos only move a playhead over a fixed spectrogram, so the page
+   draws the playhead itself: ~80 KB per call instead of ~1 MB of video
+   (files built by python -m asset_build web into assets/listen).
+   On with ?listen=1 (remembered, ?listen=0 turns it off), otherwise when
+   the browser asks to save data or is on a 2G connection.
+   FrogListen.load(media, source) loads either kind of media element: the
+   <audio> of a listen view (FrogListen.replace / attach) or a <video>
+   (stream.js). */
+window.FrogListen = (function () {
+    const STORE_KEY = 'frogListen';
+
+    function enabled() {
+        const param = new URLSearchParams(location.search).get('listen');
+        if (param !== null) {
+            try { localStorage.setItem(STORE_KEY, param); } catch (e) {}
+            return param === '1';
+        }
+        try {
+            const stored = localStorage.getItem(STORE_KEY);
+            if (stored !== null) return stored === '1';
+        } catch (e) {}
+        const connection = navigator.connection;
+        return !!connection && (connection.saveData || /2g/.test(connection.effectiveType || ''));
+    }
+
+    // playhead position for the audio's current time (timing from encode_playhead)
+    function place(audio) {
+        const timing = audio.listenTiming;
+        if (!timing) return;
+        const duration = audio.duration || timing.duration;
+        const progress = duration ? Math.min(audio.currentTime / duration, 1) : 0;
+        const line = audio.listenView.querySelector('.listen-playhead');
+        line.style.left = (timing.start + (timing.end - timing.start) * progress) * 100 + '%';
+        line.style.top = timing.top * 100 + '%';
+        line.style.height = (timing.bottom - timing.top) * 100 + '%';
+    }
+
+    // a <div> with the still, the playhead and an <audio> standing in for the <video>
+    function createView(video) {
+        const view = document.createElement('div');
+        view.className = video.className + ' listen-view';
+        const image = document.createElement('img');
+        image.className = 'listen-image';
+        image.alt = '';
+        const line = document.createElement('div');
+        line.className = 'listen-playhead';
+        const audio = document.createElement('audio');
+        audio.className = 'listen-audio';
+        audio.preload = 'auto';
+        audio.muted = video.muted;
+        view.append(image, line, audio);
+        audio.listenView = view;
+
+        let frame = null;
+        function tick() {
+            place(audio);
+            frame = audio.paused ? null : requestAnimationFrame(tick);
+        }
+        audio.addEventListener('play', function () { if (frame === null) frame = requestAnimationFrame(tick); });
+        ['loadedmetadata', 'seeked', 'pause', 'ended'].forEach(function (name) {
+            audio.addEventListener(name, function () { place(audio); });
+        });
+        return audio;
+    }
+
+    // pre-rendered pages: the view takes the <video>'s place (and id)
+    function replace(video) {
+        const audio = createView(video);
+        audio.listenView.id = video.id;
+        video.replaceWith(audio.listenView);
+        return audio;
+    }
+
+    // NiceGUI page: the <video> belongs to Vue, so it is only hidden and the
+    // view goes into a container the page made for it
+    function attach(video, container) {
+        const audio = createView(video);
+        container.replaceChildren(audio.listenView);
+        video.hidden = true;
+        return audio;
+    }
+
+    function load(media, source) {
+        if (!media.listenView) return FrogStream.load(media, source);
+        const listen = source.listen;
+        const image = media.listenView.querySelector('.listen-image');
+        media.listenTiming = listen || null;
+        if (!listen) {
+            // no listen files for this video: its sound track, without a picture
+            image.removeAttribute('src');
+            media.src = source.video;
+        } else {
+            image.src = listen.image;
+            const audio = listen.audio.find(function (a) { return media.canPlayType(a.type); }) ||
+                          listen.audio[listen.audio.length - 1];
+            media.src = audio.src;
+        }
+        media.load();
+        place(media);
+    }
+
+    // frog page: the element to drive with FrogPlayer; with a container the
+    // <video> stays where it is (see attach)
+    function mount(video, source, container) {
+        let media = video;
+        if (enabled() && source.listen) media = container ? attach(video, container) : replace(video);
+        load(media, source);
+        return media;
+    }
+
+    return { enabled: enabled, replace: replace, attach: attach, load: load, mount: mount };
+})();
@@ -0,0 +1,33 @@
+/* Play / pause button for the spectrogram videos (no native controls).
+   Runs entirely in the browser: no server round-trip per tap. */
+window.FrogPlayer = {
+    bind: function (video, button, icon, icons) {
+        function showIcon(playing) {
+            icon.src = playing ? icons.pause : icons.play;
+        }
+
+        button.addEventListener('click', function () {
+            if (video.paused) {
+                video.muted = false;  // Unmute when playing
+                video.play().catch(function () { showIcon(false); });
+                showIcon(true);
+            } else {
+                video.pause();
+                showIcon(false);
+            }
+        });
+
+        // Back to the play icon when the call finishes
+        function onEnded() { showIcon(false); }
+        video.addEventListener('ended', onEnded);
+        return {
+            reset: function () { video.pause(); showIcon(false); },
+            // drive another <video> element (the quiz swaps in a prefetched one)
+            use: function (next) {
+                video.removeEventListener('ended', onEnded);
+                video = next;
+                video.addEventListener('ended', onEnded);
+            },
+        };
+    }
+};
@@ -0,0 +1,171 @@
+/* Client-side mystery frog quiz.
+   The page embeds the frog list once (#quiz-data); picking rounds, checking
+   answers, highlighting and "Try Again" all happen here in the browser.
+   Score events are queued and sent in batches (data.events, live server only).
+   The next round's video is prefetched into a hidden standby <video>, which
+   is swapped in on "Try Again". Videos load through FrogStream (stream.js),
+   or as audio over a still spectrogram in listen mode (listen.js). */
+(function () {
+    const data = JSON.parse(document.getElementById('quiz-data').textContent);
+    let video = document.getElementById('quiz-video');
+    let standby = document.getElementById('quiz-video-next');
+    const options = document.getElementById('quiz-options');
+    const result = document.getElementById('quiz-result');
+    const tryAgain = document.getElementById('quiz-try-again');
+    // listen mode (listen.js): audio over still spectrograms instead of the videos
+    if (FrogListen.enabled() && data.frogs[0].listen) {
+        video = FrogListen.replace(video);
+        standby = FrogListen.replace(standby);
+    }
+    const player = FrogPlayer.bind(video, document.getElementById('play-button'),
+                                   document.getElementById('play-icon'), window.QUIZ_ICONS);
+
+    let current = null;
+    let revealed = false;
+    let roundId = 0;
+
+    // --- Batched score events ---
+    const BATCH_SIZE = 10;
+    let pending = [];
+
+    function flushEvents() {
+        if (!data.events || pending.length === 0) return;
+        const body = JSON.stringify(pending);
+        pending = [];
+        const blob = new Blob([body], { type: 'application/json' });
+        if (!(navigator.sendBeacon && navigator.sendBeacon(data.events, blob))) {
+            fetch(data.events, { method: 'POST', body: blob, keepalive: true }).catch(function () {});
+        }
+    }
+
+    function queueEvent(event) {
+        if (!data.events) return;
+        pending.push(event);
+        if (pending.length >= BATCH_SIZE) flushEvents();
+    }
+
+    // send what is left when the tab is hidden or closed
+    document.addEventListener('visibilitychange', function () {
+        if (document.visibilityState === 'hidden') flushEvents();
+    });
+    window.addEventListener('pagehide', flushEvents);
+
+    // seeded deck of rounds (rounds.js); ?seed=N replays a session exactly
+    const seedParam = new URLSearchParams(location.search).get('seed');
+    const deck = new QuizRounds.RoundDeck(data.frogs.length,
+        seedParam !== null ? Number(seedParam) : QuizRounds.randomSeed(), data.options);
+
+    function toFrogs(round) {
+        return {
+            frog: data.frogs[round.answer],
+            options: round.options.map(function (i) { return data.frogs[i]; }),
+        };
+    }
+
+    function nextRound() { return toFrogs(deck.next()); }
+
+    // --- Next round prefetch ---
+    // callback once the element has its first frame decoded (readyState 2+)
+    function whenPlayable(element, id, callback) {
+        function ready() { if (id === roundId) requestAnimationFrame(callback); }
+        if (element.readyState >= 2) ready();
+        else element.addEventListener('loadeddata', ready, { once: true });
+    }
+
+    function prefetch(frog) {
+        if (standby.dataset.frog === frog.id) return;
+        standby.dataset.frog = frog.id;
+        FrogListen.load(standby, frog);
+    }
+
+    // what is on screen for a media element: the video, or its listen view
+    function shown(element) { return element.listenView || element; }
+
+    function swapVideos() {
+        // the prefetched element takes the visible slot, the old one becomes standby
+        video.pause();
+        shown(video).classList.add('standby');
+        shown(standby).classList.remove('standby');
+        const previous = video;
+        video = standby;
+        standby = previous;
+        player.use(video);
+    }
+
+    function showRound(round) {
+        current = round.frog;
+        revealed = false;
+        result.textContent = '';
+        result.className = 'quiz-result';
+
+        // reset video (paused, muted until play is pressed)
+        player.reset();
+        const prefetched = standby.dataset.frog === current.id;
+        if (prefetched) {
+            swapVideos();
+        } else {
+            video.dataset.frog = current.id;
+            FrogListen.load(video, current);
+        }
+        video.muted = true;
+
+        // build all option buttons in one DOM update
+        const fragment = document.createDocumentFragment();
+        round.options.forEach(function (frog) {
+            const button = document.createElement('button');
+            button.className = 'quiz-option';
+            button.textContent = frog.name;
+            button.dataset.frog = frog.id;
+            fragment.appendChild(button);
+        });
+        options.replaceChildren(fragment);
+
+        // once this round can play, start loading the next one
+        const id = ++roundId;
+        whenPlayable(video, id, function () { prefetch(toFrogs(deck.peek()).frog); });
+        return { id: id, prefetched: prefetched };
+    }
+
+    function checkAnswer(selectedId, tapTime) {
+        if (revealed) return;
+        revealed = true;
+        const correct = selectedId === current.id;
+
+        // Visual feedback for all buttons (matching the Kivy app)
+        options.querySelectorAll('.quiz-option').forEach(function (button) {
+            const id = button.dataset.frog;
+            if (id === selectedId) button.classList.add('selected');
+            if (id === current.id) button.classList.add('correct');
+            else if (id !== selectedId) button.classList.add('faded');
+        });
+
+        result.textContent = correct
+            ? '✅ Correct! It\'s the ' + current.label
+            : '❌ Oops! It was the ' + current.label;
+        result.className = 'quiz-result ' + (correct ? 'is-correct' : 'is-wrong');
+
+        // tap-to-feedback: from the tap to the frame that shows the result
+        const frog = current.id;
+        requestAnimationFrame(function () {
+            queueEvent({ frog: frog, picked: selectedId,
+                         feedback_ms: Math.round((performance.now() - tapTime) * 10) / 10 });
+        });
+    }
+
+    // one listener for all option buttons
+    options.addEventListener('click', function (e) {
+        const button = e.target.closest('.quiz-option');
+        if (button) checkAnswer(button.dataset.frog, e.timeStamp);
+    });
+    // "Try Again" -> first playable frame of the new call
+    tryAgain.addEventListener('click', function (e) {
+        const start = e.timeStamp;
+        const shown = showRound(nextRound());
+        whenPlayable(video, shown.id, function () {
+            queueEvent({ swap_ms: Math.round((performance.now() - start) * 10) / 10,
+                         prefetched: shown.prefetched });
+        });
+    });
+
+    showRound(nextRound());
+})();
@@ -0,0 +1,77 @@
+/* Seeded quiz round decks - a port of quiz_rounds.py.
+   Same PRNG (mulberry32) and the same draws, so a given seed yields the
+   same rounds in the browser and in RoundDeck(FROGS, seed). Works on
+   catalog indexes; quiz.js maps them to frogs. */
+window.QuizRounds = (function () {
+    function Mulberry32(seed) {
+        let state = seed >>> 0;
+        this.random = function () {
+            state = (state + 0x6D2B79F5) >>> 0;
+            const a = state;
+            let t = Math.imul(a ^ (a >>> 15), 1 | a);
+            t = ((t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t) >>> 0;
+            return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+        };
+    }
+    Mulberry32.prototype.below = function (n) { return Math.floor(this.random() * n); };
+    Mulberry32.prototype.shuffle = function (items) {
+        for (let i = items.length - 1; i > 0; i--) {
+            const j = this.below(i + 1);
+            const swap = items[i]; items[i] = items[j]; items[j] = swap;
+        }
+        return items;
+    };
+
+    function RoundDeck(count, seed, options, cycles) {
+        this.count = count;
+        this.seed = seed >>> 0;
+        this.options = Math.max(1, Math.min(options, count));
+        this.cycles = cycles || 4;
+        this.rng = new Mulberry32(this.seed);
+        this.rounds = [];
+        this.position = 0;
+        this.last = null;
+        this.fill();
+    }
+
+    RoundDeck.prototype.fill = function () {
+        const rounds = [];
+        const indexes = Array.from({ length: this.count }, function (_, i) { return i; });
+        for (let c = 0; c < this.cycles; c++) {
+            const order = this.rng.shuffle(indexes.slice());
+            // no back-to-back repeat where two shuffles meet
+            if (this.count > 1 && order[0] === this.last) {
+                order[0] = order[1]; order[1] = this.last;
+            }
+            for (const answer of order) {
+                const others = this.rng.shuffle(indexes.filter(function (i) { return i !== answer; }));
+                const picks = others.slice(0, this.options - 1);
+                picks.push(answer);
+                this.rng.shuffle(picks);
+                rounds.push({ answer: answer, options: picks });
+            }
+            this.last = order[order.length - 1];
+        }
+        this.rounds = rounds;
+        this.position = 0;
+    };
+
+    // O(1): the next precomputed round (a new deck is built when one runs out)
+    RoundDeck.prototype.next = function () {
+        const round = this.peek();
+        this.position++;
+        return round;
+    };
+
+    // the round next() will return, without consuming it (video prefetch)
+    RoundDeck.prototype.peek = function () {
+        if (this.position === this.rounds.length) this.fill();
+        return this.rounds[this.position];
+    };
+
+    function randomSeed() {
+        return crypto.getRandomValues(new Uint32Array(1))[0];
+    }
+
+    return { Mulberry32: Mulberry32, RoundDeck: RoundDeck, randomSeed: randomSeed };
+})();
@@ -0,0 +1,210 @@
+/* Adaptive bitrate playback for the spectrogram videos.
+   FrogStream.load(video, {video, hls, dash}) plays the HLS ladder built by
+   python -m asset_build web (240p / 480p / 720p, segments every 2s):
+   natively where the browser plays HLS (Safari, iOS), otherwise through
+   Media Source Extensions driven by the same playlists, fetching byte
+   ranges of the rungs and switching between segments. The measured
+   throughput is remembered across pages (localStorage), so the next video
+   starts on the right rung. Without a ladder, MSE or on any error the
+   original MP4 plays as before. */
+window.FrogStream = (function () {
+    const STORE_KEY = 'frogStream.kbps';
+    const SAFETY = 0.8;   // only pick rungs below 80% of the estimated throughput
+    const ALPHA = 0.5;    // weight of the newest sample in the moving average
+
+    function loadEstimate() {
+        let kbps = 0;
+        try { kbps = Number(localStorage.getItem(STORE_KEY)) || 0; } catch (e) {}
+        if (!kbps && navigator.connection && navigator.connection.downlink) {
+            kbps = navigator.connection.downlink * 1000;
+        }
+        return kbps;
+    }
+
+    function saveEstimate(kbps) {
+        try { localStorage.setItem(STORE_KEY, String(Math.round(kbps))); } catch (e) {}
+    }
+
+    // --- Playlists (asset_build/streams.py) ---
+    function attributes(line) {
+        const result = {};
+        const pattern = /([A-Z0-9-]+)=("[^"]*"|[^,]*)/g;
+        let match;
+        while ((match = pattern.exec(line)) !== null) result[match[1]] = match[2].replace(/"/g, '');
+        return result;
+    }
+
+    function byteRange(value) {
+        const parts = value.split('@');
+        return { offset: Number(parts[1]), length: Number(parts[0]) };
+    }
+
+    function parseMaster(text, base) {
+        const rungs = [];
+        const lines = text.split('\n');
+        lines.forEach(function (line, i) {
+            if (line.indexOf('#EXT-X-STREAM-INF:') !== 0) return;
+            const attrs = attributes(line);
+            rungs.push({ kbps: Number(attrs.BANDWIDTH) / 1000, codecs: attrs.CODECS,
+                         url: new URL(lines[i + 1].trim(), base).href });
+        });
+        return rungs.sort(function (a, b) { return a.kbps - b.kbps; });
+    }
+
+    function parseMedia(text, base) {
+        const playlist = { init: null, segments: [] };
+        let duration = 0;
+        let range = null;
+        text.split('\n').forEach(function (line) {
+            line = line.trim();
+            if (line.indexOf('#EXT-X-MAP:') === 0) {
+                const attrs = attributes(line);
+                playlist.init = Object.assign({ url: new URL(attrs.URI, base).href }, byteRange(attrs.BYTERANGE));
+            } else if (line.indexOf('#EXTINF:') === 0) {
+                duration = parseFloat(line.slice(8));
+            } else if (line.indexOf('#EXT-X-BYTERANGE:') === 0) {
+                range = byteRange(line.slice(17));
+            } else if (line && line[0] !== '#') {
+                playlist.segments.push(Object.assign({ url: new URL(line, base).href, duration: duration }, range));
+            }
+        });
+        return playlist;
+    }
+
+    function fetchText(url) {
+        return fetch(url).then(function (response) {
+            if (!response.ok) throw new Error(url + ': ' + response.status);
+            return response.text();
+        });
+    }
+
+    function fetchRange(url, part) {
+        const headers = { Range: 'bytes=' + part.offset + '-' + (part.offset + part.length - 1) };
+        return fetch(url, { headers: headers }).then(function (response) {
+            if (!response.ok) throw new Error(url + ': ' + response.status);
+            return response.arrayBuffer();
+        });
+    }
+
+    // highest rung that fits the estimate, the lowest one when none does
+    function pickRung(rungs, kbps) {
+        let index = 0;
+        rungs.forEach(function (rung, i) { if (rung.kbps <= kbps * SAFETY) index = i; });
+        return index;
+    }
+
+    // --- Sessions: one per <video>, replaced by the next load() ---
+    function stop(video) {
+        const session = video._frogStream;
+        if (!session) return;
+        session.stopped = true;
+        if (session.objectUrl) URL.revokeObjectURL(session.objectUrl);
+        video._frogStream = null;
+    }
+
+    function progressive(video, source) {
+        stop(video);
+        video.src = source.video;
+        video.load();
+    }
+
+    function mimeType(codecs) { return 'video/mp4; codecs="' + codecs + '"'; }
+
+    function streamMse(video, source, session) {
+        let rungs = null;
+        const playlists = {};
+        function playlist(index) {
+            if (!playlists[index]) {
+                playlists[index] = fetchText(rungs[index].url).then(function (text) {
+                    return parseMedia(text, rungs[index].url);
+                });
+            }
+            return playlists[index];
+        }
+
+        return fetchText(source.hls).then(function (text) {
+            rungs = parseMaster(text, new URL(source.hls, location.href).href);
+            if (!rungs.length || !rungs.every(function (rung) { return MediaSource.isTypeSupported(mimeType(rung.codecs)); })) {
+                throw new Error('unsupported ladder');
+            }
+            let rung = pickRung(rungs, session.kbps);
+            return playlist(rung).then(function (first) {
+                if (session.stopped) return;
+                const mediaSource = new MediaSource();
+                session.objectUrl = URL.createObjectURL(mediaSource);
+                video.src = session.objectUrl;
+                return new Promise(function (resolve) {
+                    mediaSource.addEventListener('sourceopen', resolve, { once: true });
+                }).then(function () {
+                    const buffer = mediaSource.addSourceBuffer(mimeType(rungs[rung].codecs));
+                    mediaSource.duration = first.segments.reduce(function (sum, s) { return sum + s.duration; }, 0);
+                    function append(data) {
+                        return new Promise(function (resolve, reject) {
+                            buffer.addEventListener('updateend', resolve, { once: true });
+                            buffer.addEventListener('error', reject, { once: true });
+                            buffer.appendBuffer(data);
+                        });
+                    }
+                    let loaded = -1;   // rung whose init segment is in the buffer
+                    function next(index) {
+                        if (session.stopped) return;
+                        if (index >= first.segments.length) {
+                            mediaSource.endOfStream();
+                            return;
+                        }
+                        return playlist(rung).then(function (media) {
+                            let work = Promise.resolve();
+                            if (loaded !== rung) {
+                                const target = rung;
+                                if (loaded !== -1 && buffer.changeType) buffer.changeType(mimeType(rungs[target].codecs));
+                                work = fetchRange(media.init.url, media.init).then(append).then(function () { loaded = target; });
+                            }
+                            const segment = media.segments[index];
+                            return work.then(function () {
+                                const start = performance.now();
+                                return fetchRange(segment.url, segment).then(function (data) {
+                                    const seconds = Math.max((performance.now() - start) / 1000, 0.001);
+                                    const sample = data.byteLength * 8 / 1000 / seconds;
+                                    session.kbps = session.kbps ? ALPHA * sample + (1 - ALPHA) * session.kbps : sample;
+                                    saveEstimate(session.kbps);
+                                    if (session.stopped) return;
+                                    return append(data);
+                                });
+                            });
+                        }).then(function () {
+                            rung = pickRung(rungs, session.kbps);
+                            return next(index + 1);
+                        });
+                    }
+                    return next(0);
+                });
+            });
+        });
+    }
+
+    function load(video, source) {
+        stop(video);
+        video.preload = 'auto';
+        if (!source.hls) return progressive(video, source);
+        if (video.canPlayType('application/vnd.apple.mpegurl')) {
+            const session = { stopped: false, objectUrl: null };
+            video._frogStream = session;
+            // the ladder is precached with the pages (service_worker.py); any error: the MP4
+            video.addEventListener('error', function () {
+                if (!session.stopped) progressive(video, source);
+            }, { once: true });
+            video.src = source.hls;
+            video.load();
+            return;
+        }
+        if (!window.MediaSource || !window.URL || !window.fetch) return progressive(video, source);
+        const session = { stopped: false, objectUrl: null, kbps: loadEstimate() };
+        video._frogStream = session;
+        streamMse(video, source, session).catch(function () {
+            // anything unexpected: the original MP4 always works
+            if (!session.stopped) progressive(video, source);
+        });
+    }
+
+    return { load: load, pickRung: pickRung, parseMaster: parseMaster, parseMedia: parseMedia };
+})();
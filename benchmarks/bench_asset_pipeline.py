@@ -0,0 +1,77 @@
+"""
+Asset Pipeline Benchmark (asset_build/pipeline.py)
+Builds the srcset variants of the frog photos (the variants step of
+python -m asset_build web) into a temporary folder three ways:
+
+- serial: encode_image for every variant one after another, the way the
+  old compress_assets.py ran
+- parallel: the same jobs in the process pool, cold cache
+- rebuild: again with nothing changed (warm cache)
+
+and prints per-file wall time plus the speedup of each run over serial.
+Videos are not included (ffmpeg jobs go through the same pool and cache).
+
+Usage: python benchmarks/bench_asset_pipeline.py [images] [workers]
+"""
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from asset_build.build import variant_jobs  # noqa: E402
+from asset_build.encoders import encode_image  # noqa: E402
+from asset_build.pipeline import BuildCache, default_workers, run  # noqa: E402
+from asset_build.profiles import PROFILES  # noqa: E402
+
+
+def main():
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else default_workers()
+    sources = sorted((ROOT / 'assets').glob('*.png'))[:images]
+    work = Path(tempfile.mkdtemp())
+    try:
+        jobs = [job for job in variant_jobs(ROOT / 'assets', work, PROFILES['web']['variants'])
+                if job.source in sources]
+        print(f"{len(jobs)} variants of {len(sources)} image(s), {workers} worker(s)\n")
+
+        per_file = {}
+        (work / 'serial').mkdir()
+        start = time.perf_counter()
+        for job in jobs:
+            job_start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                encode_image(job.source, work / 'serial' / job.output.name, **job.settings)
+            per_file[job.output.name] = [time.perf_counter() - job_start]
+        serial = time.perf_counter() - start
+
+        cache = BuildCache(work / 'cache')
+        timings = {'serial': serial}
+        for name in ('parallel', 'rebuild'):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = run(jobs, cache=BuildCache(work / 'cache') if name == 'rebuild' else cache,
+                              workers=workers)
+            timings[name] = time.perf_counter() - start
+            for result in results:
+                per_file[Path(result['output']).name].append(result['seconds'])
+            statuses = {result['status'] for result in results}
+            print(f"{name}: {', '.join(sorted(statuses))}")
+
+        print(f"\n{'variant':<28}{'serial s':>10}{'pool s':>9}{'rebuild s':>11}")
+        for name, seconds in per_file.items():
+            print(f"{name:<28}" + ''.join(f"{value:>10.3f}" for value in seconds))
+        print()
+        for name, seconds in timings.items():
+            print(f"{name:<10}{seconds:>9.3f}s  {serial / seconds:>7.1f}x")
+        print(f"\n✓ Rebuild with nothing changed: {timings['rebuild'] * 1000:.0f} ms")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Response Compression Benchmark
+Transfer size and CPU cost per response for what a visitor downloads:
+the pre-rendered pages, the shared js/css bundle, manifest.json and the
+NiceGUI / Vue / Quasar bundles a frog page loads.
+
+For each body: identity size, then size and milliseconds per response for
+gzip -6 / -9 and (when the brotli package is installed) br 4 / 11. The
+last columns compare NiceGUI's default (gzip -9 on every request) with
+CompressionMiddleware serving the same request again from its ETag cache.
+
+Usage: python benchmarks/bench_compression.py [repeats]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import nicegui
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from asset_manifest import AssetManifest  # noqa: E402
+from compression import CompressionMiddleware, brotli, compress  # noqa: E402
+from static_pages import STATIC_PAGES, quiz_payload, render_mystery  # noqa: E402
+
+NICEGUI_STATIC = Path(nicegui.__file__).parent / 'static'
+NICEGUI_BUNDLES = ('vue.esm-browser.prod.js', 'quasar.umd.prod.js', 'nicegui.js', 'socket.io.min.js',
+                   'quasar.important.prod.css', 'nicegui.css')
+LEVELS = [('gzip', 6), ('gzip', 9)] + ([('br', 4), ('br', 11)] if brotli is not None else [])
+
+
+def bodies(manifest):
+    """[(name, bytes)] of typical text responses"""
+    items = [(f'page {name}', render(manifest, 'avif').encode()) for name, render in STATIC_PAGES.items()]
+    items.append(('page mystery', render_mystery(manifest, 'avif', quiz_payload(manifest)).encode()))
+    for logical in ('js/app.js', 'js/quiz.js', 'js/rounds.js', 'css/pages.css'):
+        items.append((logical, (ROOT / 'assets' / logical).read_bytes()))
+    items.append(('manifest.json', (ROOT / 'manifest.json').read_bytes()))
+    for name in NICEGUI_BUNDLES:
+        if (NICEGUI_STATIC / name).is_file():
+            items.append((name, (NICEGUI_STATIC / name).read_bytes()))
+    return items
+
+
+def time_per_call(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return (time.perf_counter() - start) / repeats * 1000, result
+
+
+def cached_response_ms(body, repeats):
+    """ms per request for a repeated ETag'd response through CompressionMiddleware"""
+    async def app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/javascript'), (b'etag', b'"bench"'),
+                                (b'content-length', str(len(body)).encode())]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    middleware = CompressionMiddleware(app)
+    scope = {'type': 'http', 'method': 'GET', 'path': '/bench', 'headers': [(b'accept-encoding', b'gzip')]}
+
+    async def send(message):
+        pass
+
+    async def run():
+        await middleware(scope, None, send)  # fills the cache
+        start = time.perf_counter()
+        for _ in range(repeats):
+            await middleware(scope, None, send)
+        return (time.perf_counter() - start) / repeats * 1000
+
+    return asyncio.run(run())
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    manifest = AssetManifest(ROOT / 'assets').build()
+    if brotli is None:
+        print("⚠️  brotli not installed: gzip only")
+    header = ''.join(f"{f'{encoding}-{level}':>17}" for encoding, level in LEVELS)
+    print(f"{'response':<28}{'identity':>10}{header}{'gzip-9/req':>12}{'cached/req':>12}")
+    print(f"{'':<28}{'bytes':>10}" + f"{'bytes   ms':>17}" * len(LEVELS) + f"{'ms':>12}{'ms':>12}")
+
+    totals = {'identity': 0, 'default_ms': 0.0, 'cached_ms': 0.0}
+    for level in LEVELS:
+        totals[level] = 0
+    for name, body in bodies(manifest):
+        cells = ''
+        for encoding, level in LEVELS:
+            ms, compressed = time_per_call(lambda: compress(body, encoding, level), repeats)
+            totals[(encoding, level)] += len(compressed)
+            cells += f"{len(compressed):>10,} {ms:>6.2f}"
+        default_ms, _ = time_per_call(lambda: compress(body, 'gzip', 9), repeats)
+        cached_ms = cached_response_ms(body, repeats * 20)
+        totals['identity'] += len(body)
+        totals['default_ms'] += default_ms
+        totals['cached_ms'] += cached_ms
+        print(f"{name:<28}{len(body):>10,}{cells}{default_ms:>12.3f}{cached_ms:>12.3f}")
+
+    cells = ''.join(f"{totals[level]:>10,} {'':>6}" for level in LEVELS)
+    print(f"{'total':<28}{totals['identity']:>10,}{cells}{totals['default_ms']:>12.3f}{totals['cached_ms']:>12.3f}")
+    best = min(totals[level] for level in LEVELS)
+    print(f"\n✓ Smallest encoding sends {best / totals['identity']:.1%} of the identity bytes")
+    print(f"✓ CPU per repeat visit: {totals['default_ms']:.1f} ms (gzip -9 per request) "
+          f"-> {totals['cached_ms']:.2f} ms (compressed once per ETag)")
+
+
+if __name__ == '__main__':
+    main()
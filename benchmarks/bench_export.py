@@ -0,0 +1,103 @@
+"""
+Static Export Benchmark
+Exports the site (python main_web.py --export) to a temporary folder and
+reports the bytes per page: the HTML itself, gzipped, and the assets the
+page loads (css/js and images). Images are counted twice: as the PNG
+<img src> fallback an old browser takes, and as the AVIF <source> of the
+same width a current browser picks. Videos are listed separately since
+they only load when play is pressed.
+
+Then serves the export with the stdlib file server and measures page
+requests/sec, i.e. what a visitor costs once Python rendering is gone.
+A real deployment (nginx, Caddy, a CDN) will be much faster than this.
+
+Usage: python benchmarks/bench_export.py
+"""
+import gzip
+import re
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from asset_manifest import AssetManifest  # noqa: E402
+from site_export import export_site  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+REQUESTS = 500
+URL_ATTR = re.compile(r'src="(/(?:assets|video)/[^"]+)"|href="(/assets/[^"]+\.css)"')
+VARIANT_URL = re.compile(r'/assets/variants/(?P<stem>.+)\.w(?P<width>\d+)\.[0-9a-f]+\.png$')
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def avif_for(manifest, url):
+    """The AVIF variant a browser picks instead of a PNG fallback, if any"""
+    match = VARIANT_URL.match(url)
+    if match:
+        for width, logical in manifest.variants.get((match['stem'], 'avif'), []):
+            if width == int(match['width']):
+                return manifest.url(logical)
+    return url
+
+
+def referenced_bytes(out_dir, manifest, html):
+    """(png fallback bytes, avif bytes, video bytes) of the URLs the page loads"""
+    png, avif, videos = 0, 0, 0
+    urls = {src or href for src, href in URL_ATTR.findall(html)}
+    for url in urls:
+        size = (out_dir / unquote(url).lstrip('/')).stat().st_size
+        if url.startswith('/video/'):
+            videos += size
+            continue
+        png += size
+        avif += (out_dir / unquote(avif_for(manifest, url)).lstrip('/')).stat().st_size
+    return png, avif, videos
+
+
+def requests_per_second(port, path, count=REQUESTS):
+    url = f'http://127.0.0.1:{port}{path}'
+    start = time.perf_counter()
+    for _ in range(count):
+        with urllib.request.urlopen(url) as response:
+            response.read()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    manifest = AssetManifest(ROOT / 'assets').build()
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        report = export_site(out_dir, manifest, ROOT / 'manifest.json')
+
+        print(f"\n{'page':<45} {'html':>8} {'gzip':>8} {'png':>9} {'avif':>9} {'video':>9}")
+        print('-' * 93)
+        for page_path, size in report.items():
+            html = (out_dir / page_path).read_text(encoding='utf-8')
+            gz = len(gzip.compress(html.encode('utf-8')))
+            png, avif, videos = referenced_bytes(out_dir, manifest, html)
+            print(f"{page_path:<45} {size / 1024:>6.1f}KB {gz / 1024:>6.1f}KB "
+                  f"{png / 1024:>7.1f}KB {avif / 1024:>7.1f}KB {videos / 1024:>7.1f}KB")
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=str(out_dir)))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        try:
+            print(f"\nstdlib file server, {REQUESTS} sequential requests:")
+            for path in ('/', '/mystery/index.html', '/frog/Growling%20Grass%20Frog/index.html'):
+                print(f"  {path:<45} {requests_per_second(port, path):>8.0f} req/s")
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
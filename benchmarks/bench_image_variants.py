@@ -0,0 +1,68 @@
+"""
+Image Variant Benchmark
+Bytes the home page grid downloads with the original PNGs versus the
+srcset variants (python -m asset_build web), per negotiated format and
+device pixel ratio, plus the transfer time of the home grid on a phone link.
+
+LCP itself needs a real browser (Lighthouse / WebPageTest); the transfer
+time of the largest tile is the part of LCP this change removes.
+
+Usage: python benchmarks/bench_image_variants.py
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from asset_manifest import AssetManifest  # noqa: E402
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+HOME_IMAGES = ['App_overview.png', 'GGF.png', 'SBTF.png', 'PTF.png', 'PBF.png',
+               'CF.png', 'CSFT.png', 'ESBF.png', 'SMF.png', 'UnknownFrog.png']
+TILE_WIDTH = 250
+LINK_MBIT = 10  # typical 4G downlink
+
+
+def variant_bytes(manifest, name, image_format, needed_width):
+    """Size of the variant a browser would pick for needed_width"""
+    stem = Path(name).stem
+    widths = manifest.variants.get((stem, image_format))
+    if not widths:
+        return (ASSETS_DIR / name).stat().st_size
+    logical = next((logical for width, logical in widths if width >= needed_width), widths[-1][1])
+    return (ASSETS_DIR / logical).stat().st_size
+
+
+def transfer_ms(total_bytes):
+    return total_bytes * 8 / (LINK_MBIT * 1_000_000) * 1000
+
+
+def main():
+    manifest = AssetManifest(ASSETS_DIR).build()
+    if not manifest.variants:
+        print("✗ No variants found - run: python -m asset_build web")
+        return
+
+    original = sum((ASSETS_DIR / name).stat().st_size for name in HOME_IMAGES)
+    largest_original = max((ASSETS_DIR / name).stat().st_size for name in HOME_IMAGES)
+
+    print(f"\n{'='*72}")
+    print("HOME PAGE IMAGE BYTES")
+    print(f"{'='*72}")
+    print(f"{'Variant':<22}{'KB':>10}{'saved':>10}{'grid @4G (ms)':>16}{'LCP tile (ms)':>14}")
+    print("-" * 72)
+    print(f"{'original PNG':<22}{original / 1024:>10.0f}{'-':>10}"
+          f"{transfer_ms(original):>16.0f}{transfer_ms(largest_original):>14.0f}")
+
+    for dpr in (1, 2):
+        for image_format in ('avif', 'webp', 'png'):
+            sizes = [variant_bytes(manifest, name, image_format, TILE_WIDTH * dpr)
+                     for name in HOME_IMAGES]
+            total = sum(sizes)
+            saved = (1 - total / original) * 100
+            label = f"{image_format} @{dpr}x"
+            print(f"{label:<22}{total / 1024:>10.0f}{saved:>9.1f}%"
+                  f"{transfer_ms(total):>16.0f}{transfer_ms(max(sizes)):>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Multi-worker Scaling Benchmark
+Starts multiworker.py with 1, 2 and 4 workers and drives it with keep-alive
+HTTP clients (several client processes, each connection a visitor that
+keeps the worker cookie the sticky router gives it, like a browser).
+Reports requests/sec, p50/p99 latency and the speedup over one worker.
+
+Scaling can only be near-linear when the machine has at least as many
+free cores as workers + load generator processes; the CPU count is printed
+with the results.
+
+Usage: python benchmarks/bench_multiworker.py [seconds per run]
+"""
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from asset_manifest import AssetManifest  # noqa: E402
+from multiworker import wait_for_port  # noqa: E402
+
+WORKER_COUNTS = (1, 2, 4)
+CONNECTIONS = 64
+CLIENT_PROCESSES = 2
+PORT = 8790
+
+
+def free_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def visitor_paths():
+    """A page-load mix: pre-rendered pages, manifest, one hashed asset, quiz stats"""
+    manifest = AssetManifest(ROOT / 'assets').build()
+    return ['/', '/mystery', '/instructions', '/app_info', '/manifest.json',
+            manifest.url('js/app.js'), '/api/quiz/stats']
+
+
+async def connection(port, paths, deadline, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    cookie = ''
+    try:
+        while time.perf_counter() < deadline:
+            path = random.choice(paths)
+            start = time.perf_counter()
+            writer.write(f'GET {path} HTTP/1.1\r\nHost: localhost\r\n{cookie}\r\n'.encode())
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = 0
+            for line in head.split(b'\r\n'):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+                elif line.lower().startswith(b'set-cookie:'):
+                    cookie = f"Cookie: {line.split(b':', 1)[1].split(b';')[0].strip().decode()}\r\n"
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def client_process(args):
+    port, paths, seconds, connections = args
+
+    async def run():
+        latencies = []
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(connection(port, paths, deadline, latencies) for _ in range(connections)))
+        return latencies
+
+    return asyncio.run(run())
+
+
+def run_load(port, paths, seconds):
+    per_process = CONNECTIONS // CLIENT_PROCESSES
+    with Pool(CLIENT_PROCESSES) as pool:
+        results = pool.map(client_process, [(port, paths, seconds, per_process)] * CLIENT_PROCESSES)
+    latencies = sorted(latency for result in results for latency in result)
+    return latencies
+
+
+def start_server(workers, port):
+    env = {**os.environ, 'PORT': str(port), 'WEB_CONCURRENCY': str(workers),
+           'WORKER_BASE_PORT': str(port + 100)}
+    process = subprocess.Popen([sys.executable, str(ROOT / 'multiworker.py')], env=env, cwd=ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # ready once the router (or the single worker) answers
+    if not wait_for_port(port):
+        process.kill()
+        raise RuntimeError(f'server with {workers} workers did not start')
+    if workers > 1:
+        for worker_port in range(port + 100, port + 100 + workers):
+            wait_for_port(worker_port)
+    time.sleep(1)
+    return process
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def port_is_free(port):
+    with socket.socket() as sock:
+        return sock.connect_ex(('127.0.0.1', port)) != 0
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    paths = visitor_paths()
+    print(f"CPUs available: {free_cpus()}, {CONNECTIONS} keep-alive connections "
+          f"from {CLIENT_PROCESSES} client processes, {seconds:.0f}s per run")
+    print(f"\n{'workers':>7} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'speedup':>8}")
+    baseline = None
+    for index, workers in enumerate(WORKER_COUNTS):
+        port = PORT + index * 10
+        if not port_is_free(port):
+            print(f"✗ port {port} is busy")
+            continue
+        process = start_server(workers, port)
+        try:
+            run_load(port, paths, 1)  # warm-up: page cache, imports
+            latencies = run_load(port, paths, seconds)
+        finally:
+            stop_server(process)
+        rate = len(latencies) / seconds
+        baseline = baseline or rate
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(f"{workers:>7} {rate:>10,.0f} {p50:>8.1f} {p99:>8.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Quiz Round Generator Benchmark
+Cost per round of the old per-round random.choice + random.sample +
+random.shuffle versus RoundDeck.next_round(), with deck building included
+and from a prebuilt deck, and a check that it keeps up with 10k rounds/sec.
+
+Usage: python benchmarks/bench_quiz_rounds.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from frog_catalog import FROGS  # noqa: E402
+from quiz_rounds import RoundDeck  # noqa: E402
+
+ROUNDS = 100_000
+TARGET_PER_SEC = 10_000
+
+
+def old_round():
+    """What mystery_frog_page() / MysteryScreen.new_quiz did per round"""
+    frog = random.choice(FROGS)
+    options = random.sample([f for f in FROGS if f != frog], k=min(7, len(FROGS) - 1))
+    options.append(frog)
+    random.shuffle(options)
+    return frog, options
+
+
+def timed(label, next_round):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        next_round()
+    elapsed = time.perf_counter() - start
+    per_sec = ROUNDS / elapsed
+    print(f"  {label:<38} {elapsed / ROUNDS * 1e6:>7.2f} µs/round  {per_sec:>12,.0f} rounds/s")
+    return per_sec
+
+
+def main():
+    print(f"Quiz rounds, {len(FROGS)} frogs, {ROUNDS:,} rounds")
+    timed('random.choice/sample/shuffle', old_round)
+    deck = RoundDeck(FROGS, seed=1)
+    per_sec = timed('RoundDeck.next_round (incl. refills)', deck.next_round)
+    # a deck big enough for the whole run: the O(1) part on its own
+    deck = RoundDeck(FROGS, seed=1, cycles=ROUNDS // len(FROGS) + 1)
+    timed('RoundDeck.next_round (prebuilt deck)', deck.next_round)
+
+    start = time.perf_counter()
+    for seed in range(1000):
+        RoundDeck(FROGS, seed=seed)
+    print(f"  {'new session deck (32 rounds)':<38} {(time.perf_counter() - start) / 1000 * 1e6:>7.1f} µs")
+
+    # properties the quiz relies on
+    deck = RoundDeck(FROGS, seed=42)
+    previous = None
+    for _ in range(10_000):
+        round_ = deck.next_round()
+        assert round_.answer is not previous and round_.answer in round_.options
+        previous = round_.answer
+    replay_a, replay_b = RoundDeck(FROGS, seed=7), RoundDeck(FROGS, seed=7)
+    assert all(replay_a.next_round() == replay_b.next_round() for _ in range(1000))
+    print("✓ no back-to-back repeats, same seed -> same rounds")
+
+    mark = '✓' if per_sec >= TARGET_PER_SEC else '✗'
+    print(f"{mark} {per_sec:,.0f} rounds/s (target {TARGET_PER_SEC:,})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Server Profile Benchmark (uvicorn_config.py)
+Starts main_web.py once per SERVER_PROFILE and loads the home page the way
+a browser does: the HTML, then its images, CSS and JS over up to 6
+keep-alive connections per visitor.
+
+- busy: every visitor reloads the page back to back -> pages/sec, page
+  load p50 / p95
+- after idle: every visitor waits longer than the compat keep-alive (5s)
+  and loads the page again -> load time and new connections per page
+  (a connection the server closed while idle has to be re-opened)
+
+h2-front is measured directly here (no front in between); with Caddy in
+front, browsers multiplex the fan-out over a single HTTP/2 connection.
+
+Usage: python benchmarks/bench_server_profiles.py [visitors] [seconds]
+"""
+import asyncio
+import gzip
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from loadtest import ACCEPT_HTML, SUBRESOURCE, HttpConnection  # noqa: E402
+from multiworker import wait_for_port  # noqa: E402
+from uvicorn_config import PROFILES  # noqa: E402
+
+PORT = 8830
+BROWSER_CONNECTIONS = 6
+IDLE_SECONDS = 6
+HEADERS = {'Accept': ACCEPT_HTML, 'Accept-Encoding': 'gzip'}
+
+
+class CountingConnection(HttpConnection):
+    """HttpConnection that re-opens (and counts) connections the server closed"""
+
+    def __init__(self, host, port, counter):
+        super().__init__(host, port)
+        self.counter = counter
+
+    async def request(self, method, path, headers=None, body=b''):
+        if self.writer is not None and self.reader.at_eof():
+            await self.close()  # closed by the server while idle
+        if self.writer is None:
+            self.counter[0] += 1
+        return await super().request(method, path, headers, body)
+
+
+class Browser:
+    def __init__(self, port):
+        self.opened = [0]
+        self.requests = 0
+        self.connections = [CountingConnection('127.0.0.1', port, self.opened) for _ in range(BROWSER_CONNECTIONS)]
+
+    async def load_home(self):
+        """Seconds to load / and everything it references"""
+        start = time.perf_counter()
+        _, headers, html = await self.connections[0].request('GET', '/', HEADERS)
+        if headers.get('content-encoding') == 'gzip':
+            html = gzip.decompress(html)
+        queue = list(dict.fromkeys(SUBRESOURCE.findall(html.decode('utf-8'))))
+        self.requests += 1 + len(queue)
+
+        async def fetch(connection):
+            while queue:
+                await connection.request('GET', queue.pop(0), HEADERS)
+
+        await asyncio.gather(*(fetch(connection) for connection in self.connections))
+        return time.perf_counter() - start
+
+    async def close(self):
+        for connection in self.connections:
+            await connection.close()
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)] * 1000
+
+
+async def measure(port, visitors, seconds):
+    browsers = [Browser(port) for _ in range(visitors)]
+    await asyncio.gather(*(browser.load_home() for browser in browsers))  # warm-up
+
+    loads = []
+    requests_before = sum(browser.requests for browser in browsers)
+    deadline = time.perf_counter() + seconds
+
+    async def busy(browser):
+        while time.perf_counter() < deadline:
+            loads.append(await browser.load_home())
+
+    await asyncio.gather(*(busy(browser) for browser in browsers))
+    requests = sum(browser.requests for browser in browsers) - requests_before
+
+    await asyncio.sleep(IDLE_SECONDS)
+    opened_before = sum(browser.opened[0] for browser in browsers)
+    idle_loads = await asyncio.gather(*(browser.load_home() for browser in browsers))
+    reopened = sum(browser.opened[0] for browser in browsers) - opened_before
+    for browser in browsers:
+        await browser.close()
+    return {
+        'pages_per_sec': len(loads) / seconds,
+        'requests_per_sec': requests / seconds,
+        'p50': percentile(loads, 0.5),
+        'p95': percentile(loads, 0.95),
+        'idle_p50': percentile(idle_loads, 0.5),
+        'reopened_per_page': reopened / visitors,
+    }
+
+
+def start_server(profile, port):
+    env = {**os.environ, 'PORT': str(port), 'HOST': '127.0.0.1', 'SERVER_PROFILE': profile}
+    process = subprocess.Popen([sys.executable, str(ROOT / 'main_web.py')], env=env, cwd=ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not wait_for_port(port):
+        process.kill()
+        raise RuntimeError(f'main_web.py ({profile}) did not start')
+    return process
+
+
+def main():
+    visitors = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"{visitors} visitors x {BROWSER_CONNECTIONS} connections, {seconds:.0f}s busy, "
+          f"then {IDLE_SECONDS}s idle and one more page each")
+    print(f"\n{'profile':<10}{'pages/s':>9}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'idle p50':>10}{'reopened/page':>15}")
+    for index, profile in enumerate(PROFILES):
+        port = PORT + index
+        process = start_server(profile, port)
+        try:
+            result = asyncio.run(measure(port, visitors, seconds))
+        finally:
+            process.terminate()
+            process.wait(timeout=15)
+        print(f"{profile:<10}{result['pages_per_sec']:>9.1f}{result['requests_per_sec']:>8.0f}"
+              f"{result['p50']:>9.1f}{result['p95']:>9.1f}"
+              f"{result['idle_p50']:>10.1f}{result['reopened_per_page']:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
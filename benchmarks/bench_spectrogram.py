@@ -0,0 +1,180 @@
+"""
+Spectrogram Engine Benchmark (asset_build/spectrogram.py)
+How fast a recording becomes a spectrogram video, per CPU core.
+
+- STFT: one np.fft.rfft call per frame against the batched, strided
+  stft_power (same result)
+- render stages for one image: STFT, dB, log frequency rows, columns, colormap
+- video frames/sec: a full copy per frame against redrawing only the
+  playhead columns, written to /dev/null as they would be to ffmpeg; then
+  one worker process per core, each rendering and playing a recording
+- PNG tiles/sec (512px wide)
+- the whole video with ffmpeg (encode_spectrogram_video), when installed
+
+Uses the frog calls from assets/*_resized.mp4 (decoded with ffmpeg), or a
+synthetic call when ffmpeg is not installed.
+
+Usage: python benchmarks/bench_spectrogram.py [seconds per measurement]
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from asset_build import spectrogram  # noqa: E402
+from asset_build.encoders import encode_spectrogram_video  # noqa: E402
+from asset_build.pipeline import default_workers  # noqa: E402
+from asset_build.profiles import SPECTROGRAMS  # noqa: E402
+
+np = spectrogram.np
+WIDTH, HEIGHT, FPS, N_FFT = SPECTROGRAMS['width'], SPECTROGRAMS['height'], SPECTROGRAMS['fps'], SPECTROGRAMS['n_fft']
+
+
+def synthetic_call(seconds=10.0, sample_rate=spectrogram.SAMPLE_RATE):
+    """Pulses of a 2.5-4 kHz chirp over noise, roughly like a froglet"""
+    rng = np.random.default_rng(1)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pulses = (np.sin(2 * np.pi * 3 * t) > 0.6).astype(np.float32)
+    chirp = np.sin(2 * np.pi * (2500 + 1500 * (t % 0.33)) * t)
+    return (0.5 * pulses * chirp + 0.02 * rng.standard_normal(len(t))).astype(np.float32), sample_rate
+
+
+def recordings():
+    if shutil.which('ffmpeg') is None:
+        return [synthetic_call()]
+    return [spectrogram.load_audio(path) for path in sorted((ROOT / 'assets').glob('*_resized.mp4'))]
+
+
+def timed(function, seconds):
+    """(mean seconds per call, result) over at least `seconds` of calls"""
+    calls, start = 0, time.perf_counter()
+    while True:
+        result = function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return elapsed / calls, result
+
+
+def stft_loop(samples, n_fft, hop):
+    """The straightforward version: one FFT call per frame"""
+    padded = np.pad(samples, n_fft // 2, mode='reflect')
+    window = np.hanning(n_fft + 1)[:-1].astype(np.float32)
+    columns = []
+    for start in range(0, len(padded) - n_fft + 1, hop):
+        spectrum = np.fft.rfft(padded[start:start + n_fft] * window)
+        columns.append(spectrum.real ** 2 + spectrum.imag ** 2)
+    return np.array(columns, np.float32).T
+
+
+def copy_frames(rgb, duration, fps=FPS, line_width=3):
+    """A fresh frame per time step (what frames() avoids)"""
+    width = rgb.shape[1]
+    for index in range(int(np.ceil(duration * fps))):
+        frame = rgb.copy()
+        x = min(round(index / fps / duration * (width - 1)), width - line_width)
+        frame[:, x:x + line_width] = spectrogram.PLAYHEAD_COLOR
+        yield frame
+
+
+def play(frames, sink):
+    count = 0
+    for frame in frames:
+        sink.write(frame.data)
+        count += 1
+    return count
+
+
+def video_frames(recording):
+    """Worker: render one recording and write all its frames; returns the frame count"""
+    samples, sample_rate = recording
+    rgb = spectrogram.render(samples, sample_rate, WIDTH, HEIGHT, N_FFT)
+    with open(os.devnull, 'wb') as sink:
+        return play(spectrogram.frames(rgb, len(samples) / sample_rate, FPS), sink)
+
+
+def main():
+    if np is None:
+        print("✗ numpy is not installed")
+        return
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    calls = recordings()
+    samples, sample_rate = calls[0]
+    duration = len(samples) / sample_rate
+    hop = len(samples) // WIDTH
+    print(f"\n{'='*60}")
+    print("SPECTROGRAM ENGINE BENCHMARK")
+    print(f"{'='*60}")
+    print(f"{len(calls)} recording(s), first {duration:.2f}s at {sample_rate} Hz -> {WIDTH}x{HEIGHT}, "
+          f"n_fft {N_FFT}, hop {hop}, numpy {np.__version__}\n")
+
+    # --- STFT ---
+    loop, reference = timed(lambda: stft_loop(samples, N_FFT, hop), seconds)
+    batched, power = timed(lambda: spectrogram.stft_power(samples, N_FFT, hop), seconds)
+    same = np.allclose(reference, power, rtol=1e-3, atol=1e-3 * float(power.max()))
+    print(f"STFT ({power.shape[1]} frames of {N_FFT})")
+    print(f"  per-frame rfft loop   {loop * 1000:8.1f} ms")
+    print(f"  batched, strided      {batched * 1000:8.1f} ms   {loop / batched:.1f}x  "
+          f"{'✓ same' if same else '✗ DIFFERENT'}")
+
+    # --- Render stages ---
+    lut = spectrogram.colormap_lut()
+    db_time, db = timed(lambda: spectrogram.decibels(power), seconds)
+    rows_time, rows = timed(lambda: spectrogram.log_frequency(db, sample_rate, N_FFT, HEIGHT), seconds)
+    columns_time, columns = timed(lambda: spectrogram.resize_columns(rows, WIDTH), seconds)
+    color_time, rgb = timed(lambda: spectrogram.colorize(columns, lut), seconds)
+    total = batched + db_time + rows_time + columns_time + color_time
+    print(f"\nRender stages (one {WIDTH}x{HEIGHT} image)")
+    for label, value in (('STFT', batched), ('dB', db_time), ('log frequency rows', rows_time),
+                         ('resize columns', columns_time), ('colormap lookup', color_time), ('total', total)):
+        print(f"  {label:<20}{value * 1000:8.1f} ms")
+
+    # --- Video frames ---
+    with open(os.devnull, 'wb') as sink:
+        copy_time, count = timed(lambda: play(copy_frames(rgb, duration), sink), seconds)
+        redraw_time, _ = timed(lambda: play(spectrogram.frames(rgb, duration, FPS), sink), seconds)
+    print(f"\nVideo frames ({count} frames, {WIDTH}x{HEIGHT} RGB, one core)")
+    print(f"  copy per frame        {count / copy_time:8.0f} frames/s")
+    print(f"  redraw playhead only  {count / redraw_time:8.0f} frames/s   {copy_time / redraw_time:.1f}x")
+
+    workers = default_workers()
+    jobs = calls * max(1, -(-workers * 2 // len(calls)))   # at least two recordings per worker
+    with ProcessPoolExecutor(workers) as pool:
+        list(pool.map(video_frames, calls[:workers]))   # start the workers
+        start = time.perf_counter()
+        frames_total = sum(pool.map(video_frames, jobs))
+        elapsed = time.perf_counter() - start
+    print(f"  render + frames, {workers} worker(s): {frames_total / elapsed:.0f} frames/s, "
+          f"{frames_total / elapsed / workers:.0f} frames/s per core "
+          f"({len(jobs)} recordings in {elapsed:.2f}s)")
+
+    # --- PNG tiles ---
+    def encode_tiles():
+        for tile in spectrogram.tiles(rgb, 512):
+            tile.save(io.BytesIO(), 'PNG')
+        return len(spectrogram.tiles(rgb, 512))
+    tile_time, tile_count = timed(encode_tiles, seconds)
+    print(f"\nPNG tiles (512x{HEIGHT}): {tile_count / tile_time:.1f} tiles/s")
+
+    # --- Whole video ---
+    if shutil.which('ffmpeg') is None:
+        print("\n⚠️  ffmpeg not found: skipping the video encode")
+        return
+    source = sorted((ROOT / 'assets').glob('*_resized.mp4'))[0]
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        ok = encode_spectrogram_video(source, Path(tmp) / 'bench.mp4', **SPECTROGRAMS)
+        elapsed = time.perf_counter() - start
+        size = (Path(tmp) / 'bench.mp4').stat().st_size if ok else 0
+    print(f"\n{'✓' if ok else '✗'} encode_spectrogram_video({source.name}): {elapsed:.2f}s "
+          f"({duration / elapsed:.2f}x real time), {size / 1024:.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Cold Start Benchmark (coldstart.py)
+What the first visitor after a scale-to-zero waits for, measured from
+process start.
+
+- import time of the heavy modules, each in a fresh interpreter
+- for main_web.py (hashing every asset), main_web.py with the saved
+  manifest, and coldstart.py: seconds from spawning the process until
+  GET / answers (TTFB) and until a NiceGUI frog page answers 200
+
+Builds the start-up cache first (coldstart.build(), the last step of
+python -m asset_build web). Reports the median of N runs.
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from coldstart import BUILD_DIR, build  # noqa: E402
+
+PORT = 8840
+IMPORTS = ('json', 'fastapi', 'nicegui', 'asset_manifest', 'static_pages')
+FROG_PAGE = '/frog/Common%20Froglet'
+TIMEOUT = 60
+
+
+def import_seconds(module):
+    code = f'import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)'
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return float(output.stdout)
+
+
+def get(port, path):
+    """Status code of GET path, None while nothing listens"""
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=5) as sock:
+            sock.sendall(f'GET {path} HTTP/1.1\r\nHost: localhost\r\nAccept: text/html\r\n'
+                         f'Connection: close\r\n\r\n'.encode())
+            first = sock.recv(64)
+    except OSError:
+        return None
+    if not first.startswith(b'HTTP/1.1 '):
+        return None
+    return int(first[9:12])
+
+
+def start(script, port):
+    """(seconds until / answers, seconds until the frog page answers 200)"""
+    env = {**os.environ, 'PORT': str(port), 'HOST': '127.0.0.1'}
+    began = time.perf_counter()
+    process = subprocess.Popen([sys.executable, script], env=env, cwd=ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    home = frog = None
+    try:
+        while time.perf_counter() - began < TIMEOUT:
+            if home is None and get(port, '/') is not None:
+                home = time.perf_counter() - began
+            if home is not None and get(port, FROG_PAGE) == 200:
+                frog = time.perf_counter() - began
+                break
+            time.sleep(0.005)
+    finally:
+        process.terminate()
+        process.wait(timeout=15)
+    if frog is None:
+        raise RuntimeError(f'{script} did not serve {FROG_PAGE} within {TIMEOUT}s')
+    return home, frog
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print("Import time (fresh interpreter, median ms)")
+    for module in IMPORTS:
+        samples = [import_seconds(module) for _ in range(runs)]
+        print(f"  {module:<16}{statistics.median(samples) * 1000:>8.0f}")
+
+    build()
+    saved = Path(tempfile.mkdtemp())
+    modes = [
+        ('main_web.py (no cache)', 'main_web.py', False),
+        ('main_web.py (saved manifest)', 'main_web.py', True),
+        ('coldstart.py', 'coldstart.py', True),
+    ]
+    print(f"\nFrom process start, median of {runs} run(s)")
+    print(f"{'entry point':<30}{'TTFB /':>10}{'frog page':>11}")
+    results = {}
+    try:
+        for index, (name, script, cached) in enumerate(modes):
+            # without the cache: move build/ away for the run
+            if not cached and BUILD_DIR.exists():
+                shutil.move(str(BUILD_DIR), saved / 'build')
+            elif cached and not BUILD_DIR.exists():
+                shutil.move(str(saved / 'build'), str(BUILD_DIR))
+            samples = [start(script, PORT + index) for _ in range(runs)]
+            results[name] = (statistics.median(s[0] for s in samples), statistics.median(s[1] for s in samples))
+            print(f"{name:<30}{results[name][0] * 1000:>8.0f}ms{results[name][1] * 1000:>9.0f}ms")
+    finally:
+        if not BUILD_DIR.exists() and (saved / 'build').exists():
+            shutil.move(str(saved / 'build'), str(BUILD_DIR))
+        shutil.rmtree(saved, ignore_errors=True)
+
+    before, after = results[modes[0][0]][0], results[modes[-1][0]][0]
+    print(f"\n✓ First byte of / after {after * 1000:.0f} ms instead of {before * 1000:.0f} ms "
+          f"({before / after:.1f}x sooner)")
+
+
+if __name__ == '__main__':
+    main()
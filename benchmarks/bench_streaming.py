@@ -0,0 +1,273 @@
+"""
+Adaptive Bitrate Streaming Benchmark (assets/js/stream.js)
+Progressive MP4 (/video, the original) against the HLS ladder built by
+python -m asset_build web (/assets/streams), on shaped links.
+
+The bytes come from the real routes (HashedStaticFiles with Range requests,
+the /video route); the transfers are then replayed on a virtual clock with
+each profile's bandwidth and round trip time, so slow links run in
+milliseconds and every run gives the same numbers. The ABR client is a
+copy of stream.js: sequential byte-range segments, moving average of the
+throughput, highest rung below 80% of it.
+
+- cold:  first video of a visit, no throughput known yet (lowest rung)
+- warm:  the estimate carried over from the previous video (localStorage)
+- listen mode (assets/js/listen.js): the still spectrogram, then the Opus
+  call (only when python -m asset_build web built assets/listen)
+
+Reports startup (until STARTUP_SECONDS of the call are buffered), rebuffering
+and bytes per video, averaged over all videos.
+
+Usage: python benchmarks/bench_streaming.py
+"""
+import re
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from asset_build.probe import header_size, mp4_duration  # noqa: E402
+from asset_manifest import AssetManifest, HashedStaticFiles  # noqa: E402
+from video_streaming import video_response  # noqa: E402
+
+ASSETS_DIR = ROOT / 'assets'
+# name -> (kbit/s, round trip ms)
+LINKS = {
+    '400 kbit/s': (400, 150),
+    '1 Mbit/s': (1000, 80),
+    '5 Mbit/s': (5000, 40),
+    'LAN': (100000, 2),
+}
+STARTUP_SECONDS = 2.0
+CHUNK = 16 * 1024
+SAFETY = 0.8    # stream.js
+ALPHA = 0.5
+
+
+def build_app(manifest):
+    bench_app = FastAPI()
+
+    @bench_app.api_route('/video/{filename}', methods=['GET', 'HEAD'])
+    async def serve_video(filename: str, request: Request):
+        return video_response(request, ASSETS_DIR, filename)
+
+    bench_app.mount('/assets', HashedStaticFiles(directory=ASSETS_DIR, manifest=manifest))
+    return bench_app
+
+
+def start_server(manifest):
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(build_app(manifest), host='127.0.0.1', port=port, log_level='warning'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f'http://127.0.0.1:{port}'
+
+
+# --- Playlists (same parsing as stream.js) ---
+def attributes(line):
+    return {key: value.strip('"') for key, value in re.findall(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)', line)}
+
+
+def byte_range(value):
+    length, offset = value.split('@')
+    return int(offset), int(length)
+
+
+def parse_master(text, base):
+    lines = text.split('\n')
+    rungs = [{'kbps': int(attributes(line)['BANDWIDTH']) / 1000,
+              'height': int(attributes(line)['RESOLUTION'].split('x')[1]),
+              'url': urljoin(base, lines[i + 1].strip())}
+             for i, line in enumerate(lines) if line.startswith('#EXT-X-STREAM-INF:')]
+    return sorted(rungs, key=lambda rung: rung['kbps'])
+
+
+def parse_media(text, base):
+    playlist = {'init': None, 'segments': []}
+    duration, part = 0.0, None
+    for line in text.split('\n'):
+        line = line.strip()
+        if line.startswith('#EXT-X-MAP:'):
+            attrs = attributes(line)
+            playlist['init'] = (urljoin(base, attrs['URI']), *byte_range(attrs['BYTERANGE']))
+        elif line.startswith('#EXTINF:'):
+            duration = float(line[8:].rstrip(','))
+        elif line.startswith('#EXT-X-BYTERANGE:'):
+            part = byte_range(line[17:])
+        elif line and not line.startswith('#'):
+            playlist['segments'].append((urljoin(base, line), *part, duration))
+    return playlist
+
+
+def pick_rung(rungs, kbps):
+    index = 0
+    for i, rung in enumerate(rungs):
+        if rung['kbps'] <= kbps * SAFETY:
+            index = i
+    return index
+
+
+# --- Shaped link (virtual clock) ---
+class Link:
+    """One connection: requests one after another, each costs a round trip plus its bytes"""
+
+    def __init__(self, client, kbps, rtt_ms):
+        self.client = client
+        self.rate = kbps * 1000 / 8   # bytes per second
+        self.rtt = rtt_ms / 1000
+        self.clock = 0.0
+        self.bytes = 0
+
+    def get(self, url, offset=None, length=None):
+        """(body, [(virtual arrival time, bytes so far)]) for one (range) request"""
+        headers = {} if offset is None else {'Range': f'bytes={offset}-{offset + length - 1}'}
+        response = self.client.get(url, headers=headers)
+        expected = 200 if offset is None else 206
+        if response.status_code != expected:
+            raise RuntimeError(f'{url}: {response.status_code}, expected {expected}')
+        body = response.content
+        start = self.clock + self.rtt
+        arrivals = [(start + end / self.rate, end)
+                    for end in [*range(CHUNK, len(body), CHUNK), len(body)]]
+        self.clock = arrivals[-1][0]
+        self.bytes += len(body)
+        return body, arrivals
+
+
+def playback(arrivals, duration):
+    """(startup seconds, rebuffer seconds) given [(time, seconds of media available)]"""
+    needed = min(STARTUP_SECONDS, duration)
+    start = next(t for t, media in arrivals if media >= needed - 1e-6)
+    available = max(media for t, media in arrivals if t <= start)
+    position, clock, rebuffer = 0.0, start, 0.0
+    for t, media in arrivals:
+        if t <= start:
+            continue
+        # play until t, stalling once the playhead reaches the end of the buffer
+        played = min(t - clock, available - position)
+        position += played
+        if position < duration - 1e-6:
+            rebuffer += t - clock - played
+        clock, available = t, media
+    return start, rebuffer
+
+
+def progressive(client, base_url, video, kbps, rtt):
+    """Browser with preload=auto: one open-ended Range request for the original MP4"""
+    link = Link(client, kbps, rtt)
+    size = video.stat().st_size
+    duration = mp4_duration(video)
+    header = header_size(video)
+    _, arrivals = link.get(f'{base_url}/video/{video.name}', 0, size)
+    media = [(t, max(0.0, (received - header) / (size - header) * duration)) for t, received in arrivals]
+    startup, rebuffer = playback(media, duration)
+    return {'startup': startup, 'rebuffer': rebuffer, 'bytes': link.bytes, 'height': None}
+
+
+def adaptive(client, base_url, master_url, kbps, rtt, estimate):
+    """stream.js: playlists, then init + segments, switching rungs between segments"""
+    link = Link(client, kbps, rtt)
+    text, _ = link.get(master_url)
+    rungs = parse_master(text.decode(), master_url)
+    playlists = {}
+    rung = pick_rung(rungs, estimate)
+    loaded = None
+    media, heights, available = [], [], 0.0
+    index = 0
+    while True:
+        if rung not in playlists:
+            body, _ = link.get(rungs[rung]['url'])
+            playlists[rung] = parse_media(body.decode(), rungs[rung]['url'])
+        playlist = playlists[rung]
+        if index >= len(playlist['segments']):
+            break
+        if loaded != rung:
+            link.get(*playlist['init'])
+            loaded = rung
+        url, offset, length, seconds = playlist['segments'][index]
+        began = link.clock
+        _, arrivals = link.get(url, offset, length)
+        sample = length * 8 / 1000 / (link.clock - began)
+        estimate = ALPHA * sample + (1 - ALPHA) * estimate if estimate else sample
+        available += seconds
+        media.append((link.clock, available))
+        heights.append(rungs[rung]['height'])
+        rung = pick_rung(rungs, estimate)
+        index += 1
+    startup, rebuffer = playback(media, available)
+    return {'startup': startup, 'rebuffer': rebuffer, 'bytes': link.bytes,
+            'height': sum(heights) / len(heights)}, estimate
+
+
+def listen(client, base_url, files, kbps, rtt):
+    """listen.js: the still image, then the audio (Opus, the first format)"""
+    link = Link(client, kbps, rtt)
+    link.get(base_url + files['image'])
+    _, arrivals = link.get(base_url + files['audio'][0]['src'])
+    size = arrivals[-1][1]
+    media = [(t, received / size * files['duration']) for t, received in arrivals]
+    startup, rebuffer = playback(media, files['duration'])
+    return {'startup': startup, 'rebuffer': rebuffer, 'bytes': link.bytes, 'height': None}
+
+
+def average(results, key):
+    values = [result[key] for result in results if result[key] is not None]
+    return sum(values) / len(values) if values else None
+
+
+def main():
+    manifest = AssetManifest(ASSETS_DIR).build()
+    videos = sorted(ASSETS_DIR.glob('*_resized.mp4'))
+    streams = {video.name: manifest.streams(video.name).get('hls') for video in videos}
+    listen_files = {video.name: manifest.listen(video.name) for video in videos}
+    if not videos:
+        print("✗ No *_resized.mp4 videos found in assets/")
+        return
+    if not all(streams.values()):
+        print("✗ No HLS ladder in assets/streams: run python -m asset_build web first")
+        return
+
+    server, base_url = start_server(manifest)
+    print(f"\n{'='*72}")
+    print("ADAPTIVE BITRATE STREAMING BENCHMARK")
+    print(f"{'='*72}")
+    print(f"{len(videos)} videos, startup = first {STARTUP_SECONDS:.0f}s buffered, averages per video\n")
+    print(f"{'Link':<12}{'Client':<18}{'startup ms':>12}{'rebuffer ms':>13}{'KB':>9}{'picture':>12}")
+    print("-" * 76)
+    with httpx.Client(timeout=30) as client:
+        for name, (kbps, rtt) in LINKS.items():
+            rows = {'progressive MP4': [], 'ABR cold': [], 'ABR warm': [], 'listen mode': []}
+            estimate = 0.0
+            for video in videos:
+                rows['progressive MP4'].append(progressive(client, base_url, video, kbps, rtt))
+                master_url = base_url + streams[video.name]
+                rows['ABR cold'].append(adaptive(client, base_url, master_url, kbps, rtt, 0.0)[0])
+                result, estimate = adaptive(client, base_url, master_url, kbps, rtt, estimate)
+                rows['ABR warm'].append(result)
+                if listen_files[video.name]:
+                    rows['listen mode'].append(listen(client, base_url, listen_files[video.name], kbps, rtt))
+            for label, results in rows.items():
+                if not results:
+                    continue
+                height = average(results, 'height')
+                picture = f'{height:.0f}p' if height else 'still' if label == 'listen mode' else 'original'
+                print(f"{name:<12}{label:<18}{average(results, 'startup') * 1000:>12.0f}"
+                      f"{average(results, 'rebuffer') * 1000:>13.0f}{average(results, 'bytes') / 1024:>9.0f}"
+                      f"{picture:>12}")
+            print()
+    server.should_exit = True
+
+
+if __name__ == '__main__':
+    main()
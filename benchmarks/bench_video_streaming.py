@@ -0,0 +1,140 @@
+"""
+Video Streaming Benchmark
+Compares the plain /assets static mount against the Range-aware /video route
+for the way a browser actually plays a frog call: first play, seek, replay.
+
+Reports bytes transferred and time-to-first-frame (time until the first
+FIRST_FRAME_BYTES arrive - the faststart moov atom plus the first keyframe).
+
+Usage: python benchmarks/bench_video_streaming.py [rounds]
+"""
+import sys
+import socket
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.staticfiles import StaticFiles
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from video_streaming import video_response  # noqa: E402
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+FIRST_FRAME_BYTES = 64 * 1024
+SEEK_WINDOW = 256 * 1024
+
+
+def build_app():
+    """Same two routes main_web.py exposes, without the NiceGUI UI"""
+    bench_app = FastAPI()
+
+    @bench_app.api_route('/video/{filename}', methods=['GET', 'HEAD'])
+    async def serve_video(filename: str, request: Request):
+        return video_response(request, ASSETS_DIR, filename)
+
+    bench_app.mount('/assets', StaticFiles(directory=ASSETS_DIR))
+    return bench_app
+
+
+def start_server():
+    """Run uvicorn in a background thread on a free port"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    config = uvicorn.Config(build_app(), host='127.0.0.1', port=port, log_level='warning')
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f'http://127.0.0.1:{port}'
+
+
+def fetch(client, url, headers=None):
+    """Stream one response, return (status, bytes, time_to_first_frame, headers)"""
+    start = time.perf_counter()
+    first_frame = None
+    received = 0
+    with client.stream('GET', url, headers=headers or {}) as response:
+        for chunk in response.iter_raw():
+            received += len(chunk)
+            if first_frame is None and received >= FIRST_FRAME_BYTES:
+                first_frame = time.perf_counter() - start
+    if first_frame is None:
+        first_frame = time.perf_counter() - start
+    return response.status_code, received, first_frame, response.headers
+
+
+def play_session(client, url, size):
+    """First play, seek to the middle, then replay from the browser cache"""
+    totals = {'bytes': 0, 'ttff': 0.0}
+
+    # 1. First play - browsers open media with an open-ended range
+    status, received, ttff, headers = fetch(client, url, {'Range': 'bytes=0-'})
+    totals['bytes'] += received
+    totals['ttff'] += ttff
+    etag = headers.get('etag')
+
+    # 2. Seek to 50% - only a window around the new position is needed
+    middle = size // 2
+    status, received, ttff, _ = fetch(
+        client, url, {'Range': f'bytes={middle}-{middle + SEEK_WINDOW - 1}'})
+    totals['bytes'] += received
+    totals['ttff'] += ttff
+
+    # 3. Replay - revalidate the cached copy
+    replay_headers = {'Range': 'bytes=0-'}
+    if etag:
+        replay_headers['If-Range'] = etag
+        replay_headers['If-None-Match'] = etag
+    status, received, ttff, _ = fetch(client, url, replay_headers)
+    totals['bytes'] += received
+    totals['ttff'] += ttff
+    return totals
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    videos = sorted(ASSETS_DIR.glob('*_resized.mp4'))
+    if not videos:
+        print("✗ No *_resized.mp4 videos found in assets/")
+        return
+
+    server, base_url = start_server()
+    print(f"\n{'='*60}")
+    print("VIDEO STREAMING BENCHMARK")
+    print(f"{'='*60}")
+    print(f"{len(videos)} videos x {rounds} rounds (first play + seek + replay)\n")
+
+    results = {}
+    with httpx.Client(timeout=30) as client:
+        for label, prefix in (('static /assets', '/assets'), ('range /video', '/video')):
+            total_bytes = 0
+            total_ttff = 0.0
+            for _ in range(rounds):
+                for video in videos:
+                    totals = play_session(client, f'{base_url}{prefix}/{video.name}',
+                                          video.stat().st_size)
+                    total_bytes += totals['bytes']
+                    total_ttff += totals['ttff']
+            sessions = rounds * len(videos)
+            results[label] = (total_bytes / sessions, total_ttff / (sessions * 3))
+
+    print(f"{'Route':<18}{'KB / session':>14}{'avg TTFF (ms)':>16}")
+    print("-" * 48)
+    for label, (avg_bytes, avg_ttff) in results.items():
+        print(f"{label:<18}{avg_bytes / 1024:>14.1f}{avg_ttff * 1000:>16.2f}")
+
+    static_bytes = results['static /assets'][0]
+    range_bytes = results['range /video'][0]
+    if static_bytes:
+        print(f"\nBytes saved per session: {(1 - range_bytes / static_bytes) * 100:.1f}%")
+
+    server.should_exit = True
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+"""
+Exhibition Crowd Load Test
+Scripts realistic visitor flows against main_web.py and ramps the number
+of simultaneous visitors:
+
+  1. open the home page (HTML + the images, CSS and JS it references)
+  2. open a /frog/{name} page (NiceGUI): connect its websocket, press play
+     (a socket event) and download the call video
+  3. open /mystery and play five rounds: each round downloads that round's
+     video, then the answers are posted as one score batch
+
+Per stage it reports p50/p95/p99 latency per request type, websocket
+messages received, server RSS (peak, sampled) and at the end bytes served
+per asset. --json writes everything for a regression baseline.
+
+Usage:
+    python benchmarks/loadtest.py                       # starts main_web.py itself
+    python benchmarks/loadtest.py --stages 10,50,100,200,400 --seconds 20
+    python benchmarks/loadtest.py --url http://127.0.0.1:8080   # existing server (no RSS)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from urllib.parse import quote, urlencode, urlsplit
+
+import websockets
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from frog_catalog import FROGS  # noqa: E402
+from multiworker import wait_for_port  # noqa: E402
+
+ACCEPT_HTML = 'text/html,application/xhtml+xml,image/avif,image/webp,*/*;q=0.8'
+# src attributes, stylesheets, and "src" props in NiceGUI's element JSON (not icons)
+SUBRESOURCE = re.compile(r'(?:src="|rel="stylesheet" href="|"src":")(/(?:assets|video)/[^"]+)"')
+QUERY = re.compile(r"query: (\{[^}]*\})")
+ELEMENT = re.compile(r'"(\d+)":\{"tag":"([^"]+)"')
+CLICK_LISTENER = re.compile(r'"listener_id":"([^"]+)","type":"click"')
+QUIZ_DATA = re.compile(r'<script id="quiz-data" type="application/json">(.*?)</script>', re.S)
+QUIZ_ROUNDS = 5
+PLAY_SECONDS = 2
+
+
+class Stats:
+    """Latencies per request type, websocket messages, bytes per asset"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.ws_messages = 0
+        self.bytes_by_asset = Counter()
+        self.flows = 0
+
+    def record(self, kind, seconds):
+        self.latencies[kind].append(seconds)
+
+    def summary(self):
+        def percentiles(samples):
+            ordered = sorted(samples)
+            pick = lambda q: round(ordered[min(int(len(ordered) * q), len(ordered) - 1)] * 1000, 1)
+            return {'count': len(ordered), 'p50': pick(0.5), 'p95': pick(0.95), 'p99': pick(0.99)}
+        every = [s for samples in self.latencies.values() for s in samples]
+        return {
+            'flows': self.flows,
+            'all': percentiles(every) if every else None,
+            'by_type': {kind: percentiles(samples) for kind, samples in sorted(self.latencies.items())},
+            'ws_messages': self.ws_messages,
+            'errors': dict(self.errors),
+        }
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client (one per visitor, like a browser tab)"""
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, headers=None, body=b''):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f'{method} {path} HTTP/1.1', f'Host: {self.host}:{self.port}']
+        lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+        if body:
+            lines.append(f'Content-Length: {len(body)}')
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode() + body)
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        status = int(head.split(b' ', 2)[1])
+        response_headers = {}
+        for line in head.decode('latin-1').split('\r\n')[1:]:
+            if ':' in line:
+                name, _, value = line.partition(':')
+                response_headers[name.strip().lower()] = value.strip()
+        if method == 'HEAD' or status in (204, 304):
+            data = b''
+        elif 'chunked' in response_headers.get('transfer-encoding', ''):
+            data = b''
+            while True:
+                size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                data += await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        else:
+            data = await self.reader.readexactly(int(response_headers.get('content-length', 0)))
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, response_headers, data
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+class Visitor:
+    def __init__(self, host, port, stats):
+        self.host, self.port, self.stats = host, port, stats
+        self.http = HttpConnection(host, port)
+
+    async def get(self, kind, path, headers=None, record_bytes=False):
+        start = time.perf_counter()
+        status, headers_in, data = await self.http.request('GET', path, headers)
+        self.stats.record(kind, time.perf_counter() - start)
+        if status >= 400:
+            self.stats.errors[f'{kind} {status}'] += 1
+        if record_bytes:
+            self.stats.bytes_by_asset[path] += len(data)
+        return status, data
+
+    async def page(self, kind, path):
+        """A page and the subresources a browser would fetch for it"""
+        _, html = await self.get(kind, path, {'Accept': ACCEPT_HTML})
+        html = html.decode('utf-8', 'replace')
+        for url in dict.fromkeys(SUBRESOURCE.findall(html)):
+            if url.startswith('/video/'):
+                continue  # only loaded when play is pressed
+            await self.get('asset', url, {'Accept': 'image/avif,image/webp,*/*'}, record_bytes=True)
+        return html
+
+    async def play_video(self, url):
+        await self.get('video', url, {'Range': 'bytes=0-'}, record_bytes=True)
+
+    async def frog_page(self, frog):
+        html = await self.page('frog page', f'/frog/{quote(frog.ind_name)}')
+        video = next((u for u in SUBRESOURCE.findall(html) if u.startswith('/video/')), None)
+        query = QUERY.search(html)
+        if query:
+            await self.socket_session(html, json.loads(query.group(1).replace("'", '"')
+                                                       .replace('True', 'true').replace('False', 'false')))
+        if video:
+            await self.play_video(video)
+
+    async def socket_session(self, html, query):
+        """Connect the page's socket.io websocket, press play, count messages"""
+        play_listeners, play_id = [], None
+        elements = list(ELEMENT.finditer(html))
+        for index, match in enumerate(elements):
+            if match.group(2) == 'q-btn':
+                end = elements[index + 1].start() if index + 1 < len(elements) else len(html)
+                play_id, play_listeners = int(match.group(1)), CLICK_LISTENER.findall(html, match.start(), end)
+                break
+
+        # booleans as the browser's socket.io client sends them ('true', not 'True')
+        query = {name: str(value).lower() if isinstance(value, bool) else value
+                 for name, value in query.items()}
+        params = {**query, 'document_id': os.urandom(8).hex(), 'tab_id': os.urandom(8).hex(),
+                  'old_tab_id': '', 'EIO': '4', 'transport': 'websocket'}
+        url = f'ws://{self.host}:{self.port}/_nicegui_ws/socket.io/?{urlencode(params)}'
+        start = time.perf_counter()
+        async with websockets.connect(url, open_timeout=30) as ws:
+            await ws.recv()          # engine.io open
+            await ws.send('40')      # socket.io connect (implicit handshake)
+            while not str(await ws.recv()).startswith('40'):
+                pass
+            self.stats.record('ws connect', time.perf_counter() - start)
+
+            click = time.perf_counter()
+            for listener in play_listeners:
+                await ws.send('42' + json.dumps(['event', {'id': play_id, 'client_id': query['client_id'],
+                                                           'listener_id': listener, 'args': []}]))
+            first_reply = True
+            deadline = time.perf_counter() + PLAY_SECONDS
+            while (remaining := deadline - time.perf_counter()) > 0:
+                try:
+                    message = await asyncio.wait_for(ws.recv(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if message == '2':
+                    await ws.send('3')  # engine.io ping
+                    continue
+                self.stats.ws_messages += 1
+                if first_reply:
+                    self.stats.record('ws click->reply', time.perf_counter() - click)
+                    first_reply = False
+
+    async def mystery(self):
+        html = await self.page('mystery page', '/mystery')
+        data = QUIZ_DATA.search(html)
+        if not data:
+            return
+        payload = json.loads(data.group(1).replace('<\\/', '</'))
+        events = []
+        for _ in range(QUIZ_ROUNDS):
+            frog = random.choice(payload['frogs'])
+            await self.play_video(frog['video'])
+            picked = random.choice(payload['frogs'])
+            events.append({'frog': frog['id'], 'picked': picked['id'], 'feedback_ms': 5})
+        if payload.get('events'):
+            start = time.perf_counter()
+            await self.http.request('POST', payload['events'], {'Content-Type': 'application/json'},
+                                    json.dumps(events).encode())
+            self.stats.record('score batch', time.perf_counter() - start)
+
+    async def flow(self):
+        await self.page('home page', '/')
+        await self.frog_page(random.choice(FROGS))
+        await self.mystery()
+        self.stats.flows += 1
+
+
+async def visitor_loop(host, port, stats, deadline):
+    while time.perf_counter() < deadline:
+        visitor = Visitor(host, port, stats)
+        try:
+            await visitor.flow()
+        except (OSError, asyncio.IncompleteReadError, websockets.WebSocketException, asyncio.TimeoutError) as e:
+            stats.errors[type(e).__name__] += 1
+            await asyncio.sleep(0.5)
+        finally:
+            await visitor.http.close()
+
+
+def rss_mb(pid):
+    """Resident memory of the server (Linux /proc), None when unavailable"""
+    try:
+        for line in Path(f'/proc/{pid}/status').read_text().splitlines():
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+async def run_stage(host, port, visitors, seconds, pid):
+    stats = Stats()
+    deadline = time.perf_counter() + seconds
+    peak_rss = 0
+    tasks = [asyncio.create_task(visitor_loop(host, port, stats, deadline)) for _ in range(visitors)]
+    while not all(task.done() for task in tasks):
+        if pid:
+            peak_rss = max(peak_rss, rss_mb(pid) or 0)
+        await asyncio.sleep(0.5)
+    summary = stats.summary()
+    summary.update(visitors=visitors, peak_rss_mb=round(peak_rss, 1) if pid else None,
+                   rss_after_mb=round(rss_mb(pid), 1) if pid else None)
+    return summary, stats.bytes_by_asset
+
+
+def start_server(port):
+    env = {**os.environ, 'PORT': str(port)}
+    process = subprocess.Popen([sys.executable, str(ROOT / 'main_web.py')], env=env, cwd=ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not wait_for_port(port):
+        process.kill()
+        raise RuntimeError('main_web.py did not start')
+    return process
+
+
+def print_stage(summary):
+    overall = summary['all'] or {'count': 0, 'p50': 0, 'p95': 0, 'p99': 0}
+    rss = f"{summary['peak_rss_mb']:.0f} MB" if summary['peak_rss_mb'] else 'n/a'
+    print(f"\n👥 {summary['visitors']} visitors: {summary['flows']} flows, {overall['count']} requests, "
+          f"p50 {overall['p50']} / p95 {overall['p95']} / p99 {overall['p99']} ms, "
+          f"{summary['ws_messages']} ws messages, peak RSS {rss}")
+    for kind, p in summary['by_type'].items():
+        print(f"   {kind:<16} {p['count']:>7} {p['p50']:>8.1f} {p['p95']:>8.1f} {p['p99']:>8.1f} ms")
+    if summary['errors']:
+        print(f"   ✗ errors: {summary['errors']}")
+
+
+async def main_async(args):
+    process = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port, pid = parts.hostname, parts.port or 80, None
+    else:
+        host, port = '127.0.0.1', args.port
+        process = start_server(port)
+        pid = process.pid
+        print(f"✓ main_web.py started (pid {pid}), RSS {rss_mb(pid) or 0:.0f} MB")
+    try:
+        results, bytes_by_asset = [], Counter()
+        print(f"{'':<19}{'count':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+        for visitors in args.stages:
+            summary, asset_bytes = await run_stage(host, port, visitors, args.seconds, pid)
+            print_stage(summary)
+            results.append(summary)
+            bytes_by_asset.update(asset_bytes)
+    finally:
+        if process:
+            process.terminate()
+            process.wait(timeout=15)
+
+    print("\nBytes served per asset (top 15):")
+    for path, size in bytes_by_asset.most_common(15):
+        print(f"   {size / 1024 / 1024:>8.2f} MB  {path}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({'stages': results, 'bytes_by_asset': bytes_by_asset},
+                                              indent=2))
+        print(f"✓ wrote {args.json}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--url', help='target an already running server')
+    parser.add_argument('--port', type=int, default=8795)
+    parser.add_argument('--stages', type=lambda s: [int(v) for v in s.split(',')], default=[10, 50, 100, 200])
+    parser.add_argument('--seconds', type=float, default=15)
+    parser.add_argument('--json', help='write the results to this file')
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
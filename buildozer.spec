@@ -23,7 +23,7 @@ source.include_patterns = assets/*.png,assets/*.jpg,assets/*_resized.mp4
 
 # (list) Source files to exclude (let empty to not exclude anything)
 # CRITICAL: Exclude main_web.py (NiceGUI web app) - main.py is the Kivy Android app
-source.exclude_patterns = main_web.py,buildozer_hook.py,main_activity.py,uvicorn_config.py,Procfile,Dockerfile,compress*.py,VIDEO_COMPRESSION_GUIDE.py
+source.exclude_patterns = main_web.py,buildozer_hook.py,main_activity.py,uvicorn_config.py,Procfile,Dockerfile,compress*.py,video_streaming.py,asset_manifest.py,static_pages.py,site_export.py,quiz_stats.py,service_worker.py,multiworker.py,metrics.py,client_lifecycle.py,config_files.py,compression.py,coldstart.py,asset_build/*,assets/streams/*,assets/listen/*,recordings/*,build/*,benchmarks/*,*.br,*.gz
 
 # (str) Main entry point for Android (Java/Kotlin activity class name)
 # Note: Keep the Python entry filename as `main_kivy.py` in the app source,
@@ -0,0 +1,123 @@
+"""
+Idle reaping and a live-client cap for NiceGUI pages
+Every NiceGUI page visit keeps a Client (element tree, handler closures,
+outbox) until its browser disconnects. A kiosk tab left open, or a browser
+that never closes its websocket, holds one forever. ClientLifecycle sweeps
+them periodically:
+
+- clients idle for longer than idle_timeout are let go
+- above max_clients, the least recently used clients go first
+- a still-connected browser is sent to idle_url (the pre-rendered home
+  page, which needs no client); NiceGUI deletes the client once the old
+  page disconnects. Clients whose browser does not react by the next sweep,
+  and clients with no connection at all, are deleted directly.
+
+Clients whose browser has disconnected are left to NiceGUI, which deletes
+them once its reconnect grace period runs out (app.on_connect /
+app.on_disconnect keep track of them).
+
+Each sweep that deletes clients logs the elements dropped and the RSS
+before and after a gc.collect().
+    CLIENT_IDLE_TIMEOUT=600 MAX_CLIENTS=100 python main_web.py
+"""
+import asyncio
+import gc
+import json
+import logging
+import os
+import time
+from collections import Counter
+
+from nicegui import Client, context
+
+from metrics import rss_bytes
+
+log = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 600      # seconds without a page event
+DEFAULT_MAX_CLIENTS = 100       # per process (a 256 MB VM)
+SWEEP_INTERVAL = 30
+
+
+class ClientLifecycle:
+    def __init__(self, idle_timeout=None, max_clients=None, idle_url='/', sweep_interval=SWEEP_INTERVAL):
+        self.idle_timeout = float(idle_timeout or os.environ.get('CLIENT_IDLE_TIMEOUT', DEFAULT_IDLE_TIMEOUT))
+        self.max_clients = int(max_clients or os.environ.get('MAX_CLIENTS', DEFAULT_MAX_CLIENTS))
+        self.idle_url = idle_url
+        self.sweep_interval = sweep_interval
+        self.last_active = {}   # client id -> time.time() of the last page event
+        self.sent_away = set()  # client ids already told to go to idle_url
+        self.disconnected = set()  # client ids waiting for their browser to reconnect
+        self.stats = Counter()  # idle / lru evictions, elements, reclaimed_bytes
+
+    def touch(self, client: Client = None):
+        """Mark a client as in use (call from page event handlers)"""
+        client = client or context.client
+        self.last_active[client.id] = time.time()
+        self.sent_away.discard(client.id)
+
+    def connect(self, client: Client):
+        """app.on_connect hook"""
+        self.disconnected.discard(client.id)
+
+    def disconnect(self, client: Client):
+        """app.on_disconnect hook (also called when one of several tabs of a client reconnects)"""
+        if not client.has_socket_connection:
+            self.disconnected.add(client.id)
+
+    def forget(self, client: Client):
+        """app.on_delete hook: drop the bookkeeping of a deleted client"""
+        self.last_active.pop(client.id, None)
+        self.sent_away.discard(client.id)
+        self.disconnected.discard(client.id)
+
+    def last_seen(self, client: Client) -> float:
+        return self.last_active.get(client.id, client.created)
+
+    def select(self, now=None):
+        """[(client, reason)] to let go, idle ones first, then least recently used"""
+        now = time.time() if now is None else now
+        # clients NiceGUI is already deleting (browser gone, reconnect grace period) are left alone
+        clients = sorted((client for client in Client.instances.values() if client.id not in self.disconnected),
+                         key=self.last_seen)
+        chosen = [(client, 'idle') for client in clients if now - self.last_seen(client) > self.idle_timeout]
+        remaining = clients[len(chosen):]
+        overflow = len(remaining) - self.max_clients
+        if overflow > 0:
+            chosen += [(client, 'lru') for client in remaining[:overflow]]
+        return chosen
+
+    def sweep(self, now=None):
+        """Evict what select() picks; returns the number of clients deleted"""
+        doomed = []
+        for client, reason in self.select(now):
+            if client.has_socket_connection and client.id not in self.sent_away and self.idle_url:
+                # the outbox delivers this; the page disconnects and NiceGUI deletes the client
+                client.run_javascript(f'window.location.replace({json.dumps(self.idle_url)})')
+                self.sent_away.add(client.id)
+                self.stats['sent_away'] += 1
+            else:
+                doomed.append((client, reason))
+        if not doomed:
+            return 0
+
+        rss_before = rss_bytes()
+        elements = 0
+        for client, reason in doomed:
+            elements += len(client.elements)
+            self.stats[reason] += 1
+            if not client.is_deleted:
+                client.delete()
+        gc.collect()
+        rss_after = rss_bytes()
+        self.stats['elements'] += elements
+        self.stats['reclaimed_bytes'] += max(0, rss_before - rss_after)
+        log.info('Reaped %d client(s), %d elements, RSS %.1f MB -> %.1f MB (%d live)',
+                 len(doomed), elements, rss_before / 1e6, rss_after / 1e6, len(Client.instances))
+        return len(doomed)
+
+    async def run(self):
+        """Background sweep loop (start with app.on_startup)"""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
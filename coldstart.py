@@ -0,0 +1,258 @@
+"""
+Fast cold start for scale-to-zero deployments (fly.toml min_machines_running = 0)
+    python -m asset_build web       # at image build time (writes the cache)
+    python coldstart.py             # instead of python main_web.py
+
+Importing NiceGUI / FastAPI takes most of a second, and the first visitor
+after idle waits for all of it. This entry point:
+
+1. binds $PORT first and answers from a build-time cache straight away,
+   without NiceGUI or FastAPI: the pre-rendered pages, hashed /assets
+   files, manifest.json and /health
+2. meanwhile imports main_web.py in the main thread; uvicorn serves the
+   same listening socket (LISTEN_FD, see uvicorn_config.py)
+3. once the app has started, the fast lane stops accepting and closes its
+   idle connections: from then on uvicorn owns the socket, no proxy hop
+
+During the boot, requests the cache cannot answer (frog pages, websockets,
+APIs, videos) get a 503 with Retry-After: 1; page navigations get a small
+page that reloads itself.
+
+build(), the last step of python -m asset_build web, writes
+build/asset_manifest.json (main_web.py loads it instead of hashing every
+asset, unless a file changed) and build/coldstart.json (the pre-rendered
+pages for each image format, with the ETags main_web uses).
+"""
+import asyncio
+import json
+import mimetypes
+import os
+import socket
+import threading
+from pathlib import Path
+from urllib.parse import unquote
+
+from asset_manifest import best_image_format
+from compression import DYNAMIC_LEVELS, SIBLING_SUFFIXES, accepted_encoding, compress, encoded_etag, identity_etags
+from multiworker import MAX_HEAD, parse_head
+
+ROOT = Path(__file__).resolve().parent
+BUILD_DIR = ROOT / 'build'
+MANIFEST_CACHE = BUILD_DIR / 'asset_manifest.json'
+PAGE_CACHE = BUILD_DIR / 'coldstart.json'
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# pre-rendered pages main_web.py serves (STATIC_PAGES names), plus /mystery
+PAGE_ROUTES = {'/': 'home', '/instructions': 'instructions', '/app_info': 'app_info'}
+LOADING_PAGE = (b'<!DOCTYPE html><html><head><meta charset="utf-8"><meta http-equiv="refresh" content="1">'
+                b'<title>Frog Quiz</title></head><body style="background:#2E8B57"></body></html>')
+
+
+# --- Build step ---
+
+def build():
+    """Save the asset manifest and pre-render the static pages"""
+    from asset_manifest import AssetManifest
+    from frog_catalog import CATALOG_VERSION
+    from quiz_stats import EVENTS_URL
+    from static_pages import PageCache, STATIC_PAGES, quiz_payload, render_mystery
+
+    manifest = AssetManifest(ROOT / 'assets').build().save(MANIFEST_CACHE)
+    renderers = {
+        **{route: STATIC_PAGES[name] for route, name in PAGE_ROUTES.items()},
+        '/mystery': lambda manifest, image_format: render_mystery(
+            manifest, image_format, quiz_payload(manifest, events_url=EVENTS_URL)),
+    }
+    page_cache = PageCache()
+    pages = {}
+    for route, render in renderers.items():
+        pages[route] = {}
+        for image_format in ('avif', 'webp', 'png'):
+            body, etag = page_cache.get((route, image_format), lambda: render(manifest, image_format))
+            pages[route][image_format] = {'body': body.decode('utf-8'), 'etag': etag}
+    PAGE_CACHE.write_text(json.dumps({
+        'catalog_version': CATALOG_VERSION,
+        'assets_version': manifest.version,
+        'assets': {hashed: logical for logical, hashed in manifest.entries.items()},
+        'encodings': manifest.encodings,
+        'pages': pages,
+    }))
+    print(f"✓ {MANIFEST_CACHE.relative_to(ROOT)}: {len(manifest.entries)} assets")
+    print(f"✓ {PAGE_CACHE.relative_to(ROOT)}: {len(pages)} pages x 3 image formats")
+
+
+# --- Fast lane (while main_web.py boots) ---
+
+def response(status, headers, body=b'', head_only=False, close=False):
+    lines = [f'HTTP/1.1 {status}'] + [f'{name}: {value}' for name, value in headers.items()]
+    lines.append(f'Content-Length: {len(body)}')
+    if close:
+        lines.append('Connection: close')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (b'' if head_only else body)
+
+
+class FastLane:
+    """Answers from the build cache on a listening socket until stop()"""
+
+    def __init__(self, sock, cache):
+        self.sock = sock
+        self.cache = cache
+        self.assets_dir = ROOT / 'assets'
+        self.web_manifest = (ROOT / 'manifest.json').read_bytes()
+        self.compressed = {}     # (route, image format, encoding) -> compressed page
+        self.idle = set()        # writers waiting for their next request
+        self.stopping = False
+        self.served = 0
+        self.loop = None
+        self.server = None
+        self.thread = threading.Thread(target=self._run, name='fast lane', daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Hand the socket over: stop accepting, close idle keep-alive connections"""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._stop)
+
+    def _stop(self):
+        self.stopping = True
+        self.server.close()
+        for writer in list(self.idle):
+            writer.close()
+        print(f"✓ Fast lane handed over after {self.served} response(s)")
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        # a duplicate: closing it leaves uvicorn's copy of the socket open
+        listener = socket.socket(fileno=os.dup(self.sock.fileno()))
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self._handle, sock=listener, limit=MAX_HEAD))
+        self.loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            while not self.stopping:
+                self.idle.add(writer)
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                finally:
+                    self.idle.discard(writer)
+                start_line, _, headers = parse_head(head)
+                method, _, rest = start_line.partition(' ')
+                path = unquote(rest.rpartition(' ')[0].partition('?')[0])
+                close = (self.stopping or method not in ('GET', 'HEAD') or 'content-length' in headers
+                         or headers.get('connection', '').lower() == 'close')
+                writer.write(self.answer(method, path, headers, close))
+                self.served += 1
+                await writer.drain()
+                if close:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def answer(self, method, path, headers, close):
+        head_only = method == 'HEAD'
+        if method not in ('GET', 'HEAD'):
+            return self.unavailable(headers, close=True)
+        if path == '/health':
+            body = json.dumps({'status': 'ok', 'catalog_version': self.cache['catalog_version'],
+                               'starting': True}).encode()
+            return response('200 OK', {'Content-Type': 'application/json'}, body, head_only, close)
+        if path == '/manifest.json':
+            return response('200 OK', {'Content-Type': 'application/manifest+json', 'Cache-Control': 'no-cache'},
+                            self.web_manifest, head_only, close)
+        if path in self.cache['pages']:
+            return self.page(path, headers, head_only, close)
+        if path.startswith('/assets/'):
+            return self.asset(path[len('/assets/'):], headers, head_only, close)
+        return self.unavailable(headers, close)
+
+    def page(self, path, headers, head_only, close):
+        image_format = best_image_format(headers.get('accept', ''))
+        page = self.cache['pages'][path][image_format]
+        encoding = accepted_encoding(headers.get('accept-encoding'))
+        # same ETags as CompressionMiddleware: "<tag>-br" / "<tag>-gzip" for the encoded copies
+        etag = page['etag'] if encoding is None else encoded_etag(page['etag'], encoding)
+        out = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept, Accept-Encoding'}
+        if_none_match, revalidated = identity_etags(headers.get('if-none-match', ''))
+        if if_none_match == page['etag']:
+            if revalidated is not None:
+                out['ETag'] = encoded_etag(page['etag'], revalidated)
+            return response('304 Not Modified', out, close=close)
+        out['Content-Type'] = 'text/html; charset=utf-8'
+        body = page['body'].encode('utf-8')
+        if encoding is not None:
+            key = (path, image_format, encoding)
+            if key not in self.compressed:
+                self.compressed[key] = compress(body, encoding, DYNAMIC_LEVELS[encoding])
+            body = self.compressed[key]
+            out['Content-Encoding'] = encoding
+        return response('200 OK', out, body, head_only, close)
+
+    def asset(self, hashed, headers, head_only, close):
+        logical = self.cache['assets'].get(hashed)
+        if logical is None or 'range' in headers:
+            return self.unavailable(headers, close)
+        path = self.assets_dir / logical
+        out = {'Cache-Control': IMMUTABLE, 'Content-Type': mimetypes.guess_type(logical)[0] or 'application/octet-stream'}
+        encoding = accepted_encoding(headers.get('accept-encoding'))
+        if encoding in self.cache['encodings'].get(logical, ()):
+            path = path.with_name(path.name + SIBLING_SUFFIXES[encoding])
+            out['Content-Encoding'] = encoding
+            out['Vary'] = 'Accept-Encoding'
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return self.unavailable(headers, close)
+        return response('200 OK', out, body, head_only, close)
+
+    def unavailable(self, headers, close):
+        """Not in the cache: ask the browser to come back in a second"""
+        out = {'Retry-After': '1', 'Cache-Control': 'no-store'}
+        if 'text/html' in headers.get('accept', ''):
+            out['Content-Type'] = 'text/html; charset=utf-8'
+            return response('503 Service Unavailable', out, LOADING_PAGE, close=close)
+        return response('503 Service Unavailable', out, close=close)
+
+
+def load_cache():
+    """The build cache, or None when it is missing or the assets changed since"""
+    try:
+        cache = json.loads(PAGE_CACHE.read_text())
+        saved = json.loads(MANIFEST_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+    from asset_manifest import AssetManifest
+    if saved.get('signature') != AssetManifest(ROOT / 'assets').signature():
+        return None
+    return cache
+
+
+def listen(host, port, backlog=2048):
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+def main():
+    sock = listen(os.environ.get('HOST', '0.0.0.0'), int(os.environ.get('PORT', 8080)))
+    os.environ['LISTEN_FD'] = str(sock.fileno())
+    cache = load_cache()
+    if cache is None:
+        print("⚠️  No up-to-date build cache (python -m asset_build web): no fast lane")
+    else:
+        lane = FastLane(sock, cache).start()
+        from nicegui import app
+        app.on_startup(lane.stop)
+    import main_web  # noqa: F401  (ui.run serves until shutdown)
+
+
+if __name__ == '__main__':
+    main()
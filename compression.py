@@ -0,0 +1,197 @@
+"""
+Response compression (Brotli / gzip)
+Replaces NiceGUI's default GZipMiddleware (ui.run gzip_middleware_factory),
+which gzips every text response at level 9 on every request, including the
+same Vue / Quasar bundles and pre-rendered pages over and over.
+
+- Brotli when the browser accepts it and the brotli package is installed,
+  else gzip
+- responses with an ETag (pre-rendered pages, manifest.json, NiceGUI's
+  static bundles) are compressed once at a high level and kept in a small
+  LRU keyed by (path, ETag, encoding); the compressed body gets its own
+  ETag ("<tag>-br" / "<tag>-gzip"), and If-None-Match is passed on to the
+  app with those suffixes removed, so its 304s keep working
+- other HTML / JSON above minimum_size is compressed on the fly at a cheap
+  level
+- /assets text files are served from pre-built .br / .gz siblings
+  (python -m asset_build web, text step), see HashedStaticFiles
+- every compressible response carries Vary: Accept-Encoding, compressed or not
+"""
+import gzip
+from collections import Counter, OrderedDict
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'application/manifest+json',
+                      'application/xml', 'image/svg+xml')
+TEXT_SUFFIXES = ('.js', '.mjs', '.css', '.json', '.html', '.svg', '.txt', '.xml')
+SIBLING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+MINIMUM_SIZE = 1024
+STATIC_LEVELS = {'br': 11, 'gzip': 9}    # paid once per file / page version
+DYNAMIC_LEVELS = {'br': 4, 'gzip': 6}    # paid per response
+CACHE_BYTES = 16 * 1024 * 1024
+MAX_BUFFER = 4 * 1024 * 1024
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def accepted_encoding(accept_encoding: str):
+    """'br', 'gzip' or None for an Accept-Encoding header"""
+    accepted = set()
+    for item in (accept_encoding or '').lower().split(','):
+        name, _, params = item.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(name.strip())
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of one encoding of a response: "abc" -> "abc-br" (weak stays weak)"""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def identity_etags(if_none_match: str):
+    """(If-None-Match with the encoding suffixes removed, encoding of the first suffixed tag or None)"""
+    found = None
+    tags = []
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        for encoding in SIBLING_SUFFIXES:
+            if tag.endswith(f'-{encoding}"'):
+                tag = tag[:-len(encoding) - 2] + '"'
+                found = found or encoding
+                break
+        tags.append(tag)
+    return ', '.join(tags), found
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size=MINIMUM_SIZE, cache_bytes=CACHE_BYTES, max_buffer=MAX_BUFFER, stats=None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_bytes = cache_bytes
+        self.max_buffer = max_buffer
+        self.cache = OrderedDict()   # (path, etag, encoding) -> compressed body
+        self.cached_bytes = 0
+        self.stats = Counter() if stats is None else stats  # hit / miss / dynamic
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] != 'GET':
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = accepted_encoding(request_headers.get('accept-encoding'))
+        # the app compares If-None-Match with its identity ETag
+        revalidated = None
+        if 'if-none-match' in request_headers:
+            if_none_match, revalidated = identity_etags(request_headers['if-none-match'])
+            if revalidated is not None:
+                scope = {**scope, 'headers': [(name, value) for name, value in scope['headers']
+                                              if name != b'if-none-match']
+                         + [(b'if-none-match', if_none_match.encode('latin-1'))]}
+        start = None
+        chunks = []
+        size = 0
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(raw=message['headers'])
+                if message['status'] == 304 and revalidated is not None and 'etag' in headers:
+                    # the client revalidated an encoded copy: confirm that copy's ETag
+                    headers['ETag'] = encoded_etag(headers['etag'], revalidated)
+                content_type = headers.get('content-type', '')
+                if not is_compressible(content_type):
+                    passthrough = True
+                    await send(message)
+                    return
+                if 'accept-encoding' not in headers.get('vary', '').lower():
+                    headers.add_vary_header('Accept-Encoding')
+                length = headers.get('content-length')
+                if (encoding is None or message['status'] != 200 or 'content-encoding' in headers
+                        or (length is not None and not self.minimum_size <= int(length) <= self.max_buffer)):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+            if message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            chunks.append(message.get('body', b''))
+            size += len(chunks[-1])
+            if size > self.max_buffer:
+                # too big to hold: send what we have as it is
+                passthrough = True
+                await send(start)
+                await send({'type': 'http.response.body', 'body': b''.join(chunks), 'more_body': True})
+                if not message.get('more_body', False):
+                    await send({'type': 'http.response.body', 'body': b''})
+                return
+            if message.get('more_body', False):
+                return
+
+            body = b''.join(chunks)
+            headers = MutableHeaders(raw=start['headers'])
+            if len(body) >= self.minimum_size:
+                body = await self.compressed(scope['path'], headers.get('etag'), body, encoding)
+                headers['Content-Encoding'] = encoding
+                if 'etag' in headers:
+                    headers['ETag'] = encoded_etag(headers['etag'], encoding)
+                if 'accept-ranges' in headers:
+                    del headers['accept-ranges']  # byte ranges of the identity body no longer apply
+            headers['Content-Length'] = str(len(body))
+            await send(start)
+            await send({'type': 'http.response.body', 'body': body})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def compressed(self, path, etag, body, encoding):
+        if etag is None:
+            self.stats['dynamic'] += 1
+            return await self._compress(body, encoding, DYNAMIC_LEVELS[encoding])
+        key = (path, etag, encoding)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            self.stats['hit'] += 1
+            return cached
+        self.stats['miss'] += 1
+        cached = await self._compress(body, encoding, STATIC_LEVELS[encoding])
+        self.cache[key] = cached
+        self.cached_bytes += len(cached)
+        while self.cached_bytes > self.cache_bytes and len(self.cache) > 1:
+            _, dropped = self.cache.popitem(last=False)
+            self.cached_bytes -= len(dropped)
+        return cached
+
+    async def _compress(self, body, encoding, level):
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(compress, body, encoding, level)
+        return compress(body, encoding, level)
+
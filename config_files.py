@@ -0,0 +1,73 @@
+"""
+In-memory JSON config files (manifest.json, screens.json)
+Each file is parsed once and kept as a compact serialized body with its
+ETag, so a request costs a dict lookup (or a 304). Edits on disk are picked
+up by an mtime check, done at most once per check_interval seconds.
+"""
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
+from starlette.responses import Response
+
+CHECK_INTERVAL = 1.0
+
+
+class ConfigFile:
+    def __init__(self, path, check_interval=CHECK_INTERVAL):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self.data = None
+        self.body = b''
+        self.etag = ''
+        self.stats = Counter()
+        self._stamp = None       # (mtime_ns, size) of the loaded file
+        self._checked = 0.0
+        self.load()
+
+    def load(self):
+        """(Re)read and parse the file; a broken edit keeps the last good version"""
+        stat = os.stat(self.path)
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        try:
+            data = json.loads(raw)
+        except ValueError as error:
+            if self.data is None:
+                raise
+            print(f"✗ {self.path.name} is not valid JSON, keeping the loaded version: {error}")
+        else:
+            self.data = data
+            self.body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            self.etag = f'"{hashlib.sha1(self.body).hexdigest()[:16]}"'
+            self.stats['miss'] += 1  # (re)loaded from disk
+        self._stamp = (stat.st_mtime_ns, stat.st_size)
+        self._checked = time.monotonic()
+        return self
+
+    def refresh(self):
+        """Reload when the file changed on disk (stat at most every check_interval)"""
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return self
+        self._checked = now
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return self  # deleted or being replaced: keep serving what we have
+        if (stat.st_mtime_ns, stat.st_size) != self._stamp:
+            self.load()
+        return self
+
+    def response(self, request, media_type='application/json'):
+        """Response honouring If-None-Match"""
+        self.refresh()
+        headers = {'ETag': self.etag, 'Cache-Control': 'no-cache'}
+        if request.headers.get('if-none-match') == self.etag:
+            self.stats['not_modified'] += 1
+            return Response(status_code=304, headers=headers)
+        self.stats['hit'] += 1
+        return Response(self.body, media_type=media_type, headers=headers)
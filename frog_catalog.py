@@ -0,0 +1,71 @@
+"""
+Frog catalog shared by the web app (main_web.py) and the Kivy screens
+One immutable record per frog, built once at import, with O(1) lookup
+indexes by id, ind_name and URL slug.
+"""
+import hashlib
+import re
+from dataclasses import astuple, dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class Frog:
+    id: str          # short code, also the asset prefix (ggf -> GGF.png)
+    name: str        # display name with a line break for grid labels
+    ind_name: str    # full name, used in /frog/{ind_name} URLs
+    species: str
+    photo: str       # asset paths relative to the app folder
+    video: str
+    preview: str
+
+    @property
+    def label(self) -> str:
+        """Display name on one line"""
+        return self.name.replace('\n', ' ')
+
+    @property
+    def slug(self) -> str:
+        """URL-friendly name, e.g. peron-s-tree-frog"""
+        return slugify(self.ind_name)
+
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def _frog(code, name, ind_name, species):
+    return Frog(
+        id=code.lower(),
+        name=name,
+        ind_name=ind_name,
+        species=species,
+        photo=f'assets/{code}.png',
+        video=f'assets/{code}_resized.mp4',
+        preview=f'assets/{code}_spec_safe3_preview.jpg',
+    )
+
+
+FROGS = (
+    _frog('GGF', 'Growling Grass\nFrog', 'Growling Grass Frog', 'Ranoidea (nee Litoria) raniformis'),
+    _frog('SBTF', 'Southern Brown\nTree Frog', 'Southern Brown Tree Frog', 'Litoria ewingii'),
+    _frog('PTF', "Peron's Tree\nFrog", "Peron's Tree Frog", 'Litoria peronii'),
+    _frog('PBF', 'Pobblebonk\nFrog', 'Pobblebonk Frog', 'Limnodynastes dumerili'),
+    _frog('CF', 'Common\nFroglet', 'Common Froglet', 'Crinia signifera'),
+    _frog('CSFT', 'Common Spadefoot\nToad', "Sudell's Frog", 'Neobatrachus sudelli'),
+    _frog('ESBF', 'Eastern Sign-bearing\nFroglet', 'Eastern Sign-bearing Froglet', 'Geocrinia victoriana'),
+    _frog('SMF', 'Spotted Marsh\nFrog', 'Spotted Marsh Frog', 'Limnodynastes tasmaniensis'),
+)
+
+# Lookup indexes (read-only views)
+FROGS_BY_ID = MappingProxyType({frog.id: frog for frog in FROGS})
+FROGS_BY_IND_NAME = MappingProxyType({frog.ind_name: frog for frog in FROGS})
+FROGS_BY_SLUG = MappingProxyType({frog.slug: frog for frog in FROGS})
+
+# Changes whenever any record changes (used for cache invalidation and health reports)
+CATALOG_VERSION = hashlib.sha1(repr([astuple(frog) for frog in FROGS]).encode()).hexdigest()[:8]
+
+
+def find_frog(key: str):
+    """Look a frog up by ind_name, URL slug or id; None if unknown"""
+    return FROGS_BY_IND_NAME.get(key) or FROGS_BY_SLUG.get(key) or FROGS_BY_ID.get(key)
@@ -84,7 +84,7 @@ class LazyScreenManager(ScreenManager):
         Load frog detail screen and pass frog data.
         
         Args:
-            frog: Dictionary containing frog data
+            frog: Frog record from frog_catalog
         """
         # Load screen if needed
         self.load_screen('frog')
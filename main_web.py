@@ -1,399 +1,188 @@
-from nicegui import ui, app
-from datetime import datetime
+from nicegui import ui, app, Client, background_tasks
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pathlib import Path
-import random
+import logging
 import platform
 import os
+import sys
+import time
 import json
+from asset_manifest import AssetManifest, HashedStaticFiles, IMMUTABLE_CACHE_CONTROL, best_image_format
+from video_streaming import video_response
+from frog_catalog import CATALOG_VERSION, FROGS, find_frog
+from static_pages import PageCache, STATIC_PAGES, player_scripts, quiz_payload, render_mystery, shared_head_html, video_source
+from quiz_stats import EVENTS_URL, MAX_BATCH_BYTES, QuizStats
+from service_worker import render_service_worker
+from site_export import page_renderers, page_url
+from metrics import Metrics, MetricsMiddleware
+from client_lifecycle import ClientLifecycle
+from config_files import ConfigFile
+from compression import CompressionMiddleware
+from uvicorn_config import DEFAULT_PROFILE, server_profile
+from collections import Counter
+
+
+ASSETS_DIR = Path(__file__).parent / 'assets'
+
+## Content-hashed asset URLs: saved at image build time (python -m asset_build web),
+## rebuilt at startup when missing or when any asset changed since
+MANIFEST_CACHE = Path(__file__).parent / 'build' / 'asset_manifest.json'
+asset_manifest = AssetManifest(ASSETS_DIR)
+if not asset_manifest.load_saved(MANIFEST_CACHE):
+    asset_manifest.build()
+
+## local assets folder - hashed names are served with immutable caching
+assets_handler = HashedStaticFiles(directory=ASSETS_DIR, manifest=asset_manifest)
+
+@app.api_route('/assets/{path:path}', methods=['GET', 'HEAD'])
+async def serve_asset(path: str, request: Request):
+    return await assets_handler.get_response(path, request.scope)
+
+## Stream frog call videos with HTTP Range support (seek/replay only fetch needed bytes)
+@app.api_route('/video/{filename}', methods=['GET', 'HEAD'])
+async def serve_video(filename: str, request: Request):
+    logical = asset_manifest.resolve(filename)
+    if logical is not None:
+        return video_response(request, ASSETS_DIR, logical, cache_control=IMMUTABLE_CACHE_CONTROL)
+    return video_response(request, ASSETS_DIR, filename)
+
+## Serve manifest.json / screens.json from memory (ETag, reloaded when edited)
+CONFIG_FILES = {
+    '/manifest.json': (ConfigFile(Path(__file__).parent / 'manifest.json'), 'application/manifest+json'),
+    '/screens.json': (ConfigFile(Path(__file__).parent / 'screens.json'), 'application/json'),
+}
 
-
-## local assets folder
-app.add_static_files('/assets', Path(__file__).parent / 'assets')
-
-## Serve manifest.json via custom route
 @app.get('/manifest.json')
-async def serve_manifest():
-    manifest_path = Path(__file__).parent / 'manifest.json'
-    with open(manifest_path, 'r') as f:
-        return json.load(f)
+@app.get('/screens.json')
+async def serve_config_file(request: Request):
+    config_file, media_type = CONFIG_FILES[request.url.path]
+    return config_file.response(request, media_type)
 
 ## def helper function 
 def resource_path(rel_path: str) -> str:
-    # return proper URL path for assets
-    if rel_path.startswith('assets/'):
-        rel_path = rel_path.replace('assets/', '', 1)
-    return f'/assets/{rel_path}'
-
-
-## Frog data 
-frogs_list = [
-        {"name": "Growling Grass \nFrog", "photo": "/assets/GGF.png", "Species name": "Ranoidea (nee Litoria) raniformis",
-        "video": "/assets/GGF_resized.mp4", "preview": "/assets/GGF_spec_safe3_preview.jpg",
-        "ind_name": "Growling Grass Frog"},
-        {"name": "Southern Brown \nTree Frog", "photo": "/assets/SBTF.png", "Species name": "Litoria ewingii", 
-        "video": "/assets/SBTF_resized.mp4", "preview":"/assets/SBTF_spec_safe3_preview.jpg",
-        "ind_name": "Southern Brown Tree Frog"},
-        {"name": "Peron's Tree \nFrog", "photo": "/assets/PTF.png", "Species name": "Litoria peronii",
-        "video": "/assets/PTF_resized.mp4", "preview": "/assets/PTF_spec_safe3_preview.jpg",
-        "ind_name": "Peron's Tree Frog"},
-        {"name": "Pobblebonk \nFrog", "photo": "/assets/PBF.png", "Species name": "Limnodynastes dumerili",
-        "video": "/assets/PBF_resized.mp4", "preview": "/assets/PBF_spec_safe3_preview.jpg",
-        "ind_name": "Pobblebonk Frog"},
-        {"name": "Common \nFroglet", "photo": "/assets/CF.png", "Species name": "Crinia signifera",
-        "video": "/assets/CF_resized.mp4", "preview": "/assets/CF_spec_safe3_preview.jpg",
-        "ind_name": "Common Froglet"},
-        {"name": "Common Spadefoot \nToad", "photo": "/assets/CSFT.png", "Species name": "Neobatrachus sudelli",
-        "video": "/assets/CSFT_resized.mp4", "preview": "/assets/CSFT_spec_safe3_preview.jpg",
-        "ind_name": "Sudell's Frog"},
-        {"name": "Eastern Sign-bearing \nFroglet", "photo": "/assets/ESBF.png", "Species name" : "Geocrinia victoriana",
-        "video": "/assets/ESBF_resized.mp4", "preview": "/assets/ESBF_spec_safe3_preview.jpg",
-        "ind_name": "Eastern Sign-bearing Froglet"},
-        {"name": "Spotted Marsh \nFrog", "photo": "/assets/SMF.png", "Species name" : "Limnodynastes tasmaniensis",
-        "video": "/assets/SMF_resized.mp4", "preview": "/assets/SMF_spec_safe3_preview.jpg",
-        "ind_name": "Spotted Marsh Frog"},
-    ]
-
-
-# --- Home page ---
-@ui.page('/')
-def home_page():  
-    # Add PWA meta tags for mobile
-    ui.add_head_html('''
-        <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1, user-scalable=no">
-        <meta name="mobile-web-app-capable" content="yes">
-        <meta name="apple-mobile-web-app-capable" content="yes">
-        <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
-        <meta name="theme-color" content="#2E8B57">
-        <link rel="manifest" href="/manifest.json">
-        <link rel="apple-touch-icon" href="/assets/UnknownFrog.png">
-    ''')
-    
-    # Add fullscreen functionality - triggers silently on first user interaction
-    ui.add_head_html('''
-        <script>
-        let fullscreenRequested = false;
-        
-        function triggerFullscreen(e) {
-            if (!fullscreenRequested && e && e.isTrusted) {
-                fullscreenRequested = true;
-                
-                const elem = document.documentElement;
-                if (elem.requestFullscreen) {
-                    elem.requestFullscreen().catch(() => {
-                        fullscreenRequested = false;
-                    });
-                } else if (elem.webkitRequestFullscreen) {
-                    elem.webkitRequestFullscreen();
-                } else if (elem.mozRequestFullScreen) {
-                    elem.mozRequestFullScreen();
-                } else if (elem.msRequestFullScreen) {
-                    elem.msRequestFullScreen();
-                }
-                
-                // Remove listeners after first attempt
-                document.removeEventListener('click', triggerFullscreen);
-                document.removeEventListener('touchstart', triggerFullscreen);
-                document.removeEventListener('mousedown', triggerFullscreen);
-                document.removeEventListener('keydown', triggerFullscreen);
-            }
-        }
-        
-        // Setup listeners on page load
-        window.addEventListener('load', function() {
-            document.addEventListener('click', triggerFullscreen);
-            document.addEventListener('touchstart', triggerFullscreen);
-            document.addEventListener('mousedown', triggerFullscreen);
-            document.addEventListener('keydown', triggerFullscreen);
-        });
-        </script>
-    ''')
-
-    # ✅ Set the background color for the whole page
-    ui.query('body').classes('bg-green-700')  # Tailwind green
-    ui.query('body').style('background-color: #2E8B57;')  # fallback if classes don't apply
-
-    # ✅ Title label - Responsive font size
-    with ui.row().classes("justify-center items-center w-full px-4"):
-        ui.label('Select a frog to see and hear its call').classes(
-            'text-xl sm:text-2xl md:text-3xl lg:text-4xl text-center text-white my-4'
-        )
-
-    # ✅ Responsive grid layout - 1 col for screens < 800px, 5 cols for larger screens
-    with ui.grid(columns=5).classes(
-        'grid-cols-1 md:grid-cols-5 '
-        'gap-4 sm:gap-6 w-full px-4 py-4 max-w-7xl mx-auto justify-items-center'
-    ):
-        with ui.column().classes('items-center gap-2 w-full max-w-xs'):
-            with ui.button(color='transparent', on_click=lambda: ui.navigate.to('/instructions')).classes(
-                'p-0 border-none w-full aspect-square max-w-[250px]'
-            ):
-                ui.image('/assets/App_overview.png').classes(
-                    'w-full h-full object-cover rounded-2xl shadow-lg'
-                )
-            ui.label("How spectrograms show sound").classes(
-                'text-base sm:text-lg md:text-xl lg:text-2xl font-medium text-center text-white'
-            )     
-        for frog in frogs_list:
-            with ui.column().classes('items-center gap-2 w-full max-w-xs'):  
-                # Button only contains the image
-                with ui.button(
-                    color='transparent',
-                    on_click=lambda f=frog: ui.navigate.to(f'/frog/{f["ind_name"]}')
-                ).classes('p-0 border-none w-full aspect-square max-w-[250px]'):
-                    ui.image(frog['photo']).classes(
-                        'w-full h-full object-cover rounded-2xl shadow-lg'
-                    )
-                    
-                # Label below the button
-                ui.label(frog['name']).classes(
-                    'text-base sm:text-lg md:text-xl lg:text-2xl font-medium text-center text-white'
-                )
-            
-        with ui.column().classes('items-center gap-2 w-full max-w-xs'):
-            with ui.button(color='transparent', on_click=lambda: ui.navigate.to('/mystery')).classes(
-                'p-0 border-none w-full aspect-square max-w-[250px]'
-            ):
-                ui.image('/assets/UnknownFrog.png').classes(
-                    'w-full h-full object-cover rounded-2xl shadow-lg'
-                )
-            ui.label("Mystery Frog").classes(
-                'text-base sm:text-lg md:text-xl lg:text-2xl font-medium text-center text-white'
-            )     
-      
-                    
-
-    # ✅ App info button at bottom - centered and responsive
-    with ui.row().classes('w-full justify-center mt-4 px-4'):
-        ui.button('App Info', on_click=lambda: ui.navigate.to('/app_info')).props('raised').classes(
-            'bg-green-600 text-white text-lg sm:text-xl px-6 py-3 rounded-lg shadow-md hover:bg-green-700'
-        )
-
-    # ✅ Invisible triple-tap exit (top-left corner)
-    exit_state = {"taps": 0, "last_tap": None}
-
-    def triple_tap_exit(e):
-        now = datetime.now()
-        if exit_state["last_tap"] and (now - exit_state["last_tap"]).total_seconds() > 1:
-            exit_state["taps"] = 0
-        exit_state["taps"] += 1
-        exit_state["last_tap"] = now
-        if exit_state["taps"] >= 3:
-            ui.notify('Exiting app...')
-            app.shutdown()
-
-    ui.button('', on_click=triple_tap_exit).style(
-        'position: fixed; top:0px; left:0px; width:80px; height:80px; opacity:0;'
-    )
-
-
-#####################################
-# --- Instructions page ---
-@ui.page('/instructions')
-def instructions_page():
-
-    # Request fullscreen on user interaction
-    ui.add_head_html('''
-        <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            function tryFullscreen(e) {
-                if (e.isTrusted) {
-                    const elem = document.documentElement;
-                    if (elem.requestFullscreen) {
-                        elem.requestFullscreen().catch(err => console.log('Fullscreen:', err.message));
-                    } else if (elem.webkitRequestFullscreen) {
-                        elem.webkitRequestFullscreen();
-                    }
-                    document.removeEventListener('click', tryFullscreen);
-                }
-            }
-            if (!document.fullscreenElement && !document.webkitFullscreenElement) {
-                document.addEventListener('click', tryFullscreen, { once: true });
-            }
-        });
-        </script>
-    ''')
-
-    # 🌿 Background (optional, to match your theme)
-    #ui.query('body').style('background-color: #2E8B57; color: white;')
-
-    with ui.column().classes("w-full min-h-screen items-center justify-start bg-white px-4 py-6"):
-        # --- Header ---
-        with ui.row().classes("items-center justify-center w-full mb-4"):
-            ui.label('Spectrograms display the frequency and amplitude of sound').classes(
-                'text-xl sm:text-2xl md:text-3xl text-center font-bold text-green-800'
-            )
+    # return the content-hashed URL for an asset
+    # (videos go through the Range-aware /video streaming route)
+    return asset_manifest.url(rel_path)
 
-        # --- Top Info Boxes (Two side-by-side on desktop, stacked on mobile) ---
-        with ui.row().classes('justify-center gap-4 sm:gap-8 md:gap-12 lg:gap-20 mb-6 flex-wrap w-full'):
-            ui.html("""
-                <div style="font-size: 18px; max-width: 500px; text-align: left;">
-                    Sounds are vibrations and the number of vibrations per second
-                    determines the <b>frequency</b> or pitch of a sound.<br>
-                    <b>Low pitch:</b> drum roll, growl<br>
-                    <b>High pitch:</b> whistle, jingling keys
-                </div>
-            """, sanitize=False).classes('text-sm sm:text-base md:text-lg lg:text-xl')
-            ui.html("""
-                <div style="font-size: 18px; max-width: 500px; text-align: left;">
-                    The size of sound waves determines <b>amplitude</b> — the larger the wave, the louder the sound.<br>
-                    <b>Low amplitude:</b> whispering<br>
-                    <b>High amplitude:</b> yelling
-                </div>
-            """, sanitize=False).classes('text-sm sm:text-base md:text-lg lg:text-xl')
-
-        # --- Middle Image - Responsive ---
-        ui.image('/assets/example.png').classes(
-            "w-full max-w-5xl h-auto rounded-xl shadow-md border border-gray-300 mb-6"
-        )
-
-        # --- Bottom Row: Back Button + 2 Text Boxes (stacked on mobile) ---
-        with ui.row().classes('justify-center items-center gap-4 sm:gap-8 md:gap-12 lg:gap-20 flex-wrap w-full'):
-            # Back button
-            with ui.button(on_click=lambda: ui.navigate.to('/'), color='transparent').classes(
-                'p-0 border-none w-24 h-24 sm:w-28 sm:h-28 md:w-32 md:h-32'
-            ):
-                ui.image('/assets/Arrow.png').classes(
-                    'w-full h-full object-cover rounded-xl shadow-lg'
-                )
+def responsive_image(rel_path: str, sizes: str, image_format: str = 'png'):
+    # ui.image with srcset variants (assets/variants) in the negotiated format
+    src, srcset = asset_manifest.srcset(rel_path, image_format)
+    image = ui.image(src)
+    if srcset:
+        image.props(f'srcset="{srcset}" sizes="{sizes}"')
+    return image
 
-            # Text boxes next to the button (stacked on mobile)
-            ui.html("""
-                <div style="font-size: 18px; max-width: 300px; text-align: center;">
-                    The call in the <b>green box</b> has a higher <b>frequency</b>.
-                </div>
-            """, sanitize=False).classes(
-                "border-4 border-green-400 rounded-lg p-4 sm:p-6 shadow-md "
-                "text-sm sm:text-base md:text-lg lg:text-xl"
-            )
-            ui.html("""
-                <div style="font-size: 18px; max-width: 300px; text-align: center;">
-                    The call in the <b>yellow box</b> is higher in <b>amplitude</b>.
-                </div>
-            """, sanitize=False).classes(
-                "border-4 border-yellow-400 rounded-lg p-4 sm:p-6 shadow-md "
-                "text-sm sm:text-base md:text-lg lg:text-xl"
-            )
-            
 
-##########################
-# --- Health Check Endpoint (for keep-alive pings) ---
-@ui.page('/health')
-def health_check():
-    """Simple health check endpoint for monitoring/keep-alive"""
-    return {'status': 'ok', 'timestamp': __import__('time').time()}
+# --- Pre-rendered static pages (home, instructions, app info) ---
+# Rendered once per process and per image format, no NiceGUI client per visitor
+page_cache = PageCache()
+
+def static_page(request: Request, name: str):
+    # AVIF / WebP / PNG variants depending on what the browser accepts
+    image_format = best_image_format(request.headers.get('accept', ''))
+    render = STATIC_PAGES[name]
+    return page_cache.response(request, (name, image_format),
+                               lambda: render(asset_manifest, image_format))
+
+def nicegui_head_html():
+    # the shared bundle plus the video loaders used by the NiceGUI frog page
+    return shared_head_html(asset_manifest) + '\n' + player_scripts(asset_manifest)
+
+def refresh_assets():
+    """Invalidation hook: rebuild the asset manifest and drop cached pages"""
+    old_head = nicegui_head_html()
+    asset_manifest.build()
+    page_cache.invalidate()
+    readiness.update(asset_readiness())
+    Client.shared_head_html = Client.shared_head_html.replace(old_head, nicegui_head_html())
+
+
+## Fullscreen script + video styles and the video loaders (stream.js, listen.js):
+## hashed, immutable files, registered once for every NiceGUI page instead of
+## added by each page handler
+ui.add_head_html(nicegui_head_html(), shared=True)
+
+
+@app.get('/')
+async def home_page(request: Request):
+    return static_page(request, 'home')
+
+
+@app.get('/instructions')
+async def instructions_page(request: Request):
+    return static_page(request, 'instructions')
+
+
+@app.get('/app_info')
+async def app_info_page(request: Request):
+    return static_page(request, 'app_info')
+
+
+def from_loopback(request: Request) -> bool:
+    # the peer after proxy headers (uvicorn_config trusts FORWARDED_ALLOW_IPS only)
+    return request.client is not None and request.client.host in ('127.0.0.1', '::1')
+
+## Invisible triple-tap exit on the home page (kiosk / Android WebView only)
+@app.post('/exit')
+async def exit_app(request: Request):
+    if not from_loopback(request):
+        return Response(status_code=403)
+    app.shutdown()
+    return {'status': 'exiting'}
+
+## After replacing files in assets/ without a restart (per process: with
+## multiworker.py, post to each worker's port)
+##    curl -X POST http://127.0.0.1:8080/admin/refresh-assets
+@app.post('/admin/refresh-assets')
+async def refresh_assets_route(request: Request):
+    if not from_loopback(request):
+        return Response(status_code=403)
+    refresh_assets()
+    return {'status': 'refreshed', 'assets': len(asset_manifest.reverse)}
 
 
 ##########################
-# --- App Info page ---
-@ui.page('/app_info')
-def app_info_page():
-    
-    # Request fullscreen on user interaction
-    ui.add_head_html('''
-        <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            function tryFullscreen(e) {
-                if (e.isTrusted) {
-                    const elem = document.documentElement;
-                    if (elem.requestFullscreen) {
-                        elem.requestFullscreen().catch(err => console.log('Fullscreen:', err.message));
-                    } else if (elem.webkitRequestFullscreen) {
-                        elem.webkitRequestFullscreen();
-                    }
-                    document.removeEventListener('click', tryFullscreen);
-                }
-            }
-            if (!document.fullscreenElement && !document.webkitFullscreenElement) {
-                document.addEventListener('click', tryFullscreen, { once: true });
-            }
-        });
-        </script>
-    ''')
-    
-    with ui.column().classes("w-full min-h-screen items-center justify-start bg-gray-100 px-4 py-6"):
+# --- Health Check Endpoints (for keep-alive pings and deploy checks) ---
+# Plain FastAPI routes: no NiceGUI client or page is built per ping.
+# Readiness is worked out when the assets are (re)built, not per request.
+def asset_readiness() -> dict:
+    missing = [name for frog in FROGS for name in (frog.photo, frog.video)
+               if name not in asset_manifest]
+    return {
+        'assets_dir': ASSETS_DIR.is_dir(),
+        'assets': len(asset_manifest.entries),
+        'assets_version': asset_manifest.version,
+        'missing_assets': missing,
+        'catalog_version': CATALOG_VERSION,
+        'frogs': len(FROGS),
+    }
 
-        with ui.row().classes("justify-center w-full mb-4"):
-            ui.label('App Info').classes('text-2xl sm:text-3xl md:text-4xl text-center font-bold')
-        
-        with ui.row().props('flat bordered').style('padding:20px; border-radius: 15px'):
-            ui.html("""
-                    <div style="font-size: 22px; max-width: 800px; text-align: center;">
-                    This app was created and designed by <b>Katie Howard</b> for the exhibition <i>'Litoria's Wetland World'</i>.<br><br>
-                    Sound files were provided by the Arthur Rylah Institute for Environmental Research (DEECA) and compiled with help from Louise Durkin.<br>
-                    Spectrograms were created using PASE (Python-Audio-Spectrogram-Explorer).<br><br>
-                    All photos provided by Katie Howard except for those listed below, which are used with permission from:<br>
-                    - Zak Atkins: Peron's Tree Frog<br>
-                    - Geoff Heard : Pobblebonk Frog and Spotted Marsh Frog<br>
-                    </div>
-            """, sanitize=False)
-        
-        with ui.row().style('justify-content: center; gap: 10px; margin-top: 10px; flex-wrap: wrap;'):
-            # Back button
-            with ui.button(on_click=lambda: ui.navigate.to('/'), color='transparent').style(
-                'padding:0; border:none; width: 180px; height: 180px;'
-            ):
-                ui.image('/assets/Arrow.png').style(
-                    'width: 100%; height: 100%; object-fit: cover; border-radius: 15px; '
-                    'box-shadow: 0 4px 10px rgba(0,0,0,0.4);'
-                )
+readiness = asset_readiness()
+
+
+@app.get('/health')
+async def health_check():
+    """Liveness: the process answers"""
+    return {'status': 'ok', 'timestamp': time.time(), 'catalog_version': CATALOG_VERSION}
+
+
+@app.get('/health/ready')
+async def readiness_check():
+    """Readiness: assets folder present and every catalog photo and video hashed"""
+    ready = readiness['assets_dir'] and not readiness['missing_assets']
+    return JSONResponse({'status': 'ok' if ready else 'unavailable', **readiness},
+                        status_code=200 if ready else 503)
 
 
 #################################
 # --- Individual frog page ---
 # --- Frog Detail Page ---
 @ui.page('/frog/{frog_name}')
-def frog_detail_page(frog_name: str):
+def frog_detail_page(frog_name: str, request: Request):
+    image_format = best_image_format(request.headers.get('accept', ''))
     
-    # Request fullscreen on user interaction
-    ui.add_head_html('''
-        <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            function tryFullscreen(e) {
-                if (e.isTrusted) {
-                    const elem = document.documentElement;
-                    if (elem.requestFullscreen) {
-                        elem.requestFullscreen().catch(err => console.log('Fullscreen:', err.message));
-                    } else if (elem.webkitRequestFullscreen) {
-                        elem.webkitRequestFullscreen();
-                    }
-                    document.removeEventListener('click', tryFullscreen);
-                }
-            }
-            if (!document.fullscreenElement && !document.webkitFullscreenElement) {
-                document.addEventListener('click', tryFullscreen, { once: true });
-            }
-        });
-        </script>
-    ''')
-    
-    # Simulate loading frog info
-    frogs_list = [
-        {"name": "Growling Grass \nFrog", "photo": "assets/GGF.png", "Species name": "Ranoidea (nee Litoria) raniformis",
-        "video": "assets/GGF_resized.mp4", "preview": "assets/GGF_spec_safe3_preview.jpg",
-        "ind_name": "Growling Grass Frog"},
-        {"name": "Southern Brown \nTree Frog", "photo": "assets/SBTF.png", "Species name": "Litoria ewingii", 
-        "video": "assets/SBTF_resized.mp4", "preview":"assets/SBTF_spec_safe3_preview.jpg",
-        "ind_name": "Southern Brown Tree Frog"},
-        {"name": "Peron's Tree \nFrog", "photo": "assets/PTF.png", "Species name": "Litoria peronii",
-        "video": "assets/PTF_resized.mp4", "preview": "assets/PTF_spec_safe3_preview.jpg",
-        "ind_name": "Peron's Tree Frog"},
-        {"name": "Pobblebonk \nFrog", "photo": "assets/PBF.png", "Species name": "Limnodynastes dumerili",
-        "video": "assets/PBF_resized.mp4", "preview": "assets/PBF_spec_safe3_preview.jpg",
-        "ind_name": "Pobblebonk Frog"},
-        {"name": "Common \nFroglet", "photo": "assets/CF.png", "Species name": "Crinia signifera",
-        "video": "assets/CF_resized.mp4", "preview": "assets/CF_spec_safe3_preview.jpg",
-        "ind_name": "Common Froglet"},
-        {"name": "Common Spadefoot \nToad", "photo": "assets/CSFT.png", "Species name": "Neobatrachus sudelli",
-        "video": "assets/CSFT_resized.mp4", "preview": "assets/CSFT_spec_safe3_preview.jpg",
-        "ind_name": "Sudell's Frog"},
-        {"name": "Eastern Sign-bearing \nFroglet", "photo": "assets/ESBF.png", "Species name" : "Geocrinia victoriana",
-        "video": "assets/ESBF_resized.mp4", "preview": "assets/ESBF_spec_safe3_preview.jpg",
-        "ind_name": "Eastern Sign-bearing Froglet"},
-        {"name": "Spotted Marsh \nFrog", "photo": "assets/SMF.png", "Species name" : "Limnodynastes tasmaniensis",
-        "video": "assets/SMF_resized.mp4", "preview": "assets/SMF_spec_safe3_preview.jpg",
-        "ind_name": "Spotted Marsh Frog"},
-    ]
-    frog = next((f for f in frogs_list if f['ind_name'] == frog_name), None)
+    frog = find_frog(frog_name)
     if not frog:
         ui.label('Frog not found!').classes('text-red-500 text-xl')
         return
@@ -401,38 +190,23 @@ def frog_detail_page(frog_name: str):
     with ui.column().classes("w-full h-screen justify-center bg-white"):
         # --- Header ---
         with ui.row().classes('justify-center items-center w-full'):
-            ui.label(frog["ind_name"]).classes('text-3xl font-bold')
-            ui.label(frog["Species name"]).classes('text-3xl font-bold italic ml-2')
+            ui.label(frog.ind_name).classes('text-3xl font-bold')
+            ui.label(frog.species).classes('text-3xl font-bold italic ml-2')
 
 
         # --- Video (no native controls) ---
-        video = ui.video(resource_path(frog["video"])).props('preload="auto" muted disablepictureinpicture').classes(
+        # preload none: FrogStream (assets/js/stream.js) picks the adaptive
+        # bitrate rung, or loads this MP4 when no ladder was built; in listen
+        # mode (assets/js/listen.js) the video is hidden and audio over a still
+        # goes into listen_view (Vue owns the <video>, so it is never replaced)
+        video = ui.video(resource_path(frog.video)).props('preload="none" muted disablepictureinpicture').classes(
             "w-full max-w-5x1 h-auto rounded-xl shadow-md border border-gray-300"
         ).style('pointer-events: none;')
+        listen_view = ui.element('div').classes('w-full')
         
-        # Hide controls completely with CSS
-        ui.add_head_html('''
-            <style>
-            video::-webkit-media-controls {
-                display: none !important;
-            }
-            video::-webkit-media-controls-enclosure {
-                display: none !important;
-            }
-            video::-webkit-media-controls-panel {
-                display: none !important;
-            }
-            video::-moz-media-controls {
-                display: none !important;
-            }
-            video::-ms-media-controls {
-                display: none !important;
-            }
-            </style>
-        ''')
-        
-        # pause initially to show first frame (no autoplay)
-        ui.run_javascript('document.querySelector("video").pause()')
+        # load the first frame without autoplay
+        ui.run_javascript(f'FrogListen.mount(getHtmlElement({video.id}), '
+                          f'{json.dumps(video_source(asset_manifest, frog.video))}, getHtmlElement({listen_view.id}))')
 
         play_icon = None
         ## Controls row ---
@@ -453,7 +227,7 @@ def frog_detail_page(frog_name: str):
                 set_icon()
 
             # 🐸 Frog image
-            ui.image(resource_path(frog["photo"])).classes(
+            responsive_image(frog.photo, '256px', image_format).classes(
                 'w-64 h-64 object-contain rounded-xl shadow-md'
             )
                 
@@ -462,25 +236,26 @@ def frog_detail_page(frog_name: str):
             with ui.button(on_click=lambda: ui.navigate.to('/'), color='transparent').style(
                 'padding:0; border:none; width: 180px; height: 180px;'
             ):
-                ui.image('/assets/Arrow.png').style(
+                ui.image(resource_path('Arrow.png')).style(
                     'object-fit: cover; border-radius: 15px; box-shadow: 0 4px 10px rgba(0,0,0,0.4);'
                 )
 
         # --- Toggle logic ---
         def toggle_video():
+            client_lifecycle.touch()
         # toggle play/pause in browser and unmute when playing
-            ui.run_javascript("""
-                const video = document.querySelector('video');
-                if (video.paused) { 
+            ui.run_javascript(f"""
+                const video = getHtmlElement({listen_view.id}).querySelector('audio') || getHtmlElement({video.id});
+                if (video.paused) {{ 
                     video.muted = false;  // Unmute when playing
                     video.play(); 
-                } 
-                else { 
+                }} 
+                else {{ 
                     video.pause(); 
-                }
+                }}
             """)
         # update play icon
-            if play_icon.source.endswith('PLAY.png'):
+            if play_icon.source == resource_path('PLAY.png'):
                 play_icon.source = resource_path('PAUSE.png')
             else:
                 play_icon.source = resource_path('PLAY.png')
@@ -489,241 +264,115 @@ def frog_detail_page(frog_name: str):
 
 #################################
 ## -----Mystery Frog Page----##
-@ui.page('/mystery')
-def mystery_frog_page():
-
-    # Request fullscreen on user interaction
-    ui.add_head_html('''
-        <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            function tryFullscreen(e) {
-                if (e.isTrusted) {
-                    const elem = document.documentElement;
-                    if (elem.requestFullscreen) {
-                        elem.requestFullscreen().catch(err => console.log('Fullscreen:', err.message));
-                    } else if (elem.webkitRequestFullscreen) {
-                        elem.webkitRequestFullscreen();
-                    }
-                    document.removeEventListener('click', tryFullscreen);
-                }
-            }
-            if (!document.fullscreenElement && !document.webkitFullscreenElement) {
-                document.addEventListener('click', tryFullscreen, { once: true });
-            }
-        });
-        </script>
-    ''')
-
-    # Simulate loading frog info
-    frogs_list = [
-        {"name": "Growling Grass \nFrog", "photo": "assets/GGF.png", "Species name": "Ranoidea (nee Litoria) raniformis",
-        "video": "assets/GGF_resized.mp4", "preview": "assets/GGF_spec_safe3_preview.jpg",
-        "ind_name": "Growling Grass Frog"},
-        {"name": "Southern Brown \nTree Frog", "photo": "assets/SBTF.png", "Species name": "Litoria ewingii", 
-        "video": "assets/SBTF_resized.mp4", "preview":"assets/SBTF_spec_safe3_preview.jpg",
-        "ind_name": "Southern Brown Tree Frog"},
-        {"name": "Peron's Tree \nFrog", "photo": "assets/PTF.png", "Species name": "Litoria peronii",
-        "video": "assets/PTF_resized.mp4", "preview": "assets/PTF_spec_safe3_preview.jpg",
-        "ind_name": "Peron's Tree Frog"},
-        {"name": "Pobblebonk \nFrog", "photo": "assets/PBF.png", "Species name": "Limnodynastes dumerili",
-        "video": "assets/PBF_resized.mp4", "preview": "assets/PBF_spec_safe3_preview.jpg",
-        "ind_name": "Pobblebonk Frog"},
-        {"name": "Common \nFroglet", "photo": "assets/CF.png", "Species name": "Crinia signifera",
-        "video": "assets/CF_resized.mp4", "preview": "assets/CF_spec_safe3_preview.jpg",
-        "ind_name": "Common Froglet"},
-        {"name": "Common Spadefoot \nToad", "photo": "assets/CSFT.png", "Species name": "Neobatrachus sudelli",
-        "video": "assets/CSFT_resized.mp4", "preview": "assets/CSFT_spec_safe3_preview.jpg",
-        "ind_name": "Sudell's Frog"},
-        {"name": "Eastern Sign-bearing \nFroglet", "photo": "assets/ESBF.png", "Species name" : "Geocrinia victoriana",
-        "video": "assets/ESBF_resized.mp4", "preview": "assets/ESBF_spec_safe3_preview.jpg",
-        "ind_name": "Eastern Sign-bearing Froglet"},
-        {"name": "Spotted Marsh \nFrog", "photo": "assets/SMF.png", "Species name" : "Limnodynastes tasmaniensis",
-        "video": "assets/SMF_resized.mp4", "preview": "assets/SMF_spec_safe3_preview.jpg",
-        "ind_name": "Spotted Marsh Frog"},
-    ]
-
-            # --- Reactive state ---
-    state = {
-        "current_frog": random.choice(frogs_list),
-        "revealed": False,
-        "playing": False,
-        "show_try_again": False,
-        "option_buttons": {},
-    }
-
-    # --- FUNCTIONS ---
-    def build_frog_options(container, correct_frog):
-        """Generate multiple-choice answer buttons"""
-        container.clear()
-        
-        # Get other frogs as options (comparing by entire frog object)
-        options = random.sample(
-            [f for f in frogs_list if f["ind_name"] != correct_frog["ind_name"]],
-            k=min(7, len(frogs_list) - 1)
-        )
-        options.append(correct_frog)
-        random.shuffle(options)
-        
-        # Store button references for later highlighting
-        state["option_buttons"] = {}
-        
-        with container:
-            with ui.grid(columns=4).classes("gap-2 justify-center mt-2 grid-cols-1 md:grid-cols-4 w-full px-2"):
-                for frog in options:
-                    btn = ui.button(
-                        frog["name"], 
-                        on_click=lambda _, f=frog: check_answer(f, correct_frog)
-                    ).classes(
-                        "bg-green-700 text-white font-semibold text-sm md:text-md rounded-md px-2 py-2 "
-                        "hover:bg-green-800 transition-all h-auto md:h-16 w-full"
-                    )
-                    # Store button reference with the frog ind_name as key
-                    state["option_buttons"][frog["ind_name"]] = btn
-                    
-                    
-    def check_answer(selected_frog, correct_frog):
-        """Reveal result and highlight correct answer - matching Kivy behavior"""
-        if state["revealed"]:
-            return
-        state["revealed"] = True
-        state["show_try_again"] = True
-
-        # Visual feedback for all buttons (matching Kivy implementation)
-        for frog_id, btn in state.get("option_buttons", {}).items():
-            if frog_id == selected_frog["ind_name"]:
-                # Selected answer gets black border
-                btn.style("border: 3px solid black")
-            
-            if frog_id == correct_frog["ind_name"]:
-                # Correct answer gets yellow/gold background (matching Kivy's (1, 0.84, 0, 1))
-                # Using direct style for more reliable color change
-                btn.style("background-color: #fbbf24 !important")  # Tailwind yellow-400
-            elif frog_id != selected_frog["ind_name"]:
-                # Other incorrect answers fade out
-                btn.style("opacity: 0.3")
-
-        # Update result text
-        if selected_frog["ind_name"] == correct_frog["ind_name"]:
-            result_label.set_text(f"✅ Correct! It's the {correct_frog['name'].replace(chr(10), ' ')}")
-            result_label.classes(remove="text-red-600")
-            result_label.classes(add="text-green-600 font-bold text-xl")
-        else:
-            result_label.set_text(f"❌ Oops! It was the {correct_frog['name'].replace(chr(10), ' ')}")
-            result_label.classes(remove="text-green-600")
-            result_label.classes(add="text-red-600 font-bold text-xl")
-
-       
-    def try_again():
-        """Pick a new random frog and reset the quiz"""
-        state["current_frog"] = random.choice(frogs_list)
-        state["revealed"] = False
-        state["show_try_again"] = False  #hides the button again
-        result_label.set_text("")
-
-        # reset video
-        video.source = state["current_frog"]["video"]
-        video.run_method("pause")
-        state["playing"] = False
-        play_icon.set_source("assets/PLAY.png")
-
-        # rebuild options
-        build_frog_options(options_container, state["current_frog"])
-
-
-    def toggle_video():
-        """Play or pause the current video"""
-        if state["playing"]:
-            video.run_method("pause")
-            play_icon.set_source("assets/PLAY.png")
-        else:
-            # Unmute and play when play button is clicked
-            ui.run_javascript("""
-                const video = document.querySelector('video');
-                video.muted = false;
-            """)
-            video.run_method("play")
-            play_icon.set_source("assets/PAUSE.png")
-        state["playing"] = not state["playing"]
+# Rounds, answer checking and Try Again run in the browser (assets/js/quiz.js);
+# only batched score events come back to the server
+QUIZ_EVENTS_URL = EVENTS_URL
+quiz_stats = QuizStats(frog.id for frog in FROGS)
+
+@app.get('/mystery')
+async def mystery_frog_page(request: Request):
+    image_format = best_image_format(request.headers.get('accept', ''))
+    return page_cache.response(
+        request, ('mystery', image_format),
+        lambda: render_mystery(asset_manifest, image_format,
+                               quiz_payload(asset_manifest, events_url=QUIZ_EVENTS_URL)))
+
+
+@app.post(QUIZ_EVENTS_URL)
+async def quiz_events(request: Request):
+    # public endpoint: refuse big bodies before reading them (a beacon batch is a few KB)
+    length = request.headers.get('content-length', '')
+    if length and (not length.isdigit() or int(length) > MAX_BATCH_BYTES):
+        return Response(status_code=413)
+    body = b''
+    async for chunk in request.stream():   # chunked uploads carry no Content-Length
+        body += chunk
+        if len(body) > MAX_BATCH_BYTES:
+            return Response(status_code=413)
+    quiz_stats.record_json(body)
+    return Response(status_code=204)
+
+
+@app.get('/api/quiz/stats')
+async def quiz_stats_summary():
+    return quiz_stats.snapshot()
 
 
+#################################
+# --- Metrics (Prometheus text format) ---
+# Latency per route template, bytes per asset (logical name), page cache
+# hit ratio, websockets / NiceGUI clients, event loop lag, GC pauses, RSS
+def asset_metric_name(path: str) -> str:
+    name = path.split('/', 2)[2]
+    return asset_manifest.resolve(name) or name
+
+metrics = Metrics(asset_name=asset_metric_name)
+metrics.caches['pages'] = page_cache.stats
+for url, (config_file, _) in CONFIG_FILES.items():
+    metrics.caches[url.lstrip('/')] = config_file.stats
+compression_stats = metrics.caches['compression'] = Counter()
+metrics.client_count = lambda: len(Client.instances)
+metrics.install_gc_hook()
+app.add_middleware(MetricsMiddleware, metrics=metrics)
+app.on_startup(lambda: background_tasks.create(metrics.watch_loop_lag(), name='loop lag'))
+
+## NiceGUI clients (frog pages): idle ones are sent home / deleted, at most
+## MAX_CLIENTS live per process, least recently used first
+## (uvicorn only configures its own loggers: show the reaper's INFO lines too)
+logging.getLogger('client_lifecycle').setLevel(logging.INFO)
+if not logging.getLogger().handlers:
+    logging.basicConfig(format='%(levelname)s:     %(message)s')
+client_lifecycle = ClientLifecycle(idle_url='/')
+app.on_connect(client_lifecycle.connect)
+app.on_disconnect(client_lifecycle.disconnect)
+app.on_delete(client_lifecycle.forget)
+app.on_startup(lambda: background_tasks.create(client_lifecycle.run(), name='client reaper'))
+metrics.register('frog_quiz_clients_reaped_total', 'counter', 'NiceGUI clients deleted by the reaper',
+                 lambda: {'reason': {reason: client_lifecycle.stats[reason] for reason in ('idle', 'lru')}})
+metrics.register('frog_quiz_clients_sent_home_total', 'counter', 'Idle connected pages sent to the home page',
+                 lambda: client_lifecycle.stats['sent_away'])
+metrics.register('frog_quiz_clients_reaped_elements_total', 'counter', 'UI elements dropped with reaped clients',
+                 lambda: client_lifecycle.stats['elements'])
+metrics.register('frog_quiz_clients_reclaimed_bytes_total', 'counter', 'RSS drop measured around reaper sweeps',
+                 lambda: client_lifecycle.stats['reclaimed_bytes'])
+
+
+@app.get('/metrics')
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4')
 
 
-    # --- PAGE LAYOUT ---
-    with ui.column().classes("w-full h-screen items-center justify-start bg-white"):
+#################################
+# --- Offline support (service worker) ---
+# /sw.js precaches every page and the hashed assets they use; pages are
+# precached from /offline/..., the pre-rendered versions with <picture>
+# images (any browser format works offline) and no NiceGUI websocket
+OFFLINE_PAGES = page_renderers(events_url=QUIZ_EVENTS_URL)
 
-        # Header
-        ui.label("🐸 Mystery Frog Quiz").classes(
-            "text-3xl font-bold text-center text-green-800 mb-4"
-        )
+def offline_page_html(export_path: str) -> bytes:
+    render = OFFLINE_PAGES[export_path]
+    body, _ = page_cache.get(('offline', export_path), lambda: render(asset_manifest))
+    return body
 
-        # Video (paused initially, no controls, muted by default)
-        video = ui.video(state["current_frog"]["video"]).props(
-            'muted disablepictureinpicture'
-        ).classes(
-            "w-full max-w-5x1 h-auto rounded-xl shadow-md border border-gray-300"
-        ).style('pointer-events: none;')
-        
-        # Hide all video controls with CSS
-        ui.add_head_html('''
-            <style>
-            video::-webkit-media-controls {
-                display: none !important;
-            }
-            video::-webkit-media-controls-enclosure {
-                display: none !important;
-            }
-            video::-webkit-media-controls-panel {
-                display: none !important;
-            }
-            video::-moz-media-controls {
-                display: none !important;
-            }
-            video::-ms-media-controls {
-                display: none !important;
-            }
-            </style>
-        ''')
-
-          # --- BOTTOM SECTION ---
-        with ui.row().classes("w-full justify-between items-start"):
-
-            # --- LEFT CONTROL STACK (Home + Play vertically stacked) ---
-            with ui.column().classes("flex-none items-center justify-center"):
-                # Home button
-                with ui.button(on_click=lambda: ui.navigate.to("/"), color="transparent").style(
-                    "padding:0; border:none; width:160px; height:160px;"
-                ):
-                    ui.image("/assets/Arrow.png").style(
-                        "width:100%; height:100%; object-fit:cover; border-radius:5px; "
-                        "box-shadow:0 4px 10px rgba(0,0,0,0.4);"
-                    )
-            # Play button
-            with ui.column().classes("flex-none items-center justify-center gap-4"):
-                with ui.button(on_click=toggle_video).classes("w-20 h-20 bg-transparent p-0 border-none").style(
-                    "padding: 0; border: none; width: 160px; height: 160px;"
-                ):
-                    play_icon = ui.image("/assets/PLAY.png").style(
-                        "width:100%; height:100%; object-fit:contain;"
-                    )
+def render_sw() -> str:
+    pages = {page_url(path): '/offline' + page_url(path) for path in OFFLINE_PAGES}
+    html = (offline_page_html(path).decode('utf-8') for path in OFFLINE_PAGES)
+    return render_service_worker(asset_manifest, pages, html)
 
 
-            # --- RIGHT (Quiz section) ---
-            with ui.column().classes(
-                "flex-1 items-center justify-start p-0 bg-gray-50 rounded-lg m-0" \
-                "shadow-sm border border-gray-200"):
-                ui.label("Guess the Frog:").classes(
-                    "text-2xl font-semibold text-center text-black"
-                )
+@app.get('/sw.js')
+async def service_worker_script(request: Request):
+    return page_cache.response(request, ('sw.js',), render_sw, media_type='application/javascript')
 
-                options_container = ui.column().classes("items-center justify-center")
-                build_frog_options(options_container, state["current_frog"])
 
-                result_label = ui.label("").classes("text-xl font-semibold text-center justify-left mt-1")
+@app.get('/offline/{path:path}')
+async def offline_page(path: str, request: Request):
+    export_path = f'{path.strip("/")}/index.html'.lstrip('/')
+    render = OFFLINE_PAGES.get(export_path)
+    if render is None:
+        return Response(status_code=404)
+    return page_cache.response(request, ('offline', export_path), lambda: render(asset_manifest))
 
-                try_again_button = ui.button("🔄 Try Again?", on_click=try_again).classes(
-                    "bg-yellow-500 text-black font-bold text-xl mt-2 rounded-md shadow-md hover:bg-yellow-400 transition-all"
-                )
-                
 
 # --- Run the app ---
 #if __name__ in {"__main__", "__mp_main__"}:
@@ -741,22 +390,39 @@ else:
 
 # --- Setup for both Uvicorn (Railway/PaaS) and direct execution ---
 
+# Static export: python main_web.py --export out/
+# Writes the whole site as plain HTML + hashed assets and exits (no server)
+if __name__ == '__main__' and '--export' in sys.argv:
+    from site_export import export_site
+    args = sys.argv[sys.argv.index('--export') + 1:]
+    export_site(args[0] if args else 'out', asset_manifest, Path(__file__).parent / 'manifest.json')
+    sys.exit(0)
+
 # Get port from environment variable (for Railway, Render, etc.) or default to 8080
 PORT = int(os.environ.get('PORT', 8080))
+# multiworker.py binds its workers to loopback behind the sticky router
+HOST = os.environ.get('HOST', '0.0.0.0')
+
+# Parser / keep-alive / backlog tuning (uvicorn_config.py, SERVER_PROFILE=compat|fast|h2-front)
+SERVER_OPTIONS = server_profile()
 
 print(f"🐸 Starting Frog Quiz app on port {PORT}")
+print(f"Server profile: {os.environ.get('SERVER_PROFILE', DEFAULT_PROFILE)} {SERVER_OPTIONS}")
 print(f"Platform: {platform.system()}")
-print(f"Assets directory: {Path(__file__).parent / 'assets'}")
+print(f"Assets directory: {ASSETS_DIR}")
 
 # Initialize ui.run() for module-level (required when uvicorn loads this module)
 # This doesn't start the server yet, just configures NiceGUI properly
 ui.run(
-    host='0.0.0.0',
+    host=HOST,
     port=PORT,
     reload=False,
     show=False,
     title='Frog Quiz - Educational App',
-    uvicorn_logging_level='info'
+    uvicorn_logging_level='info',
+    # Brotli / gzip, compressed once per ETag instead of gzip -9 per response
+    gzip_middleware_factory=lambda app: CompressionMiddleware(app, stats=compression_stats),
+    **SERVER_OPTIONS,
 )
 
 # When running directly (not via uvicorn)
@@ -0,0 +1,231 @@
+"""
+Prometheus metrics for the web app (/metrics)
+No client library: a few counters and fixed-bucket histograms updated by
+one ASGI middleware, rendered in the Prometheus text format on scrape.
+
+- request latency per route template (not per URL, so labels stay few)
+- bytes served per /assets and /video file (logical name, not hashed)
+- open websockets and live NiceGUI clients
+- page cache hits / misses / 304s
+- event loop lag and GC pauses
+- process RSS
+"""
+import asyncio
+import gc
+import os
+import resource
+import time
+from bisect import bisect_left
+from collections import Counter
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+PAUSE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+LOOP_LAG_INTERVAL = 0.5
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name, labels=''):
+        sep = ',' if labels else ''
+        suffix = f'{{{labels}}}' if labels else ''
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels}{sep}le="{bound}"}} {cumulative}'
+        yield f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}'
+        yield f'{name}_sum{suffix} {self.sum:.6f}'
+        yield f'{name}_count{suffix} {self.count}'
+
+
+def rss_bytes():
+    """Current resident memory (Linux), else the peak from getrusage"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    def __init__(self, asset_name=None):
+        """asset_name: maps a served file path to the name it is reported under"""
+        self.asset_name = asset_name or (lambda path: path)
+        self.latency = {}                 # (method, route) -> Histogram
+        self.responses = Counter()        # (route, status)
+        self.asset_bytes = Counter()      # logical asset name -> bytes
+        self.caches = {}                  # cache name -> {result: count}, owned by the cache
+        self.in_flight = 0
+        self.websockets = 0
+        self.loop_lag = Histogram(PAUSE_BUCKETS + (1.0,))
+        self.loop_lag_last = 0.0
+        self.gc_pause = Histogram(PAUSE_BUCKETS)
+        self.gc_collections = Counter()
+        self.client_count = lambda: 0
+        self.collected = []               # (name, type, help, read) registered by other modules
+        self._gc_start = None
+
+    # --- collectors ---
+
+    def observe_request(self, method, route, status, seconds):
+        key = (method, route)
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram(LATENCY_BUCKETS)
+        histogram.observe(seconds)
+        self.responses[(route, status)] += 1
+
+    def register(self, name, kind, help_text, read):
+        """
+        Report read() on every scrape: a number, or {label name: {label: value}}
+        for a labelled series
+        """
+        self.collected.append((name, kind, help_text, read))
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self.gc_pause.observe(time.perf_counter() - self._gc_start)
+            self.gc_collections[info.get('generation', 0)] += 1
+            self._gc_start = None
+
+    def install_gc_hook(self):
+        if self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+
+    async def watch_loop_lag(self):
+        """How late a timer fires = how long the event loop was blocked"""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            lag = max(0.0, time.perf_counter() - start - LOOP_LAG_INTERVAL)
+            self.loop_lag_last = lag
+            self.loop_lag.observe(lag)
+
+    # --- exposition ---
+
+    def render(self) -> str:
+        lines = [
+            '# HELP frog_quiz_http_request_duration_seconds Request latency per route template',
+            '# TYPE frog_quiz_http_request_duration_seconds histogram',
+        ]
+        for (method, route), histogram in sorted(self.latency.items()):
+            lines += histogram.lines('frog_quiz_http_request_duration_seconds',
+                                     f'method="{method}",route="{_label(route)}"')
+        lines += ['# HELP frog_quiz_http_responses_total Responses per route and status',
+                  '# TYPE frog_quiz_http_responses_total counter']
+        for (route, status), count in sorted(self.responses.items()):
+            lines.append(f'frog_quiz_http_responses_total{{route="{_label(route)}",status="{status}"}} {count}')
+        lines += ['# HELP frog_quiz_asset_bytes_total Bytes served per asset file',
+                  '# TYPE frog_quiz_asset_bytes_total counter']
+        for asset, size in sorted(self.asset_bytes.items()):
+            lines.append(f'frog_quiz_asset_bytes_total{{asset="{_label(asset)}"}} {size}')
+        lines += ['# HELP frog_quiz_cache_requests_total Cache lookups by result',
+                  '# TYPE frog_quiz_cache_requests_total counter']
+        for cache, results in sorted(self.caches.items()):
+            for result, count in sorted(results.items()):
+                lines.append(f'frog_quiz_cache_requests_total{{cache="{cache}",result="{result}"}} {count}')
+        lines += [
+            '# TYPE frog_quiz_http_requests_in_flight gauge',
+            f'frog_quiz_http_requests_in_flight {self.in_flight}',
+            '# TYPE frog_quiz_websockets_open gauge',
+            f'frog_quiz_websockets_open {self.websockets}',
+            '# HELP frog_quiz_nicegui_clients Live NiceGUI clients (page instances)',
+            '# TYPE frog_quiz_nicegui_clients gauge',
+            f'frog_quiz_nicegui_clients {self.client_count()}',
+            '# HELP frog_quiz_event_loop_lag_seconds Timer overshoot, sampled every 0.5s',
+            '# TYPE frog_quiz_event_loop_lag_seconds histogram',
+            *self.loop_lag.lines('frog_quiz_event_loop_lag_seconds'),
+            '# TYPE frog_quiz_event_loop_lag_last_seconds gauge',
+            f'frog_quiz_event_loop_lag_last_seconds {self.loop_lag_last:.6f}',
+            '# TYPE frog_quiz_gc_pause_seconds histogram',
+            *self.gc_pause.lines('frog_quiz_gc_pause_seconds'),
+            '# TYPE frog_quiz_gc_collections_total counter',
+            *(f'frog_quiz_gc_collections_total{{generation="{generation}"}} {count}'
+              for generation, count in sorted(self.gc_collections.items())),
+            '# TYPE frog_quiz_process_resident_memory_bytes gauge',
+            f'frog_quiz_process_resident_memory_bytes {rss_bytes()}',
+        ]
+        for name, kind, help_text, read in self.collected:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+            value = read()
+            if isinstance(value, dict):
+                label, series = next(iter(value.items()))
+                lines += [f'{name}{{{label}="{_label(key)}"}} {number}' for key, number in sorted(series.items())]
+            else:
+                lines.append(f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware: latency per route template, bytes per asset, open
+    websockets. Route labels come from the matched route (Starlette sets
+    scope['route']), so /frog/Growling%20Grass%20Frog counts as /frog/{frog_name}.
+    """
+
+    def __init__(self, app, metrics: Metrics, asset_prefixes=('/assets/', '/video/')):
+        self.app = app
+        self.metrics = metrics
+        self.asset_prefixes = asset_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'websocket':
+            self.metrics.websockets += 1
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.metrics.websockets -= 1
+            return
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        start = time.perf_counter()
+        status = 500
+        sent = 0
+        length = None
+
+        async def send_wrapper(message):
+            nonlocal status, sent, length
+            kind = message['type']
+            if kind == 'http.response.start':
+                status = message['status']
+                for name, value in message.get('headers', ()):
+                    if name == b'content-length':
+                        length = int(value)
+            elif kind == 'http.response.body':
+                sent += len(message.get('body', b''))
+            elif kind == 'http.response.zerocopysend':
+                sent += message.get('count') or 0
+            await send(message)
+
+        metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.in_flight -= 1
+            route = scope.get('route')
+            label = getattr(route, 'path', None) or 'unmatched'
+            metrics.observe_request(scope['method'], label, status, time.perf_counter() - start)
+            path = scope['path']
+            # only files that exist: 404s would add a label per bad URL
+            if path.startswith(self.asset_prefixes) and scope['method'] != 'HEAD' and status < 400:
+                metrics.asset_bytes[metrics.asset_name(path)] += sent or length or 0
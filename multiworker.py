@@ -0,0 +1,410 @@
+"""
+Multi-worker serving mode (opt-in: Procfile and Dockerfile run coldstart.py)
+    python multiworker.py               # one worker per CPU
+    WEB_CONCURRENCY=4 python multiworker.py
+
+NiceGUI runs one event loop per process (ui.run rejects workers > 1), so
+this starts N independent main_web.py processes on loopback ports and puts
+a small sticky HTTP router on $PORT in front of them:
+
+- a new visitor is given the next worker in turn and, with the first HTML
+  page, a cookie naming it (frog_worker), so a NiceGUI page and its websocket
+  always land on the worker that owns that client, and kiosks behind one NAT
+  still spread out. Cacheable responses (Cache-Control: public, the hashed
+  /assets and /video files) never carry the cookie.
+  A websocket without the cookie goes by the visitor's IP; Fly-Client-IP and
+  X-Forwarded-For only count from FORWARDED_ALLOW_IPS (as in uvicorn_config.py)
+- connections to the workers are kept alive and reused (responses are framed
+  by Content-Length or chunked encoding); request bodies are read before
+  forwarding, so the router answers Expect: 100-continue itself
+- everything else is stateless (pre-rendered pages, client-side quiz), so
+  workers share nothing
+- one router process per worker, all listening on $PORT with SO_REUSEPORT,
+  so the router scales with the workers instead of becoming the bottleneck
+
+With a single CPU this simply runs coldstart.py (main_web.py, no router hop).
+Quiz stats (/api/quiz/stats) are kept per worker. Measure before switching a
+deployment to it: python benchmarks/bench_multiworker.py
+"""
+import asyncio
+import hashlib
+import itertools
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from multiprocessing import Process
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent / 'main_web.py'
+COLDSTART = Path(__file__).resolve().parent / 'coldstart.py'
+WORKER_BASE_PORT = int(os.environ.get('WORKER_BASE_PORT', 9100))
+MAX_HEAD = 64 * 1024
+MAX_BODY = 1024 * 1024      # request bodies are small JSON (quiz events)
+MAX_IDLE = 64               # pooled connections per worker and router process
+READY_TIMEOUT = 60
+COOKIE = 'frog_worker'
+TRUSTED_PROXIES = {ip.strip() for ip in os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1').split(',') if ip.strip()}
+
+
+def worker_count() -> int:
+    """WEB_CONCURRENCY, else the CPUs this process may run on"""
+    if os.environ.get('WEB_CONCURRENCY'):
+        return max(1, int(os.environ['WEB_CONCURRENCY']))
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# --- Sticky router ---
+
+def parse_head(head: bytes):
+    """(start line, [(name, value)], {lower name: value}) of an HTTP/1.1 head"""
+    lines = head.decode('latin-1').split('\r\n')
+    fields = []
+    for line in lines[1:]:
+        if ':' in line:
+            name, _, value = line.partition(':')
+            fields.append((name.strip(), value.strip()))
+    return lines[0], fields, {name.lower(): value for name, value in fields}
+
+
+def build_head(start_line, fields) -> bytes:
+    lines = [start_line] + [f'{name}: {value}' for name, value in fields]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+def trusted(peer) -> bool:
+    """Whether the socket address is a proxy allowed to set forwarding headers"""
+    return '*' in TRUSTED_PROXIES or peer in TRUSTED_PROXIES
+
+
+def client_key(headers, peer) -> str:
+    """The visitor's IP: set by the edge proxy when the request comes from a trusted one"""
+    if trusted(peer):
+        if headers.get('fly-client-ip'):
+            return headers['fly-client-ip']
+        if headers.get('x-forwarded-for'):
+            return headers['x-forwarded-for'].split(',')[0].strip()
+    return peer
+
+
+def pick_worker(key: str, count: int) -> int:
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % count
+
+
+def cookie_worker(headers, count):
+    """Worker index from the router's cookie, None when missing or out of range"""
+    for part in headers.get('cookie', '').split(';'):
+        name, _, value = part.strip().partition('=')
+        if name == COOKIE and value.isdigit() and int(value) < count:
+            return int(value)
+    return None
+
+
+def upstream_request(start_line, fields, peer, upgrade) -> bytes:
+    """
+    Request head for the worker
+
+    Hop-by-hop Connection headers are dropped for plain requests (the router
+    keeps its own connection to the worker alive), and so is Expect (the
+    body is sent along with the head). The socket address is
+    appended to X-Forwarded-For, after the proxy's chain only when the proxy
+    is trusted (uvicorn trusts it from 127.0.0.1, so /exit still only works
+    for local kiosks).
+    """
+    forwarded = [value for name, value in fields if name.lower() == 'x-forwarded-for'] if trusted(peer) else []
+    dropped = {'x-forwarded-for', 'expect'} | (set() if upgrade else {'connection', 'keep-alive'})
+    fields = [(name, value) for name, value in fields if name.lower() not in dropped]
+    fields.append(('X-Forwarded-For', ', '.join(forwarded + [peer])))
+    return build_head(start_line, fields)
+
+
+def body_framing(method, status, headers):
+    """'none', 'chunked', 'length' or 'close' (the body ends with the connection)"""
+    if method == 'HEAD' or status in ('204', '304') or status.startswith('1'):
+        return 'none'
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        return 'chunked'
+    if 'content-length' in headers:
+        return 'length'
+    return 'close'
+
+
+def pins_worker(headers) -> bool:
+    """Whether a response may carry the worker cookie: HTML pages that shared caches do not keep"""
+    cache_control = headers.get('cache-control', '').lower()
+    return (headers.get('content-type', '').lower().startswith('text/html')
+            and 'public' not in cache_control and 'immutable' not in cache_control)
+
+
+def client_response_head(head: bytes, client_keep_alive: bool, framing, cookie=None):
+    """
+    (head, keep_alive) for the client: kept alive when the client wants it
+    and the body is self-delimiting; sets the worker cookie for a new
+    visitor on an HTML page
+    """
+    status_line, fields, headers = parse_head(head)
+    keep_alive = client_keep_alive and framing != 'close'
+    fields = [(name, value) for name, value in fields if name.lower() not in ('connection', 'keep-alive')]
+    if cookie is not None and pins_worker(headers):
+        fields.append(('Set-Cookie', f'{COOKIE}={cookie}; Path=/; HttpOnly; SameSite=Lax'))
+    if not keep_alive:
+        fields.append(('Connection', 'close'))
+    return build_head(status_line, fields), keep_alive
+
+
+async def copy_exact(reader, writer, remaining):
+    while remaining > 0:
+        data = await reader.read(min(remaining, 65536))
+        if not data:
+            raise ConnectionError('connection closed mid-body')
+        writer.write(data)
+        remaining -= len(data)
+        await writer.drain()
+
+
+async def copy_chunked(reader, writer):
+    """Chunked body as is, up to and including the last chunk and trailers"""
+    while True:
+        line = await reader.readuntil(b'\r\n')
+        writer.write(line)
+        size = int(line.split(b';')[0], 16)
+        if size == 0:
+            while (trailer := await reader.readuntil(b'\r\n')) != b'\r\n':
+                writer.write(trailer)
+            writer.write(b'\r\n')
+            await writer.drain()
+            return
+        await copy_exact(reader, writer, size + 2)
+
+
+async def pipe(reader, writer):
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        try:
+            writer.write_eof()
+        except (OSError, RuntimeError):
+            pass
+
+
+class Router:
+    """Worker choice and idle keep-alive connections of one router process"""
+
+    def __init__(self, ports):
+        self.ports = ports
+        self.turn = itertools.cycle(range(len(ports)))
+        self.idle = {port: [] for port in ports}
+
+    def route(self, headers, peer, upgrade):
+        """(worker port, cookie value to set or None)"""
+        index = cookie_worker(headers, len(self.ports))
+        if index is not None:
+            return self.ports[index], None
+        if upgrade:
+            # cookies blocked: best effort by the visitor's IP
+            return self.ports[pick_worker(client_key(headers, peer), len(self.ports))], None
+        index = next(self.turn)
+        return self.ports[index], index
+
+    async def connect(self, port):
+        """(reader, writer, reused) to the worker, an idle one when there is one"""
+        idle = self.idle[port]
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection('127.0.0.1', port, limit=MAX_HEAD)
+        return reader, writer, False
+
+    def release(self, port, reader, writer):
+        if len(self.idle[port]) < MAX_IDLE and not reader.at_eof():
+            self.idle[port].append((reader, writer))
+        else:
+            writer.close()
+
+    async def exchange(self, port, request):
+        """(reader, writer, response head) for one request, retried once on a worker-closed idle connection"""
+        while True:
+            up_reader, up_writer, reused = await self.connect(port)
+            try:
+                up_writer.write(request)
+                await up_writer.drain()
+                return up_reader, up_writer, await up_reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, ConnectionError) as error:
+                up_writer.close()
+                # the worker dropped an idle connection before reading the request
+                if not reused or getattr(error, 'partial', b''):
+                    raise
+
+
+async def read_body(reader, writer, headers) -> bytes:
+    """The whole request body (answering Expect: 100-continue, the worker never sees it)"""
+    length = int(headers.get('content-length', 0) or 0)
+    if length > MAX_BODY:
+        raise ValueError('request body too large')
+    if not length:
+        return b''
+    if headers.get('expect', '').lower() == '100-continue':
+        writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+        await writer.drain()
+    return await reader.readexactly(length)
+
+
+async def handle_client(reader, writer, router):
+    peer = (writer.get_extra_info('peername') or ('unknown',))[0]
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            start_line, fields, headers = parse_head(head)
+            if 'chunked' in headers.get('transfer-encoding', ''):
+                writer.write(b'HTTP/1.1 411 Length Required\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                return
+            try:
+                body = await read_body(reader, writer, headers)
+            except ValueError:
+                writer.write(b'HTTP/1.1 413 Content Too Large\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                return
+            upgrade = 'upgrade' in headers.get('connection', '').lower()
+            port, cookie = router.route(headers, peer, upgrade)
+            request = upstream_request(start_line, fields, peer, upgrade) + body
+
+            if upgrade:
+                # websocket: its own connection, bytes both ways until either side closes
+                up_reader, up_writer = await asyncio.open_connection('127.0.0.1', port, limit=MAX_HEAD)
+                try:
+                    up_writer.write(request)
+                    await asyncio.gather(pipe(reader, up_writer), pipe(up_reader, writer))
+                finally:
+                    up_writer.close()
+                return
+
+            up_reader, up_writer, response_head = await router.exchange(port, request)
+            try:
+                status_line, _, response_headers = parse_head(response_head)
+                status = status_line.split(' ', 2)[1] if ' ' in status_line else ''
+                framing = body_framing(start_line.split(' ', 1)[0], status, response_headers)
+                wants_keep_alive = (headers.get('connection', '').lower() != 'close'
+                                    and not start_line.endswith('HTTP/1.0'))
+                client_head, keep_alive = client_response_head(response_head, wants_keep_alive, framing, cookie)
+                writer.write(client_head)
+                if framing == 'chunked':
+                    await copy_chunked(up_reader, writer)
+                elif framing == 'length':
+                    await copy_exact(up_reader, writer, int(response_headers['content-length']))
+                elif framing == 'close':
+                    while data := await up_reader.read(65536):
+                        writer.write(data)
+                        await writer.drain()
+                await writer.drain()
+            except BaseException:
+                up_writer.close()
+                raise
+            reusable = (framing != 'close' and start_line.endswith('HTTP/1.1')
+                        and response_headers.get('connection', '').lower() != 'close')
+            if reusable:
+                router.release(port, up_reader, up_writer)
+            else:
+                up_writer.close()
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+def run_router(port, ports, reuse_port):
+    async def serve():
+        router = Router(ports)
+        server = await asyncio.start_server(
+            lambda r, w: handle_client(r, w, router), '0.0.0.0', port,
+            reuse_port=reuse_port, limit=MAX_HEAD, backlog=2048)
+        async with server:
+            await server.serve_forever()
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor stops us
+    asyncio.run(serve())
+
+
+# --- Supervisor ---
+
+def wait_for_port(port, timeout=READY_TIMEOUT) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return True
+        time.sleep(0.2)
+    return False
+
+
+def main():
+    port = int(os.environ.get('PORT', 8080))
+    workers = worker_count()
+    if workers == 1:
+        # nothing to balance: plain single process, answering from the build cache while it boots
+        os.execv(sys.executable, [sys.executable, str(COLDSTART)])
+
+    ports = [WORKER_BASE_PORT + i for i in range(workers)]
+    print(f"🐸 Frog Quiz: {workers} workers on {ports[0]}-{ports[-1]}, sticky router on {port}")
+    # uvicorn reads WEB_CONCURRENCY as its own worker count: not for the workers
+    env = {name: value for name, value in os.environ.items() if name != 'WEB_CONCURRENCY'}
+    processes = [
+        subprocess.Popen([sys.executable, str(MAIN)],
+                         env={**env, 'PORT': str(worker_port), 'HOST': '127.0.0.1'})
+        for worker_port in ports
+    ]
+    routers = []
+
+    def shutdown(code=0):
+        for router in routers:
+            router.terminate()
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        sys.exit(code)
+
+    signal.signal(signal.SIGTERM, lambda *_: shutdown())
+    signal.signal(signal.SIGINT, lambda *_: shutdown())
+
+    for worker_port in ports:
+        if not wait_for_port(worker_port):
+            print(f"✗ Worker on port {worker_port} did not start")
+            shutdown(1)
+    print("✓ Workers ready")
+
+    reuse_port = hasattr(socket, 'SO_REUSEPORT')
+    for _ in range(workers if reuse_port else 1):
+        router = Process(target=run_router, args=(port, ports, reuse_port), daemon=True)
+        router.start()
+        routers.append(router)
+    print(f"✓ {len(routers)} router process(es) listening on {port}")
+
+    # a dead worker or router takes the whole group down so the platform restarts it
+    while True:
+        time.sleep(1)
+        if any(p.poll() is not None for p in processes) or any(not r.is_alive() for r in routers):
+            print("✗ A worker exited, shutting down")
+            shutdown(1)
+
+
+if __name__ == '__main__':
+    main()
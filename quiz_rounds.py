@@ -0,0 +1,108 @@
+"""
+Mystery quiz round generator shared by the Kivy app and the web quiz
+A deck of rounds is precomputed per session from a 32-bit seed, so a
+session can be replayed exactly (pass the same seed) and next_round() is
+just an index into the deck.
+
+Each deck is `cycles` shuffles of the whole catalog: every frog comes up
+equally often and never twice in a row, also across deck boundaries.
+
+assets/js/rounds.js is a line-by-line port (same PRNG, same draws), so the
+browser quiz with ?seed=N plays the same rounds as RoundDeck(FROGS, seed=N).
+"""
+import random
+from dataclasses import dataclass
+
+MASK32 = 0xFFFFFFFF
+DEFAULT_OPTIONS = 8
+DEFAULT_CYCLES = 4
+
+
+class Mulberry32:
+    """Small 32-bit PRNG, chosen because it is trivial to port exactly to JS"""
+    __slots__ = ('state',)
+
+    def __init__(self, seed: int):
+        self.state = seed & MASK32
+
+    def random(self) -> float:
+        self.state = (self.state + 0x6D2B79F5) & MASK32
+        a = self.state
+        t = ((a ^ (a >> 15)) * (1 | a)) & MASK32
+        t = ((t + (((t ^ (t >> 7)) * (61 | t)) & MASK32)) & MASK32) ^ t
+        return ((t ^ (t >> 14)) & MASK32) / 4294967296
+
+    def below(self, n: int) -> int:
+        return int(self.random() * n)
+
+    def shuffle(self, items: list) -> list:
+        """In-place Fisher-Yates (same draw order as rounds.js)"""
+        # random() inlined with locals: this is the whole cost of building a deck
+        a = self.state
+        for i in range(len(items) - 1, 0, -1):
+            a = (a + 0x6D2B79F5) & MASK32
+            t = ((a ^ (a >> 15)) * (1 | a)) & MASK32
+            t = ((t + (((t ^ (t >> 7)) * (61 | t)) & MASK32)) & MASK32) ^ t
+            j = int(((t ^ (t >> 14)) & MASK32) / 4294967296 * (i + 1))
+            items[i], items[j] = items[j], items[i]
+        self.state = a
+        return items
+
+
+@dataclass(frozen=True, slots=True)
+class Round:
+    answer: object      # the mystery frog
+    options: tuple      # answer buttons, answer included, shuffled
+
+
+class RoundDeck:
+    """Precomputed, seeded sequence of quiz rounds over `items`"""
+
+    def __init__(self, items, seed=None, options=DEFAULT_OPTIONS, cycles=DEFAULT_CYCLES):
+        self.items = tuple(items)
+        if not self.items:
+            raise ValueError('RoundDeck needs at least one item')
+        self.seed = random.getrandbits(32) if seed is None else seed & MASK32
+        self.options = max(1, min(options, len(self.items)))
+        self.cycles = cycles
+        self.rng = Mulberry32(self.seed)
+        self.rounds = []
+        self.position = 0
+        self._last = None
+        self._fill()
+
+    def _fill(self):
+        """Build the next deck: `cycles` shuffles of the catalog"""
+        count = len(self.items)
+        rounds = []
+        for _ in range(self.cycles):
+            order = self.rng.shuffle(list(range(count)))
+            # no back-to-back repeat where two shuffles meet
+            if count > 1 and order[0] == self._last:
+                order[0], order[1] = order[1], order[0]
+            for answer in order:
+                others = self.rng.shuffle([i for i in range(count) if i != answer])
+                picks = others[:self.options - 1]
+                picks.append(answer)
+                self.rng.shuffle(picks)
+                rounds.append(Round(self.items[answer], tuple(self.items[i] for i in picks)))
+            self._last = order[-1]
+        self.rounds = rounds
+        self.position = 0
+
+    def next_round(self) -> Round:
+        """O(1): the next precomputed round (a new deck is built when one runs out)"""
+        round_ = self.peek()
+        self.position += 1
+        return round_
+
+    def peek(self) -> Round:
+        """The round next_round() will return, without consuming it (video prefetch)"""
+        if self.position == len(self.rounds):
+            self._fill()
+        return self.rounds[self.position]
+
+    def __iter__(self):
+        return self
+
+    __next__ = next_round
@@ -0,0 +1,100 @@
+"""
+Mystery quiz score events
+The quiz runs in the browser (assets/js/quiz.js) and posts answers back in
+batches with navigator.sendBeacon. Only aggregate counters are kept, in
+memory, so a visitor costs one small POST every few rounds.
+
+Two kinds of events:
+    {"frog": "ggf", "picked": "ptf", "feedback_ms": 4.2}   an answer
+    {"swap_ms": 35.0, "prefetched": true}                  Try Again -> first playable frame
+"""
+import json
+from collections import Counter, deque
+
+EVENTS_URL = '/api/quiz/events'
+MAX_BATCH_BYTES = 16 * 1024
+MAX_BATCH_EVENTS = 50
+FEEDBACK_SAMPLES = 1000
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def _valid_ms(value, limit):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value < limit
+
+
+class QuizStats:
+    """Aggregated answers (per frog, most common mix-ups), tap-to-feedback and Try Again swap times"""
+
+    def __init__(self, frog_ids):
+        self.frog_ids = frozenset(frog_ids)
+        self.answers = 0
+        self.correct = 0
+        self.asked = Counter()
+        self.guessed_right = Counter()
+        self.confusions = Counter()
+        self.feedback_ms = deque(maxlen=FEEDBACK_SAMPLES)
+        # Try Again -> first playable frame, with and without a prefetched video
+        self.swap_ms = {True: deque(maxlen=FEEDBACK_SAMPLES), False: deque(maxlen=FEEDBACK_SAMPLES)}
+
+    def record(self, events) -> int:
+        """Add a batch of answer / swap events, returns how many were valid"""
+        accepted = 0
+        for event in events[:MAX_BATCH_EVENTS]:
+            if not isinstance(event, dict):
+                continue
+            if 'swap_ms' in event:
+                if _valid_ms(event['swap_ms'], 60_000):
+                    self.swap_ms[event.get('prefetched') is True].append(float(event['swap_ms']))
+                    accepted += 1
+                continue
+            frog, picked = event.get('frog'), event.get('picked')
+            if not isinstance(frog, str) or not isinstance(picked, str):
+                continue
+            if frog not in self.frog_ids or picked not in self.frog_ids:
+                continue
+            self.answers += 1
+            self.asked[frog] += 1
+            if frog == picked:
+                self.correct += 1
+                self.guessed_right[frog] += 1
+            else:
+                self.confusions[(frog, picked)] += 1
+            feedback = event.get('feedback_ms')
+            if _valid_ms(feedback, 10_000):
+                self.feedback_ms.append(float(feedback))
+            accepted += 1
+        return accepted
+
+    def record_json(self, body: bytes) -> int:
+        """Parse a sendBeacon body (JSON list of events); bad batches are dropped"""
+        if len(body) > MAX_BATCH_BYTES:
+            return 0
+        try:
+            events = json.loads(body)
+        except ValueError:
+            return 0
+        return self.record(events) if isinstance(events, list) else 0
+
+    def snapshot(self) -> dict:
+        return {
+            'answers': self.answers,
+            'correct': self.correct,
+            'by_frog': {frog: {'asked': self.asked[frog], 'correct': self.guessed_right[frog]}
+                        for frog in sorted(self.asked)},
+            'top_confusions': [{'frog': frog, 'picked': picked, 'count': count}
+                               for (frog, picked), count in self.confusions.most_common(5)],
+            'feedback_ms_p95': percentile(self.feedback_ms, 0.95),
+            'swap_ms': {
+                ('prefetched' if prefetched else 'cold'): {
+                    'count': len(samples),
+                    'p50': percentile(samples, 0.5),
+                    'p95': percentile(samples, 0.95),
+                } for prefetched, samples in self.swap_ms.items()
+            },
+        }
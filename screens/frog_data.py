@@ -1,21 +0,0 @@
-"""Frog data shared across screens"""
-
-# Frog data - using full-size _resized.mp4 videos
-FROGS = [
-    {"name": "Growling Grass\nFrog", "photo": "assets/GGF.png", "species": "Ranoidea (nee Litoria) raniformis",
-     "video": "assets/GGF_resized.mp4", "preview": "assets/GGF_spec_safe3_preview.jpg", "id": "ggf"},
-    {"name": "Southern Brown\nTree Frog", "photo": "assets/SBTF.png", "species": "Litoria ewingii", 
-     "video": "assets/SBTF_resized.mp4", "preview": "assets/SBTF_spec_safe3_preview.jpg", "id": "sbtf"},
-    {"name": "Peron's Tree\nFrog", "photo": "assets/PTF.png", "species": "Litoria peronii",
-     "video": "assets/PTF_resized.mp4", "preview": "assets/PTF_spec_safe3_preview.jpg", "id": "ptf"},
-    {"name": "Pobblebonk\nFrog", "photo": "assets/PBF.png", "species": "Limnodynastes dumerili",
-     "video": "assets/PBF_resized.mp4", "preview": "assets/PBF_spec_safe3_preview.jpg", "id": "pbf"},
-    {"name": "Common\nFroglet", "photo": "assets/CF.png", "species": "Crinia signifera",
-     "video": "assets/CF_resized.mp4", "preview": "assets/CF_spec_safe3_preview.jpg", "id": "cf"},
-    {"name": "Common Spadefoot\nToad", "photo": "assets/CSFT.png", "species": "Neobatrachus sudelli",
-     "video": "assets/CSFT_resized.mp4", "preview": "assets/CSFT_spec_safe3_preview.jpg", "id": "csft"},
-    {"name": "Eastern Sign-bearing\nFroglet", "photo": "assets/ESBF.png", "species": "Geocrinia victoriana",
-     "video": "assets/ESBF_resized.mp4", "preview": "assets/ESBF_spec_safe3_preview.jpg", "id": "esbf"},
-    {"name": "Spotted Marsh\nFrog", "photo": "assets/SMF.png", "species": "Limnodynastes tasmaniensis",
-     "video": "assets/SMF_resized.mp4", "preview": "assets/SMF_spec_safe3_preview.jpg", "id": "smf"},
-]
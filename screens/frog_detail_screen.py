@@ -89,9 +89,9 @@ class FrogDetailScreen(Screen):
     
     def set_frog(self, frog):
         self.current_frog = frog
-        self.name_lbl.text = frog['name'].replace('\n', ' ')
-        self.species_lbl.text = frog['species']
-        self.frog_img.source = frog['photo']
+        self.name_lbl.text = frog.label
+        self.species_lbl.text = frog.species
+        self.frog_img.source = frog.photo
         
         # Stop and cleanup any currently playing video first
         try:
@@ -99,10 +99,10 @@ class FrogDetailScreen(Screen):
                 self.video.state = 'stop'
             self.video.unload()
             # Give video time to cleanup
-            Clock.schedule_once(lambda dt: self._load_video(frog['video']), 0.2)
+            Clock.schedule_once(lambda dt: self._load_video(frog.video), 0.2)
         except Exception as e:
             print(f"Error stopping video: {e}")
-            self._load_video(frog['video'])
+            self._load_video(frog.video)
         
         self.playing = False
         self.play_btn.background_normal = 'assets/PLAY.png'
@@ -9,7 +9,7 @@ from kivy.graphics import Color, Rectangle
 from kivy.clock import Clock
 from kivy.uix.popup import Popup
 from kivy.app import App
-from screens.frog_data import FROGS
+from frog_catalog import FROGS
 
 
 class HomeScreen(Screen):
@@ -75,15 +75,15 @@ class HomeScreen(Screen):
             
             # Button container to maintain alignment
             btn_container = BoxLayout(size_hint=(1, 0.85))
-            btn = Button(background_normal=frog['photo'], 
-                        background_down=frog['photo'],
+            btn = Button(background_normal=frog.photo, 
+                        background_down=frog.photo,
                         size_hint=(None, None))
             btn.bind(on_press=lambda x, f=frog: self.manager.show_frog(f))
             btn_container.bind(size=lambda i, v, b=btn: self._update_frog_button_size(b, i))
             btn_container.add_widget(btn)
             frog_box.add_widget(btn_container)
             
-            lbl = Label(text=frog['name'], font_size='22sp', 
+            lbl = Label(text=frog.name, font_size='22sp', 
                        color=(1, 1, 1, 1), size_hint=(1, 0.15), halign='center', valign='top',
                        text_size=(None, None), max_lines=2)
             lbl.bind(width=lambda l, w: setattr(l, 'text_size', (w, None)))
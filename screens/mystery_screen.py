@@ -8,9 +8,9 @@ from kivy.uix.label import Label
 from kivy.uix.video import Video
 from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
-from screens.frog_data import FROGS
+from frog_catalog import FROGS
+from quiz_rounds import RoundDeck
 from pathlib import Path
-import random
 import platform
 import os
 
@@ -19,6 +19,7 @@ class MysteryScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_frog = None
+        self.rounds = RoundDeck(FROGS)
         self.revealed = False
         self.playing = False
         
@@ -116,7 +117,8 @@ class MysteryScreen(Screen):
         self.new_quiz()
     
     def new_quiz(self):
-        self.current_frog = random.choice(FROGS)
+        round_ = self.rounds.next_round()
+        self.current_frog = round_.answer
         self.revealed = False
         self.playing = False
         
@@ -137,13 +139,9 @@ class MysteryScreen(Screen):
         
         # Generate answers
         self.answer_grid.clear_widgets()
-        options = random.sample([f for f in FROGS if f != self.current_frog], k=min(7, len(FROGS) - 1))
-        options.append(self.current_frog)
-        random.shuffle(options)
-        
-        for frog in options:
+        for frog in round_.options:
             btn = Button(
-                text=frog['name'],
+                text=frog.name,
                 background_color=(0.3, 0.69, 0.31, 1),
                 background_normal='',  # Required for background_color to work
                 font_size='20sp',
@@ -169,11 +167,11 @@ class MysteryScreen(Screen):
         try:
             # Use relative path for Android, absolute for desktop
             if platform.system() == 'Android' or 'ANDROID_ARGUMENT' in os.environ:
-                video_path = self.current_frog['video']
+                video_path = self.current_frog.video
             else:
                 # For desktop, make sure path is relative to the script location
                 script_dir = Path(__file__).parent.parent
-                video_path = str(script_dir / self.current_frog['video'])
+                video_path = str(script_dir / self.current_frog.video)
             
             print(f"Loading quiz video: {video_path}")
             
@@ -230,10 +228,10 @@ class MysteryScreen(Screen):
         
         # Update result text
         if selected == self.current_frog:
-            self.result_lbl.text = f"CORRECT! It's the {self.current_frog['name'].replace(chr(10), ' ')}"
+            self.result_lbl.text = f"CORRECT! It's the {self.current_frog.label}"
             self.result_lbl.color = (0, 0.7, 0, 1)
         else:
-            self.result_lbl.text = f"Oops! It was the {self.current_frog['name'].replace(chr(10), ' ')}"
+            self.result_lbl.text = f"Oops! It was the {self.current_frog.label}"
             self.result_lbl.color = (1, 0, 0, 1)
     
     def toggle_video(self, instance):
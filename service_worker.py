@@ -0,0 +1,210 @@
+"""
+Service worker for offline kiosks (/sw.js)
+Generated from the asset manifest: precaches every pre-rendered page and
+every hashed asset those pages use, so after the first visit the whole
+exhibit runs without the network.
+
+- hashed /assets and /video URLs: cache first (they never change);
+  video Range requests are answered from the cached file
+- the adaptive bitrate ladder (assets/streams) is precached too: the HLS /
+  DASH playlists in the pages are followed to their rung playlists and
+  fragmented MP4s, so stream.js plays offline from byte ranges of those
+- pages and manifest.json: stale-while-revalidate
+- the cache name carries a version hash of the pages and assets; a new
+  version reuses unchanged hashed files and deletes old caches on activate
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+
+CACHE_PREFIX = 'frog-quiz-'
+ASSET_URL = re.compile(r'/(?:assets|video)/[^"\'\s,<>()]+')
+# URIs in HLS playlists (URI="..." and plain lines) and DASH manifests (<BaseURL>)
+PLAYLIST_URIS = {
+    '.m3u8': re.compile(r'URI="([^"]+)"|^([^#\s]\S*)$', re.M),
+    '.mpd': re.compile(r'<BaseURL>([^<]+)</BaseURL>'),
+}
+
+SERVICE_WORKER_TEMPLATE = '''/* Generated by service_worker.py - do not edit */
+const CACHE = '__CACHE__';
+const CACHE_PREFIX = '__CACHE_PREFIX__';
+const PAGES = __PAGES__;    // path -> URL the page is fetched from
+const ASSETS = __ASSETS__;  // content-hashed, immutable
+const PARALLEL = 6;
+
+// '/frog/X/', '/frog/X/index.html' and '/frog/X' are the same page
+function pageKey(pathname) {
+    let path = decodeURIComponent(pathname).replace(/index\\.html$/, '');
+    if (path.length > 1) path = path.replace(/\\/+$/, '');
+    return path;
+}
+const PAGE_SOURCES = {};
+Object.keys(PAGES).forEach(function (path) { PAGE_SOURCES[pageKey(path)] = PAGES[path]; });
+
+async function runPool(items, worker) {
+    const queue = items.slice();
+    async function next() {
+        while (queue.length) await worker(queue.shift());
+    }
+    await Promise.all(Array.from({ length: PARALLEL }, next));
+}
+
+self.addEventListener('install', function (event) {
+    event.waitUntil((async function () {
+        const cache = await caches.open(CACHE);
+        // no videos up front when the visitor asked the browser to save data
+        const saveData = self.navigator.connection && self.navigator.connection.saveData;
+        const assets = saveData ? ASSETS.filter(function (url) {
+            return !url.startsWith('/video/') && !url.startsWith('/assets/streams/');
+        }) : ASSETS;
+        await runPool(assets, async function (url) {
+            if (await cache.match(url)) return;
+            // hashed URLs never change content: reuse what an older cache has
+            const previous = await caches.match(url);
+            if (previous) await cache.put(url, previous);
+            else await cache.add(url);
+        });
+        await runPool(Object.keys(PAGE_SOURCES), async function (key) {
+            const response = await fetch(PAGE_SOURCES[key], { cache: 'no-cache' });
+            if (response.ok) await cache.put(key, response);
+        });
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', function (event) {
+    event.waitUntil((async function () {
+        const names = await caches.keys();
+        await Promise.all(names.filter(function (name) {
+            return name.startsWith(CACHE_PREFIX) && name !== CACHE;
+        }).map(function (name) { return caches.delete(name); }));
+        await self.clients.claim();
+    })());
+});
+
+async function staleWhileRevalidate(event, key) {
+    const cache = await caches.open(CACHE);
+    const cached = await cache.match(key);
+    const update = fetch(PAGE_SOURCES[key], { cache: 'no-cache' }).then(function (response) {
+        if (response.ok) cache.put(key, response.clone());
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(update.catch(function () {}));
+        return cached;
+    }
+    return update;
+}
+
+// 206 for a Range request, sliced from the cached file (video seeking offline)
+async function rangeResponse(response, range) {
+    const blob = await response.blob();
+    const size = blob.size;
+    const match = /^bytes=(\\d*)-(\\d*)$/.exec(range.trim());
+    let start = 0;
+    let end = size - 1;
+    if (match && match[1] !== '') {
+        start = Number(match[1]);
+        if (match[2] !== '') end = Math.min(Number(match[2]), size - 1);
+    } else if (match && match[2] !== '') {
+        start = Math.max(0, size - Number(match[2]));
+    }
+    if (start >= size || start > end) {
+        return new Response(null, { status: 416, headers: { 'Content-Range': 'bytes */' + size } });
+    }
+    return new Response(blob.slice(start, end + 1), {
+        status: 206,
+        headers: {
+            'Content-Type': response.headers.get('Content-Type') || 'video/mp4',
+            'Content-Range': 'bytes ' + start + '-' + end + '/' + size,
+            'Content-Length': String(end - start + 1),
+            'Accept-Ranges': 'bytes',
+        },
+    });
+}
+
+async function cacheFirst(request, url) {
+    const cached = await caches.match(url.pathname);
+    if (!cached) return fetch(request);
+    const range = request.headers.get('range');
+    return range ? rangeResponse(cached, range) : cached;
+}
+
+self.addEventListener('fetch', function (event) {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+    const key = pageKey(url.pathname);
+    if (PAGE_SOURCES[key]) {
+        event.respondWith(staleWhileRevalidate(event, key));
+    } else if (url.pathname.startsWith('/assets/') || url.pathname.startsWith('/video/')) {
+        event.respondWith(cacheFirst(request, url));
+    }
+});
+'''
+
+
+def playlist_assets(manifest, urls):
+    """URLs the HLS / DASH playlists among urls point to, followed through the rung playlists"""
+    found = set()
+    queue = [url for url in urls if url.endswith(tuple(PLAYLIST_URIS))]
+    while queue:
+        url = queue.pop()
+        logical = manifest.reverse.get(url[len(manifest.prefix) + 1:])
+        if logical is None:
+            continue
+        try:
+            text = (manifest.assets_dir / logical).read_text()
+        except OSError:
+            continue
+        folder = url.rpartition('/')[0]
+        for match in PLAYLIST_URIS[Path(logical).suffix].finditer(text):
+            target = f'{folder}/{next(group for group in match.groups() if group)}'
+            if target in found or target[len(manifest.prefix) + 1:] not in manifest.reverse:
+                continue
+            found.add(target)
+            if target.endswith(tuple(PLAYLIST_URIS)):
+                queue.append(target)
+    return found
+
+
+def precache_assets(html_pages, manifest=None):
+    """Hashed asset URLs referenced by the pages (src, srcset, inline JSON) and by their playlists"""
+    urls = set()
+    for html in html_pages:
+        urls.update(ASSET_URL.findall(html))
+    if manifest is not None:
+        urls |= playlist_assets(manifest, urls)
+    return sorted(urls)
+
+
+def render_service_worker(manifest, pages, html_pages, extra_urls=('/manifest.json',)):
+    """
+    sw.js source
+
+    pages: {page path: URL to fetch it from}, html_pages: the rendered
+    pages, scanned for the assets to precache (and the playlists found
+    there for their rungs). extra_urls (manifest.json)
+    are kept fresh like pages.
+    """
+    html_pages = list(html_pages)
+    sources = dict(pages)
+    for url in extra_urls:
+        sources.setdefault(url, url)
+    assets = precache_assets(html_pages, manifest)
+
+    digest = hashlib.sha1(manifest.version.encode())
+    for html in html_pages:
+        digest.update(html.encode('utf-8'))
+    replacements = {
+        '__CACHE__': CACHE_PREFIX + digest.hexdigest()[:8],
+        '__CACHE_PREFIX__': CACHE_PREFIX,
+        '__PAGES__': json.dumps(sources, indent=1),
+        '__ASSETS__': json.dumps(assets, indent=1),
+    }
+    source = SERVICE_WORKER_TEMPLATE
+    for marker, value in replacements.items():
+        source = source.replace(marker, value)
+    return source
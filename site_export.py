@@ -0,0 +1,100 @@
+"""
+Static site export
+    python main_web.py --export out/
+
+Writes every page as plain HTML next to the content-hashed assets, so the
+whole exhibit can be served by any static file server (nginx, Caddy, S3,
+python -m http.server) without a Python process or websockets.
+URLs are the same as on the live server; the mystery quiz runs entirely
+in the browser.
+"""
+import shutil
+from functools import partial
+from pathlib import Path
+from urllib.parse import quote
+
+from frog_catalog import FROGS
+from service_worker import render_service_worker
+from static_pages import (quiz_payload, render_app_info, render_frog, render_home,
+                          render_instructions, render_mystery)
+
+
+def page_renderers(events_url=None):
+    """{output path: render(manifest)} for every page of the site"""
+    # image_format=None: the browser picks AVIF / WebP / PNG via <picture>
+    pages = {
+        'index.html': lambda manifest: render_home(manifest, None),
+        'instructions/index.html': lambda manifest: render_instructions(manifest, None),
+        'app_info/index.html': lambda manifest: render_app_info(manifest, None),
+        'mystery/index.html': lambda manifest: render_mystery(
+            manifest, None, quiz_payload(manifest, events_url=events_url)),
+    }
+    for frog in FROGS:
+        pages[f'frog/{frog.ind_name}/index.html'] = partial(render_frog, frog=frog, image_format=None)
+    return pages
+
+
+def export_pages(manifest, events_url=None):
+    """{output path: html} for every page of the site"""
+    return {path: render(manifest) for path, render in page_renderers(events_url).items()}
+
+
+def page_url(export_path):
+    """URL a page is linked under: 'frog/X/index.html' -> '/frog/X'"""
+    path = export_path[:-len('index.html')].rstrip('/')
+    return '/' + quote(path)
+
+
+def copy_file(source, target):
+    """Hard link when possible (same disk, no extra space), copy otherwise"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+    try:
+        target.hardlink_to(source)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def export_site(out_dir, manifest, web_manifest_path=None):
+    """
+    Export the site to out_dir
+
+    Returns {page path: html bytes} for the export report.
+    """
+    out_dir = Path(out_dir)
+    print(f"\n{'='*60}")
+    print(f"STATIC EXPORT -> {out_dir.absolute()}")
+    print(f"{'='*60}")
+
+    # Hashed assets under the same URLs the live server uses
+    asset_bytes = 0
+    for logical, hashed in manifest.entries.items():
+        source = manifest.assets_dir / logical
+        url = manifest.url(logical)
+        copy_file(source, out_dir / url.lstrip('/'))
+        asset_bytes += source.stat().st_size
+    print(f"✓ {len(manifest.entries)} assets ({asset_bytes / 1024 / 1024:.2f} MB)")
+
+    if web_manifest_path is not None:
+        copy_file(Path(web_manifest_path), out_dir / 'manifest.json')
+
+    report = {}
+    pages = export_pages(manifest)
+    for page_path, html in pages.items():
+        target = out_dir / page_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        body = html.encode('utf-8')
+        target.write_bytes(body)
+        report[page_path] = len(body)
+
+    # Offline precache: pages are fetched from their directory URLs
+    sources = {page_url(path): page_url(path).rstrip('/') + '/' for path in pages}
+    (out_dir / 'sw.js').write_text(render_service_worker(manifest, sources, pages.values()),
+                                   encoding='utf-8')
+    print("✓ sw.js")
+
+    print(f"✓ {len(report)} pages")
+    for page_path, size in report.items():
+        print(f"  {page_path:<45} {size / 1024:>7.1f} KB")
+    return report
@@ -0,0 +1,346 @@
+"""
+Pre-rendered static pages
+The home, instructions and app info pages are the same for every visitor,
+so they are rendered once per process to plain HTML (no NiceGUI client,
+element tree or websocket per visitor) and served from an in-memory cache.
+Call PageCache.invalidate() when the frog catalog or the assets change.
+"""
+import hashlib
+import json
+from collections import Counter
+from html import escape
+from pathlib import Path
+from urllib.parse import quote
+
+from starlette.responses import Response
+
+from asset_manifest import IMAGE_MIME_TYPES
+from frog_catalog import FROGS
+
+PAGE_TITLE = 'Frog Quiz - Educational App'
+
+# Variant formats, best first; the last one is the <img> fallback
+IMAGE_FORMATS = ('avif', 'webp', 'png')
+
+# Home grid tiles are at most 250px wide (full width below the md breakpoint)
+HOME_TILE_SIZES = '(max-width: 767px) 90vw, 250px'
+
+# Invisible triple-tap exit (top-left corner) - the server only honours it locally
+TRIPLE_TAP_EXIT_SCRIPT = '''
+<script>
+(function() {
+    let taps = 0;
+    let lastTap = 0;
+    document.getElementById('exit-hotspot').addEventListener('click', function() {
+        const now = Date.now();
+        if (now - lastTap > 1000) taps = 0;
+        taps += 1;
+        lastTap = now;
+        if (taps >= 3) fetch('/exit', {method: 'POST'});
+    });
+})();
+</script>
+'''
+
+
+class PageCache:
+    """
+    Rendered page bodies keyed by (page, variant)
+
+    Each entry is rendered on first use and kept for the life of the
+    process together with its ETag, so repeat requests cost a dict lookup
+    (or a 304 when the browser already has the page). stats counts hits,
+    misses (renders) and, among the hits, 304s for /metrics.
+    """
+
+    def __init__(self):
+        self._pages = {}
+        self.stats = Counter()
+
+    def get(self, key, render):
+        """(body, etag) for key, rendering it on first use"""
+        entry = self._pages.get(key)
+        if entry is None:
+            self.stats['miss'] += 1
+            body = render().encode('utf-8')
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            entry = self._pages[key] = (body, etag)
+        else:
+            self.stats['hit'] += 1
+        return entry
+
+    def response(self, request, key, render, media_type='text/html; charset=utf-8'):
+        """Response for key (HTML by default), honouring If-None-Match"""
+        body, etag = self.get(key, render)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+        if request.headers.get('if-none-match') == etag:
+            self.stats['not_modified'] += 1
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type=media_type, headers=headers)
+
+    def invalidate(self):
+        """Drop every rendered page (call after the catalog or assets change)"""
+        self._pages.clear()
+
+    def __len__(self):
+        return len(self._pages)
+
+
+def image_html(manifest, name, sizes, image_format, alt='', css_class='', lazy=False):
+    """
+    <img> with srcset variants in the negotiated format
+
+    image_format=None lets the browser choose instead (a <picture> with
+    AVIF / WebP / PNG sources), for static exports where the server cannot
+    look at the Accept header.
+    """
+    if image_format is None:
+        stem = Path(manifest.normalize(name)).stem
+        sources = []
+        for source_format in IMAGE_FORMATS[:-1]:
+            if (stem, source_format) in manifest.variants:
+                _, srcset = manifest.srcset(name, source_format)
+                sources.append(f'<source type="{IMAGE_MIME_TYPES[source_format]}" '
+                               f'srcset="{escape(srcset)}" sizes="{escape(sizes)}">')
+        img = image_html(manifest, name, sizes, IMAGE_FORMATS[-1], alt, css_class, lazy)
+        return f'<picture>{"".join(sources)}{img}</picture>'
+
+    src, srcset = manifest.srcset(name, image_format)
+    attrs = [f'src="{escape(src)}"', f'alt="{escape(alt)}"']
+    if srcset:
+        attrs.append(f'srcset="{escape(srcset)}" sizes="{escape(sizes)}"')
+    if css_class:
+        attrs.append(f'class="{css_class}"')
+    if lazy:
+        attrs.append('loading="lazy"')
+    return f'<img {" ".join(attrs)}>'
+
+
+def shared_head_html(manifest):
+    """
+    The head bundle every page shares (fullscreen script, video styles)
+
+    Linked under hashed, immutable URLs instead of inlined, so browsers
+    fetch and parse it once. Also registered once for the NiceGUI pages.
+    """
+    return (f'<link rel="stylesheet" href="{manifest.url("css/app.css")}">\n'
+            f'<script src="{manifest.url("js/app.js")}" defer></script>')
+
+
+def player_scripts(manifest):
+    """The video loaders: stream.js (adaptive bitrate) and listen.js (listen mode)"""
+    return (f'<script src="{manifest.url("js/stream.js")}"></script>\n'
+            f'<script src="{manifest.url("js/listen.js")}"></script>')
+
+
+def page_shell(manifest, body_class, body, extra_head=''):
+    """Full HTML document shared by every pre-rendered page"""
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{PAGE_TITLE}</title>
+<meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1, user-scalable=no">
+<meta name="mobile-web-app-capable" content="yes">
+<meta name="apple-mobile-web-app-capable" content="yes">
+<meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
+<meta name="theme-color" content="#2E8B57">
+<link rel="manifest" href="/manifest.json">
+<link rel="apple-touch-icon" href="{manifest.url('UnknownFrog.png')}">
+{shared_head_html(manifest)}
+<link rel="stylesheet" href="{manifest.url('css/pages.css')}">{extra_head}
+</head>
+<body class="{body_class}">
+{body}
+</body>
+</html>
+'''
+
+
+def frog_url(frog) -> str:
+    return f'/frog/{quote(frog.ind_name)}'
+
+
+def render_home(manifest, image_format='png'):
+    """Frog selection grid"""
+    def tile(href, image_name, label, index):
+        # Only the first row is above the fold on most screens
+        image = image_html(manifest, image_name, HOME_TILE_SIZES, image_format,
+                           alt=label, lazy=index >= 5)
+        return f'''
+    <div class="tile">
+        <a class="tile-link" href="{href}">{image}</a>
+        <div class="tile-label">{escape(label)}</div>
+    </div>'''
+
+    tiles = [tile('/instructions', 'App_overview.png', 'How spectrograms show sound', 0)]
+    for index, frog in enumerate(FROGS, start=1):
+        tiles.append(tile(frog_url(frog), frog.photo, frog.label, index))
+    tiles.append(tile('/mystery', 'UnknownFrog.png', 'Mystery Frog', len(tiles)))
+
+    body = f'''
+<div class="home-title">Select a frog to see and hear its call</div>
+<div class="home-grid">{''.join(tiles)}
+</div>
+<div class="home-footer">
+    <a class="app-info-button" href="/app_info">App Info</a>
+</div>
+<button id="exit-hotspot" class="exit-hotspot" aria-hidden="true" tabindex="-1"></button>
+{TRIPLE_TAP_EXIT_SCRIPT}'''
+    return page_shell(manifest, 'home', body)
+
+
+def render_instructions(manifest, image_format='png'):
+    """How spectrograms show sound"""
+    example = image_html(manifest, 'example.png', '(max-width: 1024px) 100vw, 1024px',
+                         image_format, alt='Example spectrogram', css_class='example-image')
+    back = image_html(manifest, 'Arrow.png', '128px', image_format, alt='Back')
+    body = f'''
+<div class="info-page">
+    <h1 class="info-title">Spectrograms display the frequency and amplitude of sound</h1>
+    <div class="info-row">
+        <div class="info-text">
+            Sounds are vibrations and the number of vibrations per second
+            determines the <b>frequency</b> or pitch of a sound.<br>
+            <b>Low pitch:</b> drum roll, growl<br>
+            <b>High pitch:</b> whistle, jingling keys
+        </div>
+        <div class="info-text">
+            The size of sound waves determines <b>amplitude</b> — the larger the wave, the louder the sound.<br>
+            <b>Low amplitude:</b> whispering<br>
+            <b>High amplitude:</b> yelling
+        </div>
+    </div>
+    {example}
+    <div class="info-row">
+        <a class="back-link" href="/">{back}</a>
+        <div class="callout callout-green">
+            The call in the <b>green box</b> has a higher <b>frequency</b>.
+        </div>
+        <div class="callout callout-yellow">
+            The call in the <b>yellow box</b> is higher in <b>amplitude</b>.
+        </div>
+    </div>
+</div>'''
+    return page_shell(manifest, 'instructions', body)
+
+
+def render_app_info(manifest, image_format='png'):
+    """Credits"""
+    back = image_html(manifest, 'Arrow.png', '180px', image_format, alt='Back')
+    body = f'''
+<div class="credits-page">
+    <h1 class="credits-title">App Info</h1>
+    <div class="credits-text">
+        This app was created and designed by <b>Katie Howard</b> for the exhibition <i>'Litoria's Wetland World'</i>.<br><br>
+        Sound files were provided by the Arthur Rylah Institute for Environmental Research (DEECA) and compiled with help from Louise Durkin.<br>
+        Spectrograms were created using PASE (Python-Audio-Spectrogram-Explorer).<br><br>
+        All photos provided by Katie Howard except for those listed below, which are used with permission from:<br>
+        - Zak Atkins: Peron's Tree Frog<br>
+        - Geoff Heard : Pobblebonk Frog and Spotted Marsh Frog<br>
+    </div>
+    <a class="credits-back" href="/">{back}</a>
+</div>'''
+    return page_shell(manifest, 'app-info', body)
+
+
+def video_source(manifest, video):
+    """{'video': mp4 url, 'hls': ..., 'dash': ..., 'listen': ...} for FrogListen.load (listen.js)"""
+    source = {'video': manifest.url(video), **manifest.streams(video)}
+    listen = manifest.listen(video)
+    if listen:
+        source['listen'] = listen
+    return source
+
+
+def render_frog(manifest, frog, image_format='png'):
+    """One frog: spectrogram video (adaptive bitrate, or listen mode) with a client-side play / pause button"""
+    photo = image_html(manifest, frog.photo, '256px', image_format, alt=frog.label,
+                       css_class='frog-photo')
+    back = image_html(manifest, 'Arrow.png', '180px', image_format, alt='Back')
+    body = f'''
+<div class="frog-page">
+    <div class="frog-header">
+        <span class="frog-name">{escape(frog.ind_name)}</span>
+        <span class="frog-species">{escape(frog.species)}</span>
+    </div>
+    <video id="frog-video" class="frog-video"
+           preload="auto" muted playsinline disablepictureinpicture></video>
+    <div class="frog-controls">
+        <button id="play-button" class="icon-button" aria-label="Play">
+            <img id="play-icon" src="{manifest.url('PLAY.png')}" alt="">
+        </button>
+        {photo}
+        <a class="icon-button" href="/">{back}</a>
+    </div>
+</div>
+{player_scripts(manifest)}
+<script src="{manifest.url('js/player.js')}"></script>
+<script>
+FrogPlayer.bind(FrogListen.mount(document.getElementById('frog-video'), {json.dumps(video_source(manifest, frog.video))}),
+                document.getElementById('play-button'),
+                document.getElementById('play-icon'), {player_icons(manifest)});
+</script>'''
+    return page_shell(manifest, 'frog', body)
+
+
+def player_icons(manifest):
+    return json.dumps({'play': manifest.url('PLAY.png'), 'pause': manifest.url('PAUSE.png')})
+
+
+def quiz_payload(manifest, events_url=None):
+    """
+    Everything the client-side quiz needs, sent once with the page
+
+    events_url: where the browser posts batched score events
+    (None for the static export, which has no server to post to)
+    """
+    return {
+        'frogs': [{'id': frog.id, 'name': frog.name, 'label': frog.label,
+                   **video_source(manifest, frog.video)} for frog in FROGS],
+        'options': min(8, len(FROGS)),
+        'events': events_url,
+    }
+
+
+def render_mystery(manifest, image_format='png', payload=None):
+    """Mystery frog quiz - rounds, answer checking and highlighting run in the browser"""
+    payload = payload or quiz_payload(manifest)
+    back = image_html(manifest, 'Arrow.png', '160px', image_format, alt='Back')
+    # </ must not appear inside the inline JSON
+    data = json.dumps(payload, separators=(',', ':')).replace('</', '<\\/')
+    body = f'''
+<div class="quiz-page">
+    <h1 class="quiz-title">🐸 Mystery Frog Quiz</h1>
+    <video id="quiz-video" class="frog-video"
+           preload="auto" muted playsinline disablepictureinpicture></video>
+    <video id="quiz-video-next" class="frog-video standby"
+           preload="auto" muted playsinline disablepictureinpicture></video>
+    <div class="quiz-bottom">
+        <a class="icon-button quiz-icon" href="/">{back}</a>
+        <button id="play-button" class="icon-button quiz-icon" aria-label="Play">
+            <img id="play-icon" src="{manifest.url('PLAY.png')}" alt="">
+        </button>
+        <div class="quiz-panel">
+            <div class="quiz-question">Guess the Frog:</div>
+            <div id="quiz-options" class="quiz-options"></div>
+            <div id="quiz-result" class="quiz-result"></div>
+            <button id="quiz-try-again" class="quiz-try-again">🔄 Try Again?</button>
+        </div>
+    </div>
+</div>
+<script id="quiz-data" type="application/json">{data}</script>
+{player_scripts(manifest)}
+<script src="{manifest.url('js/player.js')}"></script>
+<script src="{manifest.url('js/rounds.js')}"></script>
+<script>window.QUIZ_ICONS = {player_icons(manifest)};</script>
+<script src="{manifest.url('js/quiz.js')}"></script>'''
+    return page_shell(manifest, 'mystery', body)
+
+
+# page name -> renderer
+STATIC_PAGES = {
+    'home': render_home,
+    'instructions': render_instructions,
+    'app_info': render_app_info,
+}
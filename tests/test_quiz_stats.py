@@ -0,0 +1,30 @@
+import json
+
+from quiz_stats import MAX_BATCH_BYTES, QuizStats
+
+
+def stats():
+    return QuizStats(['ggf', 'mgf'])
+
+
+def test_valid_answers_are_counted():
+    quiz = stats()
+    assert quiz.record([{'frog': 'ggf', 'picked': 'ggf'}, {'frog': 'ggf', 'picked': 'mgf'}]) == 2
+    assert quiz.snapshot()['answers'] == 2
+    assert quiz.snapshot()['correct'] == 1
+
+
+def test_malformed_events_are_skipped():
+    quiz = stats()
+    events = [{'frog': [], 'picked': 'ggf'}, {'frog': 'ggf', 'picked': {}}, {'frog': None, 'picked': None},
+              {'frog': 1, 'picked': 'ggf'}, 'ggf', [], {'frog': 'unknown', 'picked': 'ggf'}]
+    assert quiz.record(events) == 0
+    assert quiz.record_json(json.dumps(events).encode()) == 0
+    assert quiz.snapshot()['answers'] == 0
+
+
+def test_bad_batches_are_dropped():
+    quiz = stats()
+    assert quiz.record_json(b'not json') == 0
+    assert quiz.record_json(b'{"frog": "ggf", "picked": "ggf"}') == 0
+    assert quiz.record_json(b' ' * (MAX_BATCH_BYTES + 1)) == 0
@@ -1,16 +1,65 @@
-# Uvicorn configuration for Railway deployment
-# Forces HTTP/1.1 to avoid connection issues
+"""
+Server profiles for uvicorn (consumed by ui.run in main_web.py)
+    SERVER_PROFILE=fast python main_web.py
 
-config = {
-    'host': '0.0.0.0',
-    'port': None,  # Will be set from environment
-    'reload': False,
-    'log_level': 'info',
-    # Force HTTP/1.1
-    'http': 'h11',
-    # Disable HTTP/2
-    'interface': 'asgi3',
-    # Connection settings
-    'timeout_keep_alive': 5,
+- compat:   the old pinned settings - pure-Python h11 parser, idle
+            connections dropped after 5s (a visitor reading a frog page
+            opens fresh connections for the next page's images)
+- fast:     httptools parser (uvicorn[standard]), 75s keep-alive so a page's
+            image fan-out and the next click reuse connections, larger
+            accept backlog (default)
+- h2-front: for running behind an HTTP/2 front (the Fly / Railway edge,
+            or Caddy / nginx, see Caddyfile): browsers multiplex over one
+            HTTP/2 connection to the front, which keeps a pool of HTTP/1.1
+            connections to us. Keep-alive outlives the front's idle pool
+            timeout, so it never reuses a connection we just closed, and
+            X-Forwarded-* from FORWARDED_ALLOW_IPS is trusted.
+
+uvicorn itself speaks HTTP/1.1 only; NiceGUI pins the websocket
+implementation (wsproto). KEEP_ALIVE and BACKLOG override any profile;
+LISTEN_FD serves an already listening socket (coldstart.py).
+"""
+import importlib.util
+import os
+
+DEFAULT_PROFILE = 'fast'
+# httptools ships with uvicorn[standard]; fall back to h11 without it
+HTTP_PARSER = 'httptools' if importlib.util.find_spec('httptools') else 'h11'
+
+COMMON = {
     'timeout_graceful_shutdown': 10,
 }
+
+PROFILES = {
+    'compat': {
+        'http': 'h11',
+        'timeout_keep_alive': 5,
+    },
+    'fast': {
+        'http': HTTP_PARSER,
+        'timeout_keep_alive': 75,
+        'backlog': 2048,
+    },
+    'h2-front': {
+        'http': HTTP_PARSER,
+        'timeout_keep_alive': 650,   # above the front's idle pool timeout (Caddy 2m, Fly 60s, nginx 60s)
+        'backlog': 4096,
+        'proxy_headers': True,
+        'forwarded_allow_ips': os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1'),
+    },
+}
+
+
+def server_profile(name=None) -> dict:
+    """uvicorn keyword arguments for ui.run: profile name, else $SERVER_PROFILE"""
+    name = name or os.environ.get('SERVER_PROFILE', DEFAULT_PROFILE)
+    if name not in PROFILES:
+        raise ValueError(f"Unknown SERVER_PROFILE {name!r}, choose one of {', '.join(PROFILES)}")
+    options = {**COMMON, **PROFILES[name]}
+    if os.environ.get('KEEP_ALIVE'):
+        options['timeout_keep_alive'] = int(os.environ['KEEP_ALIVE'])
+    if os.environ.get('BACKLOG'):
+        options['backlog'] = int(os.environ['BACKLOG'])
+    if os.environ.get('LISTEN_FD'):
+        options['fd'] = int(os.environ['LISTEN_FD'])
+    return options
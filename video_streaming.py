@@ -0,0 +1,203 @@
+"""
+Video streaming with HTTP Range support
+Serves the *_resized.mp4 frog call videos with 206 Partial Content,
+multi-range (multipart/byteranges) and If-Range, so seeking and replaying
+a call only fetches the bytes the browser actually needs.
+Uses zero-copy sendfile when the ASGI server offers it.
+"""
+import os
+import re
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+
+CHUNK_SIZE = 64 * 1024
+MAX_RANGES = 16  # more ranges than this is treated as abuse and served whole
+
+_RANGE_SPEC = re.compile(r'^\s*(\d*)\s*-\s*(\d*)\s*$')
+
+
+def file_etag(stat_result) -> str:
+    """Strong validator built from size and modification time"""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def parse_range_header(header: str, size: int):
+    """
+    Parse a Range header into a list of (start, end) byte pairs (end inclusive)
+
+    Returns None when the header should be ignored (bad syntax, unknown unit,
+    too many ranges) and an empty list when no range is satisfiable.
+    Overlapping and adjacent ranges are coalesced.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or not spec:
+        return None
+
+    ranges = []
+    for part in spec.split(','):
+        match = _RANGE_SPEC.match(part)
+        if not match:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+            if start >= size:
+                continue
+            ranges.append((start, min(end, size - 1)))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+
+    ranges.sort()
+    merged = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(if_range: str, etag: str, last_modified: str) -> bool:
+    """Check an If-Range validator (strong ETag or exact HTTP date)"""
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        return if_range == etag
+    try:
+        return parsedate_to_datetime(if_range) == parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
+        return False
+
+
+class RangeFileResponse(Response):
+    """
+    Response streaming one or more byte ranges of a file
+
+    ranges=None sends the whole file with 200, a single range sends a
+    plain 206, several ranges send multipart/byteranges.
+    """
+
+    def __init__(self, path, size, ranges=None, headers=None,
+                 media_type='video/mp4', send_body=True):
+        self.path = Path(path)
+        self.size = size
+        self.ranges = ranges
+        self.send_body = send_body
+        self.boundary = uuid.uuid4().hex
+        super().__init__(content=None, status_code=200 if ranges is None else 206,
+                         headers=headers, media_type=media_type)
+
+        self.trailer = b''
+        if ranges is None:
+            self.parts = [(b'', 0, size)]
+            content_length = size
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.headers['content-range'] = f'bytes {start}-{end}/{size}'
+            self.parts = [(b'', start, end - start + 1)]
+            content_length = end - start + 1
+        else:
+            self.headers['content-type'] = f'multipart/byteranges; boundary={self.boundary}'
+            self.parts = []
+            for start, end in ranges:
+                part_header = (
+                    f'--{self.boundary}\r\n'
+                    f'Content-Type: {media_type}\r\n'
+                    f'Content-Range: bytes {start}-{end}/{size}\r\n\r\n'
+                ).encode('latin-1')
+                self.parts.append((part_header, start, end - start + 1))
+            self.trailer = f'\r\n--{self.boundary}--\r\n'.encode('latin-1')
+            content_length = (sum(len(h) + n for h, _, n in self.parts)
+                              + 2 * (len(self.parts) - 1) + len(self.trailer))
+        self.headers['content-length'] = str(content_length)
+
+    async def __call__(self, scope, receive, send):
+        await send({
+            'type': 'http.response.start',
+            'status': self.status_code,
+            'headers': self.raw_headers,
+        })
+        if not self.send_body:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+            return
+
+        zerocopy = 'http.response.zerocopysend' in scope.get('extensions', {})
+
+        with open(self.path, 'rb') as f:
+            for index, (part_header, offset, count) in enumerate(self.parts):
+                if part_header:
+                    separator = b'\r\n' if index else b''
+                    await send({'type': 'http.response.body',
+                                'body': separator + part_header, 'more_body': True})
+                if zerocopy:
+                    # Server copies straight from the file descriptor to the socket
+                    await send({'type': 'http.response.zerocopysend', 'file': f.fileno(),
+                                'offset': offset, 'count': count, 'more_body': True})
+                    continue
+                f.seek(offset)
+                remaining = count
+                while remaining > 0:
+                    chunk = await anyio.to_thread.run_sync(f.read, min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': self.trailer, 'more_body': False})
+
+
+def video_response(request: Request, videos_dir: Path, filename: str,
+                   cache_control: str = 'public, max-age=3600') -> Response:
+    """Build the response for one video request, honouring Range / If-Range / If-None-Match"""
+    path = (videos_dir / filename).resolve()
+    # Only plain files directly inside the videos folder can be streamed
+    if path.parent != videos_dir.resolve() or path.suffix.lower() != '.mp4' or not path.is_file():
+        return Response('Video not found', status_code=404, media_type='text/plain')
+
+    stat_result = os.stat(path)
+    size = stat_result.st_size
+    etag = file_etag(stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    headers = {
+        'accept-ranges': 'bytes',
+        'etag': etag,
+        'last-modified': last_modified,
+        'cache-control': cache_control,
+    }
+
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+        return Response(status_code=304, headers=headers)
+
+    send_body = request.method != 'HEAD'
+    range_header = request.headers.get('range')
+    if not range_header:
+        return RangeFileResponse(path, size, headers=headers, send_body=send_body)
+
+    # A stale If-Range means the client's partial copy is outdated: send everything
+    if_range = request.headers.get('if-range')
+    if if_range and not if_range_matches(if_range, etag, last_modified):
+        return RangeFileResponse(path, size, headers=headers, send_body=send_body)
+
+    ranges = parse_range_header(range_header, size)
+    if ranges is None:
+        return RangeFileResponse(path, size, headers=headers, send_body=send_body)
+    if not ranges:
+        headers['content-range'] = f'bytes */{size}'
+        return Response(status_code=416, headers=headers)
+    return RangeFileResponse(path, size, ranges=ranges, headers=headers, send_body=send_body)